@@ -0,0 +1,80 @@
+""" Measure the throughput of drawables implemented in Python, drawn to a
+    render texture, against the same geometry drawn by a built-in drawable.
+    Run it against two builds to compare them.
+
+    Usage: python drawables.py [count] [frames]
+"""
+
+from __future__ import print_function
+
+import sys
+import time
+
+from sfml import sf
+
+COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+FRAMES = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+clock = getattr(time, "perf_counter", time.time)
+
+
+class Empty(sf.Drawable):
+    """ Does nothing: measures the cost of the callback alone. """
+
+    def draw(self, target, states):
+        pass
+
+
+class Forwarding(sf.Drawable):
+    """ Draws a shared vertex array with its own transform, as a typical
+    scene node does. """
+
+    def __init__(self, vertices, x, y):
+        sf.Drawable.__init__(self)
+        self.vertices = vertices
+        self.transform = sf.Transform()
+        self.transform.translate((x, y))
+
+    def draw(self, target, states):
+        states.transform.combine(self.transform)
+        target.draw(self.vertices, states)
+
+
+def measure(target, drawables):
+    best = float("inf")
+
+    for _ in range(FRAMES):
+        start = clock()
+
+        for drawable in drawables:
+            target.draw(drawable)
+
+        target.display()
+        best = min(best, clock() - start)
+
+    return best
+
+
+def main():
+    target = sf.RenderTexture(256, 256)
+
+    vertices = sf.VertexArray(sf.PrimitiveType.TRIANGLES, 3)
+    vertices[1].position = (4, 0)
+    vertices[2].position = (0, 4)
+
+    cases = [
+        ("VertexArray", [vertices] * COUNT),
+        ("Empty", [Empty() for _ in range(COUNT)]),
+        ("Forwarding", [Forwarding(vertices, i % 256, i // 256) for i in range(COUNT)]),
+    ]
+
+    print("{0} drawables, best of {1} frames".format(COUNT, FRAMES))
+    print("{0:<14}{1:>12}{2:>16}".format("drawable", "ms/frame", "draws/second"))
+
+    for name, drawables in cases:
+        seconds = measure(target, drawables)
+        print("{0:<14}{1:>12.2f}{2:>16.0f}".format(name, seconds * 1000, COUNT / seconds))
+
+
+if __name__ == "__main__":
+    main()
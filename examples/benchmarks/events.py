@@ -0,0 +1,64 @@
+""" Compare the cost of handling events as Event objects, as returned by
+    Window.poll_event() and Window.events, with reading the records of an
+    EventBatch, as returned by Window.poll_events().
+
+    The events are synthetic mouse moves appended to a batch, since the
+    window queue can't be filled on demand.
+
+    Usage: python events.py [count]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from sfml import sf
+
+COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+batch = sf.EventBatch(COUNT)
+
+for i in range(COUNT):
+    batch.append(sf.Event.MOUSE_MOVED, x=i % 800, y=i % 600)
+
+
+def objects():
+    # one Event (and its data mapping) per event, like the legacy API
+    total = 0
+
+    for event in batch:
+        if event == sf.Event.MOUSE_MOVED:
+            total += event['x'] + event['y']
+
+    return total
+
+
+def records():
+    total = 0
+    mouse_moved = sf.Event.MOUSE_MOVED
+
+    for i in range(len(batch)):
+        if batch.type(i) == mouse_moved:
+            total += batch.x(i) + batch.y(i)
+
+    return total
+
+
+def last_only():
+    # most games only care about where the mouse ended up
+    i = batch.find_last(sf.Event.MOUSE_MOVED)
+    return batch.x(i) + batch.y(i) if i >= 0 else 0
+
+
+def main():
+    print("{0} events".format(COUNT))
+    print("{0:<12}{1:>16}".format("method", "events/second"))
+
+    for function in (objects, records, last_only):
+        seconds = min(timeit.repeat(function, number=1, repeat=5))
+        print("{0:<12}{1:>16.0f}".format(function.__name__, COUNT / seconds))
+
+
+if __name__ == "__main__":
+    main()
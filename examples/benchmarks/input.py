@@ -0,0 +1,49 @@
+""" Compare polling the keyboard, the mouse and the joysticks with a query
+    per key, button and axis against a single InputState.update() call.
+
+    Usage: python input.py [iterations]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from sfml import sf
+
+ITERATIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+state = sf.InputState()
+
+
+def queries():
+    sf.Joystick.update()
+    keys = [sf.Keyboard.is_key_pressed(key) for key in range(sf.Keyboard.KEY_COUNT)]
+    buttons = [sf.Mouse.is_button_pressed(button) for button in range(sf.InputState.BUTTON_COUNT)]
+    position = sf.Mouse.get_position()
+
+    for joystick in range(sf.Joystick.COUNT):
+        if sf.Joystick.is_connected(joystick):
+            for button in range(sf.Joystick.get_button_count(joystick)):
+                sf.Joystick.is_button_pressed(joystick, button)
+            for axis in range(sf.Joystick.AXIS_COUNT):
+                sf.Joystick.get_axis_position(joystick, axis)
+
+    return keys, buttons, position
+
+
+def snapshot():
+    state.update()
+    return state.pressed_keys()
+
+
+def main():
+    print("{0:<12}{1:>16}".format("method", "us/poll"))
+
+    for function in (queries, snapshot):
+        seconds = min(timeit.repeat(function, number=ITERATIONS, repeat=3))
+        print("{0:<12}{1:>16.2f}".format(function.__name__, seconds / ITERATIONS * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+""" Compare the frame pacing of a loop limited by framerate_limit with one
+    run by a FrameScheduler, under a simulated load that varies from frame
+    to frame; prints the frame time percentiles of each.
+
+    Usage: python pacing.py [frames] [rate]
+"""
+
+from __future__ import print_function
+
+import random
+import sys
+import time
+
+from sfml import sf
+
+FRAMES = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+RATE = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+
+
+def load():
+    # between 2 and 8 ms of work
+    end = time.time() + random.uniform(0.002, 0.008)
+    while time.time() < end:
+        pass
+
+
+def limited(window):
+    window.framerate_limit = RATE
+    clock = sf.Clock()
+    times = []
+
+    for _ in range(FRAMES):
+        for event in window.events:
+            pass
+        load()
+        window.clear()
+        window.display()
+        times.append(clock.restart().microseconds)
+
+    window.framerate_limit = 0
+    times.sort()
+    return [times[int(q / 100.0 * (len(times) - 1))] for q in (50, 90, 99)] + [times[-1]]
+
+
+def scheduled(window):
+    scheduler = sf.FrameScheduler(update_rate=RATE, frame_rate=RATE, history=FRAMES)
+
+    def update(dt):
+        for event in window.events:
+            pass
+        load()
+
+    for _ in range(FRAMES):
+        scheduler.frame(update, lambda alpha: window.clear(), window.display)
+
+    return [scheduler.percentile('frame', q) for q in (50, 90, 99)] + [scheduler.percentile('frame', 100)]
+
+
+def main():
+    window = sf.RenderWindow(sf.VideoMode(320, 240), "Frame pacing")
+    print("target {0:.3f} ms".format(1000.0 / RATE))
+    print("{0:<12}{1:>10}{2:>10}{3:>10}{4:>10}".format("loop", "p50", "p90", "p99", "max"))
+
+    for function in (limited, scheduled):
+        values = function(window)
+        print("{0:<12}".format(function.__name__) + "".join("{0:>10.3f}".format(v / 1000.0) for v in values))
+
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+""" Record the events of a window session to a log, then replay it without
+    a window, as fast as possible, to time the event handling of a run
+    that is identical every time.
+
+    Usage: python replay.py record|replay [log] [speed]
+"""
+
+from __future__ import print_function
+
+import sys
+import time
+
+from sfml import sf
+
+MODE = sys.argv[1] if len(sys.argv) > 1 else "replay"
+LOG = sys.argv[2] if len(sys.argv) > 2 else "session.events"
+SPEED = float(sys.argv[3]) if len(sys.argv) > 3 else 0.0
+
+
+def handle(events, state):
+    # stands for the event handling of a game
+    for event in events:
+        if event == sf.Event.MOUSE_MOVED:
+            state["position"] = (event['x'], event['y'])
+        elif event == sf.Event.KEY_PRESSED:
+            state["keys"] += 1
+        elif event == sf.Event.CLOSED:
+            state["closed"] = True
+
+
+def record():
+    window = sf.RenderWindow(sf.VideoMode(640, 480), "Recording, close to stop")
+    window.vertical_synchronization = True
+    state = {"position": None, "keys": 0, "closed": False}
+
+    with sf.EventRecorder(LOG) as recorder:
+        window.recorder = recorder
+
+        while not state["closed"]:
+            handle(window.events, state)
+            window.clear()
+            window.display()
+
+        print("{0} events over {1} polls".format(recorder.count, recorder.polls))
+
+    window.close()
+
+
+def replay():
+    source = sf.EventReplay(LOG, speed=SPEED)
+    state = {"position": None, "keys": 0, "closed": False}
+    polls = 0
+
+    start = time.time()
+
+    while not source.finished:
+        handle(source.events, state)
+        polls += 1
+
+    seconds = time.time() - start
+
+    print("{0} events, {1} polls, recorded over {2:.2f}s".format(
+        source.count, polls, source.duration.seconds))
+    print("replayed in {0:.4f}s, last position {1}, {2} keys".format(
+        seconds, state["position"], state["keys"]))
+
+
+if __name__ == "__main__":
+    if MODE == "record":
+        record()
+    else:
+        replay()
@@ -0,0 +1,105 @@
+""" Compare the generic Vector2 with the unboxed Vector2f/Vector2i and plain
+    tuples: time per operation and memory blocks held by each result.
+
+    Usage: python vectors.py [iterations]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from sfml import sf
+
+ITERATIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+CASES = [
+    ("construct", {
+        "Vector2":  "sf.Vector2(1.5, 2.5)",
+        "Vector2f": "sf.Vector2f(1.5, 2.5)",
+        "Vector2i": "sf.Vector2i(1, 2)",
+        "tuple":    "(x, y)"}),
+    ("read x + y", {
+        "Vector2":  "v2.x + v2.y",
+        "Vector2f": "v2f.x + v2f.y",
+        "Vector2i": "v2i.x + v2i.y",
+        "tuple":    "t[0] + t[1]"}),
+    ("add", {
+        "Vector2":  "v2 + v2",
+        "Vector2f": "v2f + v2f",
+        "Vector2i": "v2i + v2i",
+        "tuple":    "(t[0] + t[0], t[1] + t[1])"}),
+    ("scale", {
+        "Vector2":  "v2 * 3.0",
+        "Vector2f": "v2f * 3.0",
+        "Vector2i": "v2i * 3",
+        "tuple":    "(t[0] * 3.0, t[1] * 3.0)"}),
+    ("in-place add", {
+        "Vector2":  "v2 += step2",
+        "Vector2f": "v2f += step2f",
+        "Vector2i": "v2i += step2i",
+        "tuple":    "t = (t[0] + 1, t[1] + 1)"}),
+    ("set position", {
+        "Vector2":  "transformable.position = v2",
+        "Vector2f": "transformable.position = v2f",
+        "Vector2i": "transformable.position = v2i",
+        "tuple":    "transformable.position = t"}),
+    ("time arithmetic", {
+        "Vector2":  "elapsed + elapsed",
+        "Vector2f": "elapsed + elapsed",
+        "Vector2i": "elapsed + elapsed",
+        "tuple":    "elapsed + elapsed"}),
+]
+
+SETUP = """
+from sfml import sf
+x, y = 1.5, 2.5
+t = (x, y)
+v2, step2 = sf.Vector2(x, y), sf.Vector2(1, 1)
+v2f, step2f = sf.Vector2f(x, y), sf.Vector2f(1, 1)
+v2i, step2i = sf.Vector2i(1, 2), sf.Vector2i(1, 1)
+transformable = sf.Transformable()
+elapsed = sf.milliseconds(16)
+"""
+
+KINDS = ["Vector2", "Vector2f", "Vector2i", "tuple"]
+
+
+def blocks_per_result(statement):
+    """ Memory blocks held by each value produced by an expression, or
+    nan for statements and where sys.getallocatedblocks() is missing. """
+    if not hasattr(sys, "getallocatedblocks"):
+        return float("nan")
+
+    try:
+        code = compile(statement, "<benchmark>", "eval")
+    except SyntaxError:
+        return float("nan")
+
+    namespace = {}
+    exec(SETUP, namespace)
+
+    before = sys.getallocatedblocks()
+    results = [eval(code, namespace) for _ in range(1000)]
+    blocks = sys.getallocatedblocks() - before
+
+    # the list object itself; its item array is too large for pymalloc
+    # and isn't counted
+    return (blocks - 1) / float(len(results))
+
+
+def main():
+    print("{0:<16}{1:<10}{2:>12}{3:>16}".format("operation", "type", "ns/op", "blocks/result"))
+
+    for name, statements in CASES:
+        for kind in KINDS:
+            statement = statements[kind]
+            seconds = min(timeit.repeat(statement, SETUP, number=ITERATIONS, repeat=3))
+            print("{0:<16}{1:<10}{2:>12.1f}{3:>16.2f}".format(
+                name, kind, seconds / ITERATIONS * 1e9, blocks_per_result(statement)))
+
+        print()
+
+
+if __name__ == "__main__":
+    main()
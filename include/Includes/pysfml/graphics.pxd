@@ -27,6 +27,7 @@ cdef extern from "pysfml/graphics/graphics.h":
 
     cdef class sfml.graphics.Drawable [object PyDrawableObject]:
         cdef sf.Drawable *p_drawable
+        cdef int (*p_render)(object, sf.RenderTarget*, sf.RenderStates*) except -1
 
     cdef class sfml.graphics.TransformableDrawable(Drawable) [object PyTransformableDrawableObject]:
         cdef sf.Transformable *p_transformable
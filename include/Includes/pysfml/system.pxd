@@ -21,6 +21,19 @@ cdef extern from "pysfml/system/system.h":
     cdef class sfml.system.Vector3 [object PyVector3Object]:
         cdef sf.Vector3[NumericObject] *p_this
 
+    cdef class sfml.system.Vector2f [object PyVector2fObject]:
+        cdef public double x
+        cdef public double y
+
+    cdef class sfml.system.Vector2i [object PyVector2iObject]:
+        cdef public int x
+        cdef public int y
+
+    cdef class sfml.system.Vector3f [object PyVector3fObject]:
+        cdef public double x
+        cdef public double y
+        cdef public double z
+
     cdef class sfml.system.Time [object PyTimeObject]:
         cdef sf.Time *p_this
 
@@ -68,7 +68,7 @@ cdef extern from "SFML/System.hpp" namespace "sf":
 
     cdef cppclass Vector2[T]:
         Vector2()
-        Vector2(T, T)
+        Vector2(T, T) nogil
         Vector2(const Vector2[T]&)
         T x
         T y
@@ -292,7 +292,7 @@ cimport blendmode, primitivetype, texture, shader, font, text, renderstates, tra
 cdef extern from "SFML/Graphics.hpp" namespace "sf":
     cdef cppclass Rect[T]:
         Rect()
-        Rect(T, T, T, T)
+        Rect(T, T, T, T) nogil
         Rect(const Vector2[T]&, const Vector2[T]&)
         Rect(const Rect[T]&)
         bint contains(T, T) const
@@ -313,7 +313,7 @@ cdef extern from "SFML/Graphics.hpp" namespace "sf":
     cdef cppclass Color:
         Color()
         Color(Uint8 r, Uint8 g, Uint8 b)
-        Color(Uint8 r, Uint8 g, Uint8, Uint8 a)
+        Color(Uint8 r, Uint8 g, Uint8, Uint8 a) nogil
         Uint8 r
         Uint8 g
         Uint8 b
@@ -327,12 +327,12 @@ cdef extern from "SFML/Graphics.hpp" namespace "sf":
 
     cdef cppclass Transform:
         Transform()
-        Transform(float, float, float, float, float, float, float, float, float)
-        const float* getMatrix() const
+        Transform(float, float, float, float, float, float, float, float, float) nogil
+        const float* getMatrix() nogil const
         Transform getInverse() const
         Vector2f transformPoint(float, float) const
         Vector2f transformPoint(const Vector2f) const
-        FloatRect transformRect(const FloatRect&) const
+        FloatRect transformRect(const FloatRect&) nogil const
         Transform& combine(const Transform&)
         Transform& translate(float, float)
         Transform& translate(const Vector2f)
@@ -343,7 +343,7 @@ cdef extern from "SFML/Graphics.hpp" namespace "sf":
         Transform& scale(float, float, float, float)
         Transform& scale(const Vector2f&)
         Transform& scale(const Vector2f&, const Vector2f&)
-        Transform operator*(const Transform&)
+        Transform operator*(const Transform&) nogil
         #Transform operator*=(const Transform&)
 
     cdef cppclass BlendMode:
@@ -370,10 +370,10 @@ cdef extern from "SFML/Graphics.hpp" namespace "sf":
         void create(unsigned int, unsigned int)
         void create(unsigned int, unsigned int, const Uint8*)
         void create(unsigned int, unsigned int, const Color)
-        bint loadFromFile(const string&)
-        bint loadFromMemory(const void*, size_t)
+        bint loadFromFile(const string&) nogil
+        bint loadFromMemory(const void*, size_t) nogil
         bint loadFromStream(InputStream&)
-        bint saveToFile(const string&) const
+        bint saveToFile(const string&) nogil const
         Vector2u getSize() const
         void createMaskFromColor(const Color&)
         void createMaskFromColor(const Color&, Uint8)
@@ -421,8 +421,8 @@ cdef extern from "SFML/Graphics.hpp" namespace "sf":
     cdef cppclass Font:
         Font()
         Font(const Font&)
-        bint loadFromFile(const string&)
-        bint loadFromMemory(const void*, size_t)
+        bint loadFromFile(const string&) nogil
+        bint loadFromMemory(const void*, size_t) nogil
         bint loadFromStream(InputStream&)
         Glyph& getGlyph(Uint32, unsigned int, bint) const
         int getKerning(Uint32, Uint32, unsigned int) const
@@ -681,11 +681,11 @@ cdef extern from "SFML/Audio.hpp" namespace "sf":
     cdef cppclass SoundBuffer:
         SoundBuffer()
         SoundBuffer(const SoundBuffer&)
-        bint loadFromFile(const string&)
-        bint loadFromMemory(const void*, size_t)
+        bint loadFromFile(const string&) nogil
+        bint loadFromMemory(const void*, size_t) nogil
         bint loadFromStream(InputStream&)
         bint loadFromSamples(const Int16*, size_t, unsigned int, unsigned int)
-        bint saveToFile(const string&) const
+        bint saveToFile(const string&) nogil const
         const Int16* getSamples() const
         size_t getSampleCount() const
         unsigned int getSampleRate() const
@@ -727,7 +727,7 @@ cdef extern from "SFML/Audio.hpp" namespace "sf":
     cdef cppclass SoundStream:
         void play()
         void pause()
-        void stop()
+        void stop() nogil
         unsigned int getChannelCount() const
         unsigned int getSampleRate() const
         soundsource.Status getStatus() const
@@ -738,8 +738,8 @@ cdef extern from "SFML/Audio.hpp" namespace "sf":
 
     cdef cppclass Music:
         Music()
-        bint openFromFile(const string&)
-        bint openFromMemory(const void*, size_t)
+        bint openFromFile(const string&) nogil
+        bint openFromMemory(const void*, size_t) nogil
         bint openFromStream(InputStream&)
         Time getDuration() const
 
@@ -801,6 +801,7 @@ cdef extern from "SFML/Network.hpp" namespace "sf":
         socket.Status connect(const IpAddress&, unsigned short, Time) nogil
         void disconnect()
         socket.Status send(const void*, size_t) nogil
+        socket.Status send(const void*, size_t, size_t&) nogil
         socket.Status send(Packet&) nogil
         socket.Status receive(const void*, size_t, size_t&) nogil
         socket.Status receive(Packet&) nogil
@@ -810,9 +811,9 @@ cdef extern from "SFML/Network.hpp" namespace "sf":
         unsigned short getLocalPort() const
         socket.Status bind(unsigned short)
         void unbind()
-        socket.Status send(const void*, size_t, const IpAddress&, unsigned short)
+        socket.Status send(const void*, size_t, const IpAddress&, unsigned short) nogil
         socket.Status send(Packet&, const IpAddress&, unsigned short)
-        socket.Status receive(void*, size_t, size_t&, IpAddress&, unsigned short&)
+        socket.Status receive(void*, size_t, size_t&, IpAddress&, unsigned short&) nogil
         socket.Status receive(Packet&, size_t&, IpAddress&, unsigned short&)
 
     cdef cppclass SocketSelector:
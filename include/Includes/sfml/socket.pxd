@@ -8,6 +8,7 @@ cdef extern from "SFML/Network.hpp" namespace "sf::Socket":
     cdef enum Status:
         Done
         NotReady
+        Partial
         Disconnected
         Error
 
@@ -3,6 +3,7 @@ import os.path, shutil
 from glob import glob
 from subprocess import call
 from setuptools import setup, Command, Extension
+from setuptools.command.build_py import build_py
 
 try:
     from Cython.Distutils import build_ext
@@ -15,6 +16,19 @@ if platform.architecture()[0] == "32bit":
 elif platform.architecture()[0] == "64bit":
 	arch = "x64"
 
+class BuildPy(build_py):
+    """ Leave out the modules written for a newer Python than the one
+        installing the package, i.e. aio (async/await) on Python 2.
+    """
+
+    def find_package_modules(self, package, package_dir):
+        modules = build_py.find_package_modules(self, package, package_dir)
+
+        if sys.version_info < (3, 5):
+            modules = [module for module in modules if module[1] != 'aio']
+
+        return modules
+
 class CythonBuildExt(build_ext):
     """ Updated version of cython build_ext command to deal with the
         generated API headers. C/C++ header files are all moved to the
@@ -92,6 +106,10 @@ else:
 	audio_libs    = ['sfml-system', 'sfml-audio']
 	network_libs  = ['sfml-system', 'sfml-network']
 
+	# the frame grabber calls OpenGL directly
+	if platform.system() == 'Linux':
+		graphics_libs.append('GL')
+
 
 system = extension(
     'system',
@@ -105,9 +123,12 @@ window = extension(
 
 graphics = extension(
     'graphics',
-    ['graphics.pyx', 'DerivableRenderWindow.cpp', 'DerivableDrawable.cpp', 'NumericObject.cpp'],
+    ['graphics.pyx', 'DerivableRenderWindow.cpp', 'DerivableDrawable.cpp', 'NumericObject.cpp', 'VertexBuffer.cpp', 'SpriteBatch.cpp', 'SpatialIndex.cpp', 'TextBatch.cpp', 'Uniform.cpp', 'FrameGrabber.cpp'],
     graphics_libs)
 
+if platform.system() == 'Darwin':
+    graphics.extra_link_args = ['-framework', 'OpenGL']
+
 audio = extension(
     'audio',
     ['audio.pyx', 'DerivableSoundRecorder.cpp', 'DerivableSoundStream.cpp'],
@@ -135,6 +156,9 @@ install_requires = []
 if sys.version_info < (3, 4):
     install_requires.append('enum34')
 
+if sys.version_info < (3, 2):
+    install_requires.append('futures')
+
 kwargs = dict(
             name='pySFML',
             ext_modules=ext_modules,
@@ -162,6 +186,6 @@ kwargs = dict(
                         'Topic :: Software Development :: Libraries :: Python Modules'],
             keywords='sfml SFML simple fast multimedia system window graphics audio network pySFML PySFML python-sfml',
             install_requires=install_requires,
-            cmdclass={'build_ext': CythonBuildExt})
+            cmdclass={'build_ext': CythonBuildExt, 'build_py': BuildPy})
 
 setup(**kwargs)
@@ -0,0 +1,345 @@
+# PySFML - Python bindings for SFML
+# Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+#
+# This file is part of PySFML project and is available under the zlib
+# license.
+
+""" asyncio integration (Python 3.5+): window events, sockets and audio
+    streams driven by a single event loop instead of helper threads.
+
+    - Window events are polled by the loop: :func:`wait_event` and
+      :func:`events` yield to other tasks while the queue is empty.
+    - Sockets are switched to non-blocking mode and registered with the
+      loop's selector through their :meth:`fileno`, instead of waiting
+      in a SocketSelector or a blocking call. This requires a loop with
+      add_reader() and add_writer(): on Windows, where the default loop
+      is a ProactorEventLoop since Python 3.8, set a SelectorEventLoop.
+    - Audio callbacks run on SFML's threads; :class:`AsyncSoundStream`
+      and :class:`AsyncSoundRecorder` hand samples over to coroutines,
+      blocking those threads only without the GIL.
+
+    Example::
+
+        import asyncio
+        from sfml import sf
+        from sfml import aio
+
+        async def serve(listener):
+            while True:
+                client = await listener.accept()
+                loop.create_task(talk(client))
+
+        async def talk(client):
+            while True:
+                data = await client.receive(1024)
+                await client.send(data)
+
+        async def render(window):
+            async for event in aio.events(window):
+                if event == sf.Event.CLOSED:
+                    window.close()
+
+        listener = aio.AsyncTcpListener(sf.TcpListener())
+        listener.listen(5000)
+
+        loop = asyncio.get_event_loop()
+        loop.create_task(serve(listener))
+        loop.run_until_complete(render(window))
+
+    The module uses async/await and is only available on Python 3.5+;
+    it isn't installed on older versions, where it couldn't be compiled.
+"""
+
+import asyncio
+import queue
+from collections import deque
+
+from sfml.network import TcpSocket, SocketNotReady, SocketError
+from sfml.audio import SoundStream, SoundRecorder
+
+__all__ = ['wait_event', 'events', 'AsyncTcpSocket', 'AsyncTcpListener',
+           'AsyncUdpSocket', 'AsyncSoundStream', 'AsyncSoundRecorder']
+
+
+async def wait_event(window, interval=0.002):
+    """ Wait for the next event of a window (or of any object with a
+    poll_event() method, such as an EventReplay), polling it every
+    `interval` seconds while letting the loop run other tasks. """
+    while True:
+        event = window.poll_event()
+
+        if event is not None:
+            return event
+
+        await asyncio.sleep(interval)
+
+
+class events(object):
+    """ Iterate asynchronously over the events of a window, as long as it
+    is open; a window-less source, such as an EventReplay, is iterated
+    until it is finished. """
+
+    def __init__(self, window, interval=0.002):
+        self._window = window
+        self._interval = interval
+
+    def __aiter__(self):
+        return self
+
+    def _running(self):
+        if hasattr(self._window, 'is_open'):
+            return self._window.is_open
+
+        return not getattr(self._window, 'finished', False)
+
+    async def __anext__(self):
+        while self._running():
+            event = self._window.poll_event()
+
+            if event is not None:
+                return event
+
+            await asyncio.sleep(self._interval)
+
+        raise StopAsyncIteration
+
+
+class _AsyncSocket(object):
+    def __init__(self, socket, loop=None):
+        self._loop = loop or asyncio.get_event_loop()
+
+        proactor = getattr(asyncio, 'ProactorEventLoop', None)
+
+        if proactor is not None and isinstance(self._loop, proactor):
+            raise RuntimeError("Sockets need a loop with add_reader() and add_writer(), "
+                               "use an asyncio.SelectorEventLoop instead of a ProactorEventLoop")
+
+        self.socket = socket
+        self.socket.blocking = False
+
+    def __repr__(self):
+        return "{0}({1!r})".format(type(self).__name__, self.socket)
+
+    def fileno(self):
+        return self.socket.fileno()
+
+    async def _wait(self, add, remove):
+        future = self._loop.create_future()
+        handle = self.socket.fileno()
+
+        add(handle, lambda: future.done() or future.set_result(None))
+
+        try:
+            await future
+        finally:
+            remove(handle)
+
+    def _readable(self):
+        return self._wait(self._loop.add_reader, self._loop.remove_reader)
+
+    def _writable(self):
+        return self._wait(self._loop.add_writer, self._loop.remove_writer)
+
+
+class AsyncTcpSocket(_AsyncSocket):
+    """ A TcpSocket whose connect(), send() and receive() are coroutines
+    waiting on the loop's selector. """
+
+    def __init__(self, socket=None, loop=None):
+        _AsyncSocket.__init__(self, socket or TcpSocket(), loop)
+
+    async def connect(self, remote_address, remote_port):
+        try:
+            self.socket.connect(remote_address, remote_port)
+        except SocketNotReady:
+            await self._writable()
+
+            # the port of the peer is only known once connected
+            if self.socket.remote_port == 0:
+                raise SocketError()
+
+    async def send(self, data):
+        view = memoryview(data).cast('B')
+
+        while view:
+            try:
+                view = view[self.socket.send_partial(view):]
+            except SocketNotReady:
+                pass
+
+            if view:
+                await self._writable()
+
+    async def receive(self, size):
+        while True:
+            try:
+                return self.socket.receive(size)
+            except SocketNotReady:
+                await self._readable()
+
+    async def receive_into(self, buffer, size=0):
+        while True:
+            try:
+                return self.socket.receive_into(buffer, size)
+            except SocketNotReady:
+                await self._readable()
+
+    def disconnect(self):
+        self.socket.disconnect()
+
+
+class AsyncTcpListener(_AsyncSocket):
+    """ A TcpListener whose accept() is a coroutine returning an
+    AsyncTcpSocket. """
+
+    def listen(self, port):
+        self.socket.listen(port)
+        self.socket.blocking = False
+
+    async def accept(self):
+        while True:
+            try:
+                return AsyncTcpSocket(self.socket.accept(), self._loop)
+            except SocketNotReady:
+                await self._readable()
+
+    def close(self):
+        self.socket.close()
+
+
+class AsyncUdpSocket(_AsyncSocket):
+    """ A UdpSocket whose send() and receive() are coroutines. """
+
+    def bind(self, port):
+        self.socket.bind(port)
+
+    async def send(self, data, remote_address, remote_port):
+        while True:
+            try:
+                return self.socket.send(data, remote_address, remote_port)
+            except SocketNotReady:
+                await self._writable()
+
+    async def receive(self, size):
+        """ Return (data, remote_address, remote_port). """
+        while True:
+            try:
+                return self.socket.receive(size)
+            except SocketNotReady:
+                await self._readable()
+
+    async def receive_from_into(self, buffer, size=0):
+        """ Return (received, remote_address, remote_port). """
+        while True:
+            try:
+                return self.socket.receive_from_into(buffer, size)
+            except SocketNotReady:
+                await self._readable()
+
+    def unbind(self):
+        self.socket.unbind()
+
+
+class AsyncSoundStream(SoundStream):
+    """ A sound stream fed from coroutines with write().
+
+    The streaming thread waits for samples in on_get_data() without
+    holding the GIL, and write() waits while `buffered` chunks are
+    already queued, so producers follow the pace of playback. close()
+    ends the stream once the queued samples are played. """
+
+    def __init__(self, channel_count, sample_rate, buffered=4, loop=None):
+        SoundStream.__init__(self)
+        self.initialize(channel_count, sample_rate)
+        self._loop = loop or asyncio.get_event_loop()
+        self._chunks = queue.Queue()
+        self._buffered = max(buffered, 1)
+        self._waiters = deque()
+
+    async def write(self, data):
+        """ Queue 16-bit samples, given as bytes, for playback. """
+        while self._chunks.qsize() >= self._buffered:
+            await self.wait_request()
+
+        self._chunks.put(bytes(data))
+
+    async def wait_request(self):
+        """ Wait until the streaming thread takes a chunk. """
+        future = self._loop.create_future()
+        self._waiters.append(future)
+        await future
+
+    def close(self):
+        self._chunks.put(None)
+
+    def stop(self):
+        # unblock the streaming thread so it can be joined
+        self._chunks.put(None)
+        SoundStream.stop(self)
+        self._chunks = queue.Queue()
+
+    def _wake(self):
+        while self._waiters:
+            future = self._waiters.popleft()
+
+            if not future.done():
+                future.set_result(None)
+
+    def on_get_data(self, chunk):
+        data = self._chunks.get()
+        self._loop.call_soon_threadsafe(self._wake)
+
+        if data is None:
+            return False
+
+        chunk.data = data
+        return True
+
+
+class AsyncSoundRecorder(SoundRecorder):
+    """ A sound recorder whose samples are read by coroutines, with read()
+    or by iterating asynchronously, as bytes of 16-bit samples; reading
+    ends once the recorder is stopped. """
+
+    def __init__(self, loop=None):
+        SoundRecorder.__init__(self)
+        self._loop = loop or asyncio.get_event_loop()
+        self._chunks = deque()
+        self._waiters = deque()
+
+    def _push(self, data):
+        self._chunks.append(data)
+
+        while self._waiters:
+            future = self._waiters.popleft()
+
+            if not future.done():
+                future.set_result(None)
+
+    def on_process_samples(self, chunk):
+        # the chunk refers to SFML's buffer, copy its samples out
+        self._loop.call_soon_threadsafe(self._push, chunk.data)
+        return True
+
+    def on_stop(self):
+        self._loop.call_soon_threadsafe(self._push, None)
+
+    async def read(self):
+        """ Return the next samples, or None once the recorder stopped. """
+        while not self._chunks:
+            future = self._loop.create_future()
+            self._waiters.append(future)
+            await future
+
+        return self._chunks.popleft()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        data = await self.read()
+
+        if data is None:
+            raise StopAsyncIteration
+
+        return data
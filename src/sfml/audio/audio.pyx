@@ -156,8 +156,13 @@ cdef class SoundBuffer:
     @classmethod
     def from_file(cls, basestring filename):
         cdef sf.SoundBuffer *p = new sf.SoundBuffer()
+        cdef string encoded_filename = filename.encode('UTF-8')
+        cdef bint loaded
 
-        if p.loadFromFile(filename.encode('UTF-8')):
+        with nogil:
+            loaded = p.loadFromFile(encoded_filename)
+
+        if loaded:
             return wrap_soundbuffer(p)
 
         del p
@@ -166,8 +171,14 @@ cdef class SoundBuffer:
     @classmethod
     def from_memory(cls, bytes data):
         cdef sf.SoundBuffer *p = new sf.SoundBuffer()
+        cdef const char *buffer = data
+        cdef size_t size = len(data)
+        cdef bint loaded
+
+        with nogil:
+            loaded = p.loadFromMemory(buffer, size)
 
-        if p.loadFromMemory(<char*>data, len(data)):
+        if loaded:
             return wrap_soundbuffer(p)
 
         del p
@@ -353,7 +364,8 @@ cdef class SoundStream(SoundSource):
         self.p_soundstream.pause()
 
     def stop(self):
-        self.p_soundstream.stop()
+        # the streaming thread may need the GIL to finish its callback
+        with nogil: self.p_soundstream.stop()
 
     property channel_count:
         def __get__(self):
@@ -395,6 +407,7 @@ cdef class SoundStream(SoundSource):
 
 cdef class Music(SoundStream):
     cdef sf.Music *p_this
+    cdef bytes     m_data
 
     def __init__(self, *args, **kwargs):
         raise UserWarning("Use specific constructor")
@@ -411,8 +424,13 @@ cdef class Music(SoundStream):
     @classmethod
     def from_file(cls, basestring filename):
         cdef sf.Music *p = new sf.Music()
+        cdef string encoded_filename = filename.encode('UTF-8')
+        cdef bint loaded
+
+        with nogil:
+            loaded = p.openFromFile(encoded_filename)
 
-        if p.openFromFile(filename.encode('UTF-8')):
+        if loaded:
             return wrap_music(p)
 
         del p
@@ -421,9 +439,19 @@ cdef class Music(SoundStream):
     @classmethod
     def from_memory(cls, bytes data):
         cdef sf.Music *p = new sf.Music()
-
-        if p.openFromMemory(<char*>data, len(data)):
-            return wrap_music(p)
+        cdef const char *buffer = data
+        cdef size_t size = len(data)
+        cdef bint loaded
+        cdef Music music
+
+        with nogil:
+            loaded = p.openFromMemory(buffer, size)
+
+        if loaded:
+            # the music is streamed from the buffer while playing
+            music = wrap_music(p)
+            music.m_data = data
+            return music
 
         del p
         raise IOError(popLastErrorMessage())
@@ -23,19 +23,10 @@ m_object(object)
     import_sfml__graphics();
 };
 
-void DerivableDrawable::draw(sf::RenderTarget& target_, sf::RenderStates states_) const
+void DerivableDrawable::draw(sf::RenderTarget& target, sf::RenderStates states) const
 {
-    static char format[] = "(O, O)";
-    static char methodName[] = "draw";
-
-    PyObject* target = (PyObject*)(wrap_rendertarget(&target_));
-    PyObject* states = (PyObject*)(wrap_renderstates(&states_, false));
-
-    PyObject* success = PyObject_CallMethod(m_object, methodName, format, target, states);
-
-    if(!success)
+    // dispatched to the Python draw() method, or to the C function set by
+    // a Cython subclass
+    if (call_drawable(m_object, &target, &states) < 0)
         PyErr_Print();
-
-    Py_DECREF(target);
-    Py_DECREF(states);
 }
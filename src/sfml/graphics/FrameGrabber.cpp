@@ -0,0 +1,262 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#include <cstring>
+#include <SFML/OpenGL.hpp>
+#include <SFML/Window/Context.hpp>
+#include <pysfml/graphics/FrameGrabber.hpp>
+
+#if SFML_VERSION_MAJOR > 2 || (SFML_VERSION_MAJOR == 2 && SFML_VERSION_MINOR >= 4)
+#define PYSFML_GET_FUNCTION
+#endif
+
+#ifndef GL_PIXEL_PACK_BUFFER
+#define GL_PIXEL_PACK_BUFFER 0x88EB
+#endif
+
+#ifndef GL_STREAM_READ
+#define GL_STREAM_READ 0x88E1
+#endif
+
+#ifndef GL_READ_ONLY
+#define GL_READ_ONLY 0x88B8
+#endif
+
+#ifndef APIENTRY
+#define APIENTRY
+#endif
+
+namespace
+{
+    typedef void (APIENTRY *GenBuffersFunction)(GLsizei, GLuint*);
+    typedef void (APIENTRY *DeleteBuffersFunction)(GLsizei, const GLuint*);
+    typedef void (APIENTRY *BindBufferFunction)(GLenum, GLuint);
+    typedef void (APIENTRY *BufferDataFunction)(GLenum, std::ptrdiff_t, const void*, GLenum);
+    typedef void* (APIENTRY *MapBufferFunction)(GLenum, GLenum);
+    typedef GLboolean (APIENTRY *UnmapBufferFunction)(GLenum);
+
+    GenBuffersFunction    genBuffers    = 0;
+    DeleteBuffersFunction deleteBuffers = 0;
+    BindBufferFunction    bindBuffer    = 0;
+    BufferDataFunction    bufferData    = 0;
+    MapBufferFunction     mapBuffer     = 0;
+    UnmapBufferFunction   unmapBuffer   = 0;
+
+    bool loadBufferFunctions()
+    {
+#ifdef PYSFML_GET_FUNCTION
+        static bool loaded = false;
+
+        if (!loaded)
+        {
+            genBuffers    = reinterpret_cast<GenBuffersFunction>(sf::Context::getFunction("glGenBuffers"));
+            deleteBuffers = reinterpret_cast<DeleteBuffersFunction>(sf::Context::getFunction("glDeleteBuffers"));
+            bindBuffer    = reinterpret_cast<BindBufferFunction>(sf::Context::getFunction("glBindBuffer"));
+            bufferData    = reinterpret_cast<BufferDataFunction>(sf::Context::getFunction("glBufferData"));
+            mapBuffer     = reinterpret_cast<MapBufferFunction>(sf::Context::getFunction("glMapBuffer"));
+            unmapBuffer   = reinterpret_cast<UnmapBufferFunction>(sf::Context::getFunction("glUnmapBuffer"));
+            loaded = true;
+        }
+
+        return genBuffers && deleteBuffers && bindBuffer && bufferData && mapBuffer && unmapBuffer;
+#else
+        return false;
+#endif
+    }
+
+    // flip vertically, as OpenGL stores the bottom row first, and shrink
+    // by averaging the boxes of source pixels covering each destination
+    // pixel (plain nearest pixel when enlarging)
+    void copyPixels(const sf::Uint8* src, unsigned int width, unsigned int height,
+                    sf::Uint8* dst, unsigned int dstWidth, unsigned int dstHeight)
+    {
+        std::size_t pitch = static_cast<std::size_t>(width) * 4;
+
+        if (dstWidth == width && dstHeight == height)
+        {
+            for (unsigned int y = 0; y < height; ++y)
+                std::memcpy(dst + y * pitch, src + (height - 1 - y) * pitch, pitch);
+
+            return;
+        }
+
+        for (unsigned int y = 0; y < dstHeight; ++y)
+        {
+            unsigned int top = static_cast<unsigned int>(static_cast<sf::Uint64>(y) * height / dstHeight);
+            unsigned int bottom = static_cast<unsigned int>(static_cast<sf::Uint64>(y + 1) * height / dstHeight);
+
+            if (bottom <= top)
+                bottom = top + 1;
+
+            for (unsigned int x = 0; x < dstWidth; ++x)
+            {
+                unsigned int left = static_cast<unsigned int>(static_cast<sf::Uint64>(x) * width / dstWidth);
+                unsigned int right = static_cast<unsigned int>(static_cast<sf::Uint64>(x + 1) * width / dstWidth);
+
+                if (right <= left)
+                    right = left + 1;
+
+                sf::Uint32 sum[4] = {0, 0, 0, 0};
+
+                for (unsigned int row = top; row < bottom; ++row)
+                {
+                    const sf::Uint8* pixel = src + (height - 1 - row) * pitch + left * 4;
+
+                    for (unsigned int column = left; column < right; ++column, pixel += 4)
+                    {
+                        sum[0] += pixel[0];
+                        sum[1] += pixel[1];
+                        sum[2] += pixel[2];
+                        sum[3] += pixel[3];
+                    }
+                }
+
+                sf::Uint32 count = (bottom - top) * (right - left);
+
+                for (unsigned int i = 0; i < 4; ++i)
+                    *dst++ = static_cast<sf::Uint8>((sum[i] + count / 2) / count);
+            }
+        }
+    }
+}
+
+NativeFrameGrabber::NativeFrameGrabber(unsigned int slotCount) :
+m_slots(slotCount > 0 ? slotCount : 1),
+m_next(0),
+m_pending(0)
+{
+    for (std::size_t i = 0; i < m_slots.size(); ++i)
+    {
+        m_slots[i].buffer = 0;
+        m_slots[i].capacity = 0;
+        m_slots[i].width = 0;
+        m_slots[i].height = 0;
+        m_slots[i].pending = false;
+    }
+}
+
+NativeFrameGrabber::~NativeFrameGrabber()
+{
+#ifdef PYSFML_GET_FUNCTION
+    if (deleteBuffers)
+    {
+        TransientContextLock lock;
+
+        for (std::size_t i = 0; i < m_slots.size(); ++i)
+        {
+            if (m_slots[i].buffer)
+                deleteBuffers(1, &m_slots[i].buffer);
+        }
+    }
+#endif
+}
+
+bool NativeFrameGrabber::isAsynchronous() const
+{
+    return loadBufferFunctions();
+}
+
+int NativeFrameGrabber::request(unsigned int width, unsigned int height)
+{
+    Slot& slot = m_slots[m_next];
+
+    if (slot.pending)
+        return -1;
+
+    std::size_t size = static_cast<std::size_t>(width) * height * 4;
+
+    if (size > 0)
+    {
+        if (isAsynchronous())
+        {
+            if (!slot.buffer)
+                genBuffers(1, &slot.buffer);
+
+            bindBuffer(GL_PIXEL_PACK_BUFFER, slot.buffer);
+
+            if (slot.capacity != size)
+            {
+                bufferData(GL_PIXEL_PACK_BUFFER, size, 0, GL_STREAM_READ);
+                slot.capacity = size;
+            }
+
+            // with a pack buffer bound, the pointer is an offset into it
+            glReadPixels(0, 0, width, height, GL_RGBA, GL_UNSIGNED_BYTE, 0);
+            bindBuffer(GL_PIXEL_PACK_BUFFER, 0);
+        }
+        else
+        {
+            slot.pixels.resize(size);
+            glReadPixels(0, 0, width, height, GL_RGBA, GL_UNSIGNED_BYTE, &slot.pixels[0]);
+        }
+    }
+
+    slot.width = width;
+    slot.height = height;
+    slot.pending = true;
+    m_pending++;
+
+    int index = m_next;
+    m_next = (m_next + 1) % m_slots.size();
+    return index;
+}
+
+void NativeFrameGrabber::resolve(int index, sf::Uint8* dst, unsigned int dstWidth, unsigned int dstHeight)
+{
+    Slot& slot = m_slots[index];
+
+    if (!slot.pending)
+        return;
+
+    if (slot.width > 0 && slot.height > 0 && dstWidth > 0 && dstHeight > 0)
+    {
+        if (slot.buffer && isAsynchronous())
+        {
+            // waits only if the GPU hasn't finished writing the pixels yet
+            bindBuffer(GL_PIXEL_PACK_BUFFER, slot.buffer);
+            const sf::Uint8* src = static_cast<const sf::Uint8*>(mapBuffer(GL_PIXEL_PACK_BUFFER, GL_READ_ONLY));
+
+            if (src)
+            {
+                copyPixels(src, slot.width, slot.height, dst, dstWidth, dstHeight);
+                unmapBuffer(GL_PIXEL_PACK_BUFFER);
+            }
+            else
+            {
+                std::memset(dst, 0, static_cast<std::size_t>(dstWidth) * dstHeight * 4);
+            }
+
+            bindBuffer(GL_PIXEL_PACK_BUFFER, 0);
+        }
+        else
+        {
+            copyPixels(&slot.pixels[0], slot.width, slot.height, dst, dstWidth, dstHeight);
+        }
+    }
+
+    discard(index);
+}
+
+void NativeFrameGrabber::discard(int index)
+{
+    if (m_slots[index].pending)
+    {
+        m_slots[index].pending = false;
+        m_pending--;
+    }
+}
+
+unsigned int NativeFrameGrabber::getSlotCount() const
+{
+    return static_cast<unsigned int>(m_slots.size());
+}
+
+unsigned int NativeFrameGrabber::getPendingCount() const
+{
+    return m_pending;
+}
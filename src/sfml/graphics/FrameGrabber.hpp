@@ -0,0 +1,63 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#ifndef PYSFML_GRAPHICS_FRAMEGRABBER_HPP
+#define PYSFML_GRAPHICS_FRAMEGRABBER_HPP
+
+#include <cstddef>
+#include <vector>
+#include <SFML/Config.hpp>
+#include <SFML/Window/GlResource.hpp>
+
+// Reads back the framebuffer of the active context through a ring of
+// pixel pack buffers, so glReadPixels() returns immediately and the
+// pixels are fetched a few frames later once the GPU is done. Pixel
+// buffers are loaded through sf::Context::getFunction(), available from
+// SFML 2.4 on; otherwise (or if the driver lacks them) the pixels are
+// read synchronously into the slot's memory.
+class NativeFrameGrabber : sf::GlResource
+{
+public:
+    NativeFrameGrabber(unsigned int slotCount);
+    ~NativeFrameGrabber();
+
+    // the methods below require the context of the target to be active
+    bool isAsynchronous() const;
+
+    // start reading the bottom-left width x height pixels into a free
+    // slot; return the slot index, or -1 if every slot is in flight
+    int request(unsigned int width, unsigned int height);
+
+    // copy the pixels of a slot into dst (top row first), averaging
+    // boxes of source pixels when dstWidth x dstHeight is smaller, and
+    // free the slot
+    void resolve(int slot, sf::Uint8* dst, unsigned int dstWidth, unsigned int dstHeight);
+
+    // free a slot without reading its pixels
+    void discard(int slot);
+
+    unsigned int getSlotCount() const;
+    unsigned int getPendingCount() const;
+
+private:
+    struct Slot
+    {
+        unsigned int            buffer;
+        std::size_t             capacity;
+        unsigned int            width;
+        unsigned int            height;
+        bool                    pending;
+        std::vector<sf::Uint8>  pixels;
+    };
+
+    std::vector<Slot> m_slots;
+    unsigned int      m_next;
+    unsigned int      m_pending;
+};
+
+#endif // PYSFML_GRAPHICS_FRAMEGRABBER_HPP
@@ -0,0 +1,274 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#include <algorithm>
+#include <cmath>
+#include <pysfml/graphics/SpatialIndex.hpp>
+
+NativeSpatialIndex::NativeSpatialIndex(float cellSize) :
+m_cellSize(cellSize),
+m_minX(CellLimit),
+m_minY(CellLimit),
+m_maxX(-CellLimit),
+m_maxY(-CellLimit),
+m_stamp(0)
+{
+}
+
+void NativeSpatialIndex::insert(sf::Int64 id, const sf::FloatRect& bounds)
+{
+    Entry entry;
+    entry.bounds = bounds;
+    entry.left = toCell(std::min(bounds.left, bounds.left + bounds.width));
+    entry.top = toCell(std::min(bounds.top, bounds.top + bounds.height));
+    entry.right = toCell(std::max(bounds.left, bounds.left + bounds.width));
+    entry.bottom = toCell(std::max(bounds.top, bounds.top + bounds.height));
+    entry.large = (static_cast<sf::Int64>(entry.right) - entry.left + 1) *
+                  (static_cast<sf::Int64>(entry.bottom) - entry.top + 1) > LargeCells;
+    entry.stamp = m_stamp;
+
+    EntryMap::iterator it = m_entries.find(id);
+
+    if (it != m_entries.end())
+    {
+        // moving within the same cells is the common case, and it
+        // doesn't require to touch the grid at all
+        Entry& current = it->second;
+
+        if (current.left == entry.left && current.top == entry.top &&
+            current.right == entry.right && current.bottom == entry.bottom)
+        {
+            current.bounds = bounds;
+            return;
+        }
+
+        unlink(id, current);
+        current = entry;
+    }
+    else
+    {
+        m_entries.insert(std::make_pair(id, entry));
+    }
+
+    link(id, entry);
+}
+
+bool NativeSpatialIndex::remove(sf::Int64 id)
+{
+    EntryMap::iterator it = m_entries.find(id);
+
+    if (it == m_entries.end())
+        return false;
+
+    unlink(id, it->second);
+    m_entries.erase(it);
+
+    return true;
+}
+
+void NativeSpatialIndex::clear()
+{
+    m_entries.clear();
+    m_cells.clear();
+    m_large.clear();
+
+    m_minX = m_minY = CellLimit;
+    m_maxX = m_maxY = -CellLimit;
+}
+
+std::size_t NativeSpatialIndex::getSize() const
+{
+    return m_entries.size();
+}
+
+bool NativeSpatialIndex::contains(sf::Int64 id) const
+{
+    return m_entries.find(id) != m_entries.end();
+}
+
+bool NativeSpatialIndex::getBounds(sf::Int64 id, sf::FloatRect& bounds) const
+{
+    EntryMap::const_iterator it = m_entries.find(id);
+
+    if (it == m_entries.end())
+        return false;
+
+    bounds = it->second.bounds;
+
+    return true;
+}
+
+float NativeSpatialIndex::getCellSize() const
+{
+    return m_cellSize;
+}
+
+void NativeSpatialIndex::queryRect(const sf::FloatRect& area, std::vector<sf::Int64>& result)
+{
+    // only the part of the grid that was ever occupied is walked
+    int left = std::max(toCell(std::min(area.left, area.left + area.width)), m_minX);
+    int top = std::max(toCell(std::min(area.top, area.top + area.height)), m_minY);
+    int right = std::min(toCell(std::max(area.left, area.left + area.width)), m_maxX);
+    int bottom = std::min(toCell(std::max(area.top, area.top + area.height)), m_maxY);
+
+    // the stamp prevents reporting twice an id spanning several cells
+    ++m_stamp;
+
+    if (left <= right && top <= bottom)
+    {
+        sf::Int64 range = (static_cast<sf::Int64>(right) - left + 1) *
+                          (static_cast<sf::Int64>(bottom) - top + 1);
+
+        if (range > static_cast<sf::Int64>(m_cells.size()))
+        {
+            // fewer cells are in use than covered, walk those instead
+            for (CellMap::const_iterator cell = m_cells.begin(); cell != m_cells.end(); ++cell)
+            {
+                int x = static_cast<int>(cell->first >> 32);
+                int y = static_cast<int>(static_cast<sf::Uint32>(cell->first));
+
+                if (x >= left && x <= right && y >= top && y <= bottom)
+                    visit(cell->second, area, result);
+            }
+        }
+        else
+        {
+            for (int x = left; x <= right; ++x)
+            {
+                for (int y = top; y <= bottom; ++y)
+                {
+                    CellMap::const_iterator cell = m_cells.find(cellKey(x, y));
+
+                    if (cell != m_cells.end())
+                        visit(cell->second, area, result);
+                }
+            }
+        }
+    }
+
+    for (std::size_t i = 0; i < m_large.size(); ++i)
+    {
+        if (m_entries.find(m_large[i])->second.bounds.intersects(area))
+            result.push_back(m_large[i]);
+    }
+}
+
+void NativeSpatialIndex::queryPoint(float x, float y, std::vector<sf::Int64>& result)
+{
+    CellMap::const_iterator cell = m_cells.find(cellKey(toCell(x), toCell(y)));
+
+    if (cell != m_cells.end())
+    {
+        const std::vector<sf::Int64>& ids = cell->second;
+
+        for (std::size_t i = 0; i < ids.size(); ++i)
+        {
+            if (m_entries.find(ids[i])->second.bounds.contains(x, y))
+                result.push_back(ids[i]);
+        }
+    }
+
+    for (std::size_t i = 0; i < m_large.size(); ++i)
+    {
+        if (m_entries.find(m_large[i])->second.bounds.contains(x, y))
+            result.push_back(m_large[i]);
+    }
+}
+
+int NativeSpatialIndex::toCell(float coordinate) const
+{
+    // clamped so that far away coordinates don't overflow an int; they
+    // share the border cells, which only makes those less selective
+    double cell = std::floor(static_cast<double>(coordinate) / m_cellSize);
+
+    if (!(cell > -CellLimit))
+        return -CellLimit;
+
+    if (cell > CellLimit)
+        return CellLimit;
+
+    return static_cast<int>(cell);
+}
+
+sf::Int64 NativeSpatialIndex::cellKey(int x, int y)
+{
+    return (static_cast<sf::Int64>(x) << 32) | static_cast<sf::Uint32>(y);
+}
+
+void NativeSpatialIndex::link(sf::Int64 id, const Entry& entry)
+{
+    if (entry.large)
+    {
+        m_large.push_back(id);
+        return;
+    }
+
+    for (int x = entry.left; x <= entry.right; ++x)
+        for (int y = entry.top; y <= entry.bottom; ++y)
+            m_cells[cellKey(x, y)].push_back(id);
+
+    m_minX = std::min(m_minX, entry.left);
+    m_minY = std::min(m_minY, entry.top);
+    m_maxX = std::max(m_maxX, entry.right);
+    m_maxY = std::max(m_maxY, entry.bottom);
+}
+
+void NativeSpatialIndex::unlink(sf::Int64 id, const Entry& entry)
+{
+    if (entry.large)
+    {
+        std::vector<sf::Int64>::iterator it = std::find(m_large.begin(), m_large.end(), id);
+
+        if (it != m_large.end())
+        {
+            *it = m_large.back();
+            m_large.pop_back();
+        }
+
+        return;
+    }
+
+    for (int x = entry.left; x <= entry.right; ++x)
+    {
+        for (int y = entry.top; y <= entry.bottom; ++y)
+        {
+            CellMap::iterator cell = m_cells.find(cellKey(x, y));
+
+            if (cell == m_cells.end())
+                continue;
+
+            std::vector<sf::Int64>& ids = cell->second;
+            std::vector<sf::Int64>::iterator it = std::find(ids.begin(), ids.end(), id);
+
+            if (it != ids.end())
+            {
+                *it = ids.back();
+                ids.pop_back();
+            }
+
+            if (ids.empty())
+                m_cells.erase(cell);
+        }
+    }
+}
+
+void NativeSpatialIndex::visit(const std::vector<sf::Int64>& ids, const sf::FloatRect& area, std::vector<sf::Int64>& result)
+{
+    for (std::size_t i = 0; i < ids.size(); ++i)
+    {
+        Entry& entry = m_entries.find(ids[i])->second;
+
+        if (entry.stamp == m_stamp)
+            continue;
+
+        entry.stamp = m_stamp;
+
+        if (entry.bounds.intersects(area))
+            result.push_back(ids[i]);
+    }
+}
@@ -0,0 +1,80 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#ifndef PYSFML_GRAPHICS_SPATIALINDEX_HPP
+#define PYSFML_GRAPHICS_SPATIALINDEX_HPP
+
+#include <cstddef>
+#include <map>
+#include <vector>
+#include <SFML/Config.hpp>
+#include <SFML/Graphics/Rect.hpp>
+
+// Uniform hash grid mapping integer ids to their bounding rectangles.
+// Each id is registered in every cell its bounds overlap; queries only
+// visit the cells overlapping the queried area. Ids overlapping more
+// than LargeCells cells are kept aside in a list every query scans, so
+// huge bounds cost neither memory nor time in the grid. The cell size
+// must be positive and the rectangles finite.
+class NativeSpatialIndex
+{
+public:
+    explicit NativeSpatialIndex(float cellSize);
+
+    void insert(sf::Int64 id, const sf::FloatRect& bounds);
+    bool remove(sf::Int64 id);
+    void clear();
+
+    std::size_t getSize() const;
+    bool contains(sf::Int64 id) const;
+    bool getBounds(sf::Int64 id, sf::FloatRect& bounds) const;
+    float getCellSize() const;
+
+    void queryRect(const sf::FloatRect& area, std::vector<sf::Int64>& result);
+    void queryPoint(float x, float y, std::vector<sf::Int64>& result);
+
+private:
+    struct Entry
+    {
+        sf::FloatRect bounds;
+        int           left;
+        int           top;
+        int           right;
+        int           bottom;
+        bool          large;
+        unsigned int  stamp;
+    };
+
+    typedef std::map<sf::Int64, Entry> EntryMap;
+    typedef std::map<sf::Int64, std::vector<sf::Int64> > CellMap;
+
+    enum
+    {
+        CellLimit  = 1 << 30,
+        LargeCells = 256
+    };
+
+    int toCell(float coordinate) const;
+    static sf::Int64 cellKey(int x, int y);
+
+    void link(sf::Int64 id, const Entry& entry);
+    void unlink(sf::Int64 id, const Entry& entry);
+    void visit(const std::vector<sf::Int64>& ids, const sf::FloatRect& area, std::vector<sf::Int64>& result);
+
+    float                  m_cellSize;
+    EntryMap               m_entries;
+    CellMap                m_cells;
+    std::vector<sf::Int64> m_large;
+    int                    m_minX;
+    int                    m_minY;
+    int                    m_maxX;
+    int                    m_maxY;
+    unsigned int           m_stamp;
+};
+
+#endif // PYSFML_GRAPHICS_SPATIALINDEX_HPP
@@ -0,0 +1,138 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#include <cmath>
+#include <pysfml/graphics/SpriteBatch.hpp>
+
+NativeSpriteBatch::NativeSpriteBatch() :
+m_lastBatch(0),
+m_spriteCount(0)
+{
+}
+
+void NativeSpriteBatch::clear()
+{
+    // keep the batches and their storage around, the same textures are
+    // very likely to be used again for the next frame
+    for (std::size_t i = 0; i < m_batches.size(); ++i)
+        m_batches[i].vertices.clear();
+
+    m_spriteCount = 0;
+}
+
+void NativeSpriteBatch::add(const sf::Texture* texture, const sf::BlendMode& blendMode,
+                            const sf::FloatRect& textureRect, const sf::Vector2f& position,
+                            float rotation, const sf::Vector2f& scale,
+                            const sf::Vector2f& origin, const sf::Color& color)
+{
+    std::vector<sf::Vertex>& vertices = findBatch(texture, blendMode).vertices;
+
+    // same matrix as sf::Transformable::getTransform()
+    float angle  = -rotation * 3.141592654f / 180.f;
+    float cosine = static_cast<float>(std::cos(angle));
+    float sine   = static_cast<float>(std::sin(angle));
+    float sxc    = scale.x * cosine;
+    float syc    = scale.y * cosine;
+    float sxs    = scale.x * sine;
+    float sys    = scale.y * sine;
+    float tx     = -origin.x * sxc - origin.y * sys + position.x;
+    float ty     =  origin.x * sxs - origin.y * syc + position.y;
+
+    float width  = std::fabs(textureRect.width);
+    float height = std::fabs(textureRect.height);
+
+    float left   = textureRect.left;
+    float right  = left + textureRect.width;
+    float top    = textureRect.top;
+    float bottom = top + textureRect.height;
+
+    vertices.push_back(sf::Vertex(sf::Vector2f(tx, ty), color, sf::Vector2f(left, top)));
+    vertices.push_back(sf::Vertex(sf::Vector2f(sxc * width + tx, -sxs * width + ty), color, sf::Vector2f(right, top)));
+    vertices.push_back(sf::Vertex(sf::Vector2f(sxc * width + sys * height + tx, -sxs * width + syc * height + ty), color, sf::Vector2f(right, bottom)));
+    vertices.push_back(sf::Vertex(sf::Vector2f(sys * height + tx, syc * height + ty), color, sf::Vector2f(left, bottom)));
+
+    ++m_spriteCount;
+}
+
+std::size_t NativeSpriteBatch::getSpriteCount() const
+{
+    return m_spriteCount;
+}
+
+std::size_t NativeSpriteBatch::getBatchCount() const
+{
+    std::size_t count = 0;
+
+    for (std::size_t i = 0; i < m_batches.size(); ++i)
+        if (!m_batches[i].vertices.empty())
+            ++count;
+
+    return count;
+}
+
+void NativeSpriteBatch::draw(sf::RenderTarget& target, sf::RenderStates states) const
+{
+    for (std::size_t i = 0; i < m_batches.size(); ++i)
+    {
+        const Batch& batch = m_batches[i];
+
+        if (batch.vertices.empty())
+            continue;
+
+        states.texture = batch.texture;
+        states.blendMode = batch.blendMode;
+
+        target.draw(&batch.vertices[0], batch.vertices.size(), sf::Quads, states);
+    }
+}
+
+NativeSpriteBatch::Batch& NativeSpriteBatch::findBatch(const sf::Texture* texture, const sf::BlendMode& blendMode)
+{
+    // sprites usually come in runs sharing the same texture
+    if (m_lastBatch < m_batches.size())
+    {
+        Batch& last = m_batches[m_lastBatch];
+
+        if (last.texture == texture && last.blendMode == blendMode)
+            return last;
+    }
+
+    for (std::size_t i = 0; i < m_batches.size(); ++i)
+    {
+        Batch& batch = m_batches[i];
+
+        if (!batch.vertices.empty() && batch.texture == texture && batch.blendMode == blendMode)
+        {
+            m_lastBatch = i;
+            return batch;
+        }
+    }
+
+    // batches emptied by clear() are recycled before allocating new ones
+    for (std::size_t i = 0; i < m_batches.size(); ++i)
+    {
+        Batch& batch = m_batches[i];
+
+        if (batch.vertices.empty())
+        {
+            batch.texture = texture;
+            batch.blendMode = blendMode;
+            m_lastBatch = i;
+
+            return batch;
+        }
+    }
+
+    Batch batch;
+    batch.texture = texture;
+    batch.blendMode = blendMode;
+    m_batches.push_back(batch);
+    m_lastBatch = m_batches.size() - 1;
+
+    return m_batches.back();
+}
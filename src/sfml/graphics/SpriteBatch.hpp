@@ -0,0 +1,57 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#ifndef PYSFML_GRAPHICS_SPRITEBATCH_HPP
+#define PYSFML_GRAPHICS_SPRITEBATCH_HPP
+
+#include <cstddef>
+#include <vector>
+#include <SFML/Graphics/BlendMode.hpp>
+#include <SFML/Graphics/Color.hpp>
+#include <SFML/Graphics/Drawable.hpp>
+#include <SFML/Graphics/Rect.hpp>
+#include <SFML/Graphics/RenderStates.hpp>
+#include <SFML/Graphics/RenderTarget.hpp>
+#include <SFML/Graphics/Texture.hpp>
+#include <SFML/Graphics/Vertex.hpp>
+
+// Collects textured quads and draws all the quads sharing the same
+// texture and blend mode with a single draw call.
+class NativeSpriteBatch : public sf::Drawable
+{
+public:
+    NativeSpriteBatch();
+
+    void clear();
+
+    void add(const sf::Texture* texture, const sf::BlendMode& blendMode,
+             const sf::FloatRect& textureRect, const sf::Vector2f& position,
+             float rotation, const sf::Vector2f& scale,
+             const sf::Vector2f& origin, const sf::Color& color);
+
+    std::size_t getSpriteCount() const;
+    std::size_t getBatchCount() const;
+
+private:
+    struct Batch
+    {
+        const sf::Texture*      texture;
+        sf::BlendMode           blendMode;
+        std::vector<sf::Vertex> vertices;
+    };
+
+    virtual void draw(sf::RenderTarget& target, sf::RenderStates states) const;
+
+    Batch& findBatch(const sf::Texture* texture, const sf::BlendMode& blendMode);
+
+    std::vector<Batch> m_batches;
+    std::size_t        m_lastBatch;
+    std::size_t        m_spriteCount;
+};
+
+#endif // PYSFML_GRAPHICS_SPRITEBATCH_HPP
@@ -0,0 +1,75 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#include <pysfml/graphics/TextBatch.hpp>
+
+NativeTextBatch::NativeTextBatch() :
+m_font(NULL)
+{
+}
+
+void NativeTextBatch::setFont(const sf::Font* font)
+{
+    m_font = font;
+}
+
+std::vector<sf::Vertex>& NativeTextBatch::getVertices(unsigned int characterSize)
+{
+    for (std::size_t i = 0; i < m_pages.size(); ++i)
+        if (m_pages[i].characterSize == characterSize)
+            return m_pages[i].vertices;
+
+    Page page;
+    page.characterSize = characterSize;
+    m_pages.push_back(page);
+
+    return m_pages.back().vertices;
+}
+
+void NativeTextBatch::clear()
+{
+    m_pages.clear();
+}
+
+std::size_t NativeTextBatch::getVertexCount() const
+{
+    std::size_t count = 0;
+
+    for (std::size_t i = 0; i < m_pages.size(); ++i)
+        count += m_pages[i].vertices.size();
+
+    return count;
+}
+
+std::size_t NativeTextBatch::getDrawCount() const
+{
+    std::size_t count = 0;
+
+    for (std::size_t i = 0; i < m_pages.size(); ++i)
+        if (!m_pages[i].vertices.empty())
+            ++count;
+
+    return count;
+}
+
+void NativeTextBatch::draw(sf::RenderTarget& target, sf::RenderStates states) const
+{
+    if (!m_font)
+        return;
+
+    for (std::size_t i = 0; i < m_pages.size(); ++i)
+    {
+        const Page& page = m_pages[i];
+
+        if (page.vertices.empty())
+            continue;
+
+        states.texture = &m_font->getTexture(page.characterSize);
+        target.draw(&page.vertices[0], page.vertices.size(), sf::Quads, states);
+    }
+}
@@ -0,0 +1,49 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#ifndef PYSFML_GRAPHICS_TEXTBATCH_HPP
+#define PYSFML_GRAPHICS_TEXTBATCH_HPP
+
+#include <cstddef>
+#include <vector>
+#include <SFML/Graphics/Drawable.hpp>
+#include <SFML/Graphics/Font.hpp>
+#include <SFML/Graphics/RenderStates.hpp>
+#include <SFML/Graphics/RenderTarget.hpp>
+#include <SFML/Graphics/Vertex.hpp>
+
+// Holds the glyph quads of many strings sharing a font, one vertex array
+// per character size since each size has its own glyph texture.
+class NativeTextBatch : public sf::Drawable
+{
+public:
+    NativeTextBatch();
+
+    void setFont(const sf::Font* font);
+
+    std::vector<sf::Vertex>& getVertices(unsigned int characterSize);
+
+    void clear();
+
+    std::size_t getVertexCount() const;
+    std::size_t getDrawCount() const;
+
+private:
+    struct Page
+    {
+        unsigned int            characterSize;
+        std::vector<sf::Vertex> vertices;
+    };
+
+    virtual void draw(sf::RenderTarget& target, sf::RenderStates states) const;
+
+    const sf::Font*   m_font;
+    std::vector<Page> m_pages;
+};
+
+#endif // PYSFML_GRAPHICS_TEXTBATCH_HPP
@@ -0,0 +1,131 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#include <sstream>
+#include <pysfml/graphics/Uniform.hpp>
+
+#if SFML_VERSION_MAJOR > 2 || (SFML_VERSION_MAJOR == 2 && SFML_VERSION_MINOR >= 4)
+#define PYSFML_UNIFORM_ARRAYS
+#endif
+
+namespace
+{
+    sf::Transform toTransform(const float* m)
+    {
+        return sf::Transform(m[0], m[1], m[2],
+                             m[3], m[4], m[5],
+                             m[6], m[7], m[8]);
+    }
+}
+
+NativeUniform::NativeUniform(sf::Shader* shader, const std::string& name) :
+m_shader(shader),
+m_name(name)
+{
+}
+
+const std::string& NativeUniform::getName() const
+{
+    return m_name;
+}
+
+void NativeUniform::setFloat(float x)
+{
+    m_shader->setParameter(m_name, x);
+}
+
+void NativeUniform::setFloat(float x, float y)
+{
+    m_shader->setParameter(m_name, x, y);
+}
+
+void NativeUniform::setFloat(float x, float y, float z)
+{
+    m_shader->setParameter(m_name, x, y, z);
+}
+
+void NativeUniform::setFloat(float x, float y, float z, float w)
+{
+    m_shader->setParameter(m_name, x, y, z, w);
+}
+
+void NativeUniform::setColor(const sf::Color& color)
+{
+    m_shader->setParameter(m_name, color);
+}
+
+void NativeUniform::setTransform(const sf::Transform& transform)
+{
+    m_shader->setParameter(m_name, transform);
+}
+
+void NativeUniform::setTexture(const sf::Texture& texture)
+{
+    m_shader->setParameter(m_name, texture);
+}
+
+void NativeUniform::setCurrentTexture()
+{
+    m_shader->setParameter(m_name, sf::Shader::CurrentTexture);
+}
+
+void NativeUniform::setFloatArray(const float* values, std::size_t count, unsigned int components)
+{
+#ifdef PYSFML_UNIFORM_ARRAYS
+    switch (components)
+    {
+        case 1: m_shader->setUniformArray(m_name, values, count); break;
+        case 2: m_shader->setUniformArray(m_name, reinterpret_cast<const sf::Glsl::Vec2*>(values), count); break;
+        case 3: m_shader->setUniformArray(m_name, reinterpret_cast<const sf::Glsl::Vec3*>(values), count); break;
+        case 4: m_shader->setUniformArray(m_name, reinterpret_cast<const sf::Glsl::Vec4*>(values), count); break;
+    }
+#else
+    for (std::size_t i = 0; i < count; ++i, values += components)
+    {
+        const std::string& name = getElementName(i);
+
+        switch (components)
+        {
+            case 1: m_shader->setParameter(name, values[0]); break;
+            case 2: m_shader->setParameter(name, values[0], values[1]); break;
+            case 3: m_shader->setParameter(name, values[0], values[1], values[2]); break;
+            case 4: m_shader->setParameter(name, values[0], values[1], values[2], values[3]); break;
+        }
+    }
+#endif
+}
+
+void NativeUniform::setTransformArray(const float* matrices, std::size_t count)
+{
+#ifdef PYSFML_UNIFORM_ARRAYS
+    std::vector<sf::Glsl::Mat4> converted;
+    converted.reserve(count);
+
+    for (std::size_t i = 0; i < count; ++i)
+        converted.push_back(sf::Glsl::Mat4(toTransform(matrices + i * 9)));
+
+    if (count > 0)
+        m_shader->setUniformArray(m_name, &converted[0], count);
+#else
+    for (std::size_t i = 0; i < count; ++i)
+        m_shader->setParameter(getElementName(i), toTransform(matrices + i * 9));
+#endif
+}
+
+const std::string& NativeUniform::getElementName(std::size_t index)
+{
+    // the names are built once, the same arrays are uploaded every frame
+    while (m_elementNames.size() <= index)
+    {
+        std::ostringstream name;
+        name << m_name << '[' << m_elementNames.size() << ']';
+        m_elementNames.push_back(name.str());
+    }
+
+    return m_elementNames[index];
+}
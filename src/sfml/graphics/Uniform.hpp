@@ -0,0 +1,54 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#ifndef PYSFML_GRAPHICS_UNIFORM_HPP
+#define PYSFML_GRAPHICS_UNIFORM_HPP
+
+#include <cstddef>
+#include <string>
+#include <vector>
+#include <SFML/Config.hpp>
+#include <SFML/Graphics/Color.hpp>
+#include <SFML/Graphics/Shader.hpp>
+#include <SFML/Graphics/Texture.hpp>
+#include <SFML/Graphics/Transform.hpp>
+
+// A named uniform of a shader, with the name converted once. Arrays are
+// uploaded with sf::Shader::setUniformArray() from SFML 2.4 on, and one
+// element at a time (through names like "offsets[3]") before.
+class NativeUniform
+{
+public:
+    NativeUniform(sf::Shader* shader, const std::string& name);
+
+    const std::string& getName() const;
+
+    void setFloat(float x);
+    void setFloat(float x, float y);
+    void setFloat(float x, float y, float z);
+    void setFloat(float x, float y, float z, float w);
+    void setColor(const sf::Color& color);
+    void setTransform(const sf::Transform& transform);
+    void setTexture(const sf::Texture& texture);
+    void setCurrentTexture();
+
+    // count elements of 1 to 4 floats each, tightly packed
+    void setFloatArray(const float* values, std::size_t count, unsigned int components);
+
+    // count row-major 3x3 matrices, uploaded as mat4 like sf::Transform
+    void setTransformArray(const float* matrices, std::size_t count);
+
+private:
+    const std::string& getElementName(std::size_t index);
+
+    sf::Shader*              m_shader;
+    std::string              m_name;
+    std::vector<std::string> m_elementNames;
+};
+
+#endif // PYSFML_GRAPHICS_UNIFORM_HPP
@@ -0,0 +1,131 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#include <algorithm>
+#include <pysfml/graphics/VertexBuffer.hpp>
+
+#if SFML_VERSION_MAJOR > 2 || (SFML_VERSION_MAJOR == 2 && SFML_VERSION_MINOR >= 5)
+
+void drawVertexBuffer(sf::RenderTarget& target, const NativeVertexBuffer& vertexBuffer, std::size_t firstVertex, std::size_t vertexCount, const sf::RenderStates& states)
+{
+    target.draw(vertexBuffer, firstVertex, vertexCount, states);
+}
+
+#else
+
+NativeVertexBuffer::NativeVertexBuffer() :
+m_primitiveType(sf::Points),
+m_usage(Stream),
+m_created(false)
+{
+}
+
+NativeVertexBuffer::NativeVertexBuffer(sf::PrimitiveType type, Usage usage) :
+m_primitiveType(type),
+m_usage(usage),
+m_created(false)
+{
+}
+
+bool NativeVertexBuffer::create(std::size_t vertexCount)
+{
+    m_vertices.assign(vertexCount, sf::Vertex());
+    m_created = true;
+
+    return true;
+}
+
+std::size_t NativeVertexBuffer::getVertexCount() const
+{
+    return m_vertices.size();
+}
+
+bool NativeVertexBuffer::update(const sf::Vertex* vertices, std::size_t vertexCount, unsigned int offset)
+{
+    // same rules as sf::VertexBuffer: a partial update must fit in the
+    // buffer while a full one may grow it
+    if (!m_created || !vertices)
+        return false;
+
+    if (offset && (offset + vertexCount > m_vertices.size()))
+        return false;
+
+    if (offset + vertexCount > m_vertices.size())
+        m_vertices.resize(offset + vertexCount);
+
+    std::copy(vertices, vertices + vertexCount, m_vertices.begin() + offset);
+
+    return true;
+}
+
+bool NativeVertexBuffer::update(const NativeVertexBuffer& vertexBuffer)
+{
+    if (!m_created || !vertexBuffer.m_created)
+        return false;
+
+    m_vertices = vertexBuffer.m_vertices;
+
+    return true;
+}
+
+unsigned int NativeVertexBuffer::getNativeHandle() const
+{
+    return 0;
+}
+
+void NativeVertexBuffer::setPrimitiveType(sf::PrimitiveType type)
+{
+    m_primitiveType = type;
+}
+
+sf::PrimitiveType NativeVertexBuffer::getPrimitiveType() const
+{
+    return m_primitiveType;
+}
+
+void NativeVertexBuffer::setUsage(Usage usage)
+{
+    m_usage = usage;
+}
+
+NativeVertexBuffer::Usage NativeVertexBuffer::getUsage() const
+{
+    return m_usage;
+}
+
+bool NativeVertexBuffer::isAvailable()
+{
+    return false;
+}
+
+const sf::Vertex* NativeVertexBuffer::getVertices() const
+{
+    return m_vertices.empty() ? NULL : &m_vertices[0];
+}
+
+void NativeVertexBuffer::draw(sf::RenderTarget& target, sf::RenderStates states) const
+{
+    if (!m_vertices.empty())
+        target.draw(&m_vertices[0], m_vertices.size(), m_primitiveType, states);
+}
+
+void drawVertexBuffer(sf::RenderTarget& target, const NativeVertexBuffer& vertexBuffer, std::size_t firstVertex, std::size_t vertexCount, const sf::RenderStates& states)
+{
+    std::size_t size = vertexBuffer.getVertexCount();
+
+    if (firstVertex >= size)
+        return;
+
+    if (vertexCount > size - firstVertex)
+        vertexCount = size - firstVertex;
+
+    if (vertexCount)
+        target.draw(vertexBuffer.getVertices() + firstVertex, vertexCount, vertexBuffer.getPrimitiveType(), states);
+}
+
+#endif
@@ -0,0 +1,76 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#ifndef PYSFML_GRAPHICS_VERTEXBUFFER_HPP
+#define PYSFML_GRAPHICS_VERTEXBUFFER_HPP
+
+#include <cstddef>
+#include <vector>
+#include <SFML/Config.hpp>
+#include <SFML/Graphics/Drawable.hpp>
+#include <SFML/Graphics/PrimitiveType.hpp>
+#include <SFML/Graphics/RenderStates.hpp>
+#include <SFML/Graphics/RenderTarget.hpp>
+#include <SFML/Graphics/Vertex.hpp>
+
+// sf::VertexBuffer appeared in SFML 2.5; with older versions, a class
+// exposing the same interface keeps the vertices in client memory and
+// draws them as a regular vertex array.
+#if SFML_VERSION_MAJOR > 2 || (SFML_VERSION_MAJOR == 2 && SFML_VERSION_MINOR >= 5)
+
+#include <SFML/Graphics/VertexBuffer.hpp>
+
+typedef sf::VertexBuffer NativeVertexBuffer;
+
+#else
+
+class NativeVertexBuffer : public sf::Drawable
+{
+public:
+    enum Usage
+    {
+        Stream,
+        Dynamic,
+        Static
+    };
+
+    NativeVertexBuffer();
+    NativeVertexBuffer(sf::PrimitiveType type, Usage usage);
+
+    bool create(std::size_t vertexCount);
+    std::size_t getVertexCount() const;
+
+    bool update(const sf::Vertex* vertices, std::size_t vertexCount, unsigned int offset);
+    bool update(const NativeVertexBuffer& vertexBuffer);
+
+    unsigned int getNativeHandle() const;
+
+    void setPrimitiveType(sf::PrimitiveType type);
+    sf::PrimitiveType getPrimitiveType() const;
+
+    void setUsage(Usage usage);
+    Usage getUsage() const;
+
+    static bool isAvailable();
+
+    const sf::Vertex* getVertices() const;
+
+private:
+    virtual void draw(sf::RenderTarget& target, sf::RenderStates states) const;
+
+    std::vector<sf::Vertex> m_vertices;
+    sf::PrimitiveType       m_primitiveType;
+    Usage                   m_usage;
+    bool                    m_created;
+};
+
+#endif
+
+void drawVertexBuffer(sf::RenderTarget& target, const NativeVertexBuffer& vertexBuffer, std::size_t firstVertex, std::size_t vertexCount, const sf::RenderStates& states);
+
+#endif // PYSFML_GRAPHICS_VERTEXBUFFER_HPP
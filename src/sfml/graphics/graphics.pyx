@@ -6,6 +6,9 @@
 
 from libcpp.vector cimport vector
 from libcpp.string cimport string
+from libcpp.unordered_map cimport unordered_map
+from cython.operator cimport dereference as deref
+cimport cython
 
 cimport sfml as sf
 from sfml cimport Int8, Int16, Int32, Int64
@@ -24,15 +27,102 @@ cdef extern from "pysfml/graphics/DerivableRenderWindow.hpp":
         void createWindow()
         void resizeWindow()
 
+cdef extern from "pysfml/graphics/VertexBuffer.hpp":
+    cdef enum VertexBufferUsage "NativeVertexBuffer::Usage":
+        VertexBufferStream "NativeVertexBuffer::Stream"
+        VertexBufferDynamic "NativeVertexBuffer::Dynamic"
+        VertexBufferStatic "NativeVertexBuffer::Static"
+
+    cdef cppclass NativeVertexBuffer:
+        NativeVertexBuffer(sf.primitivetype.PrimitiveType, VertexBufferUsage)
+        bint create(size_t)
+        size_t getVertexCount() const
+        bint update(const sf.Vertex*, size_t, unsigned int)
+        bint update(const NativeVertexBuffer&)
+        unsigned int getNativeHandle() const
+        void setPrimitiveType(sf.primitivetype.PrimitiveType)
+        sf.primitivetype.PrimitiveType getPrimitiveType() const
+        void setUsage(VertexBufferUsage)
+        VertexBufferUsage getUsage() const
+
+    bint isVertexBufferAvailable "NativeVertexBuffer::isAvailable"()
+    void drawVertexBuffer(sf.RenderTarget&, const NativeVertexBuffer&, size_t, size_t, const sf.RenderStates&)
+
+cdef extern from "pysfml/graphics/SpriteBatch.hpp":
+    cdef cppclass NativeSpriteBatch:
+        NativeSpriteBatch()
+        void clear()
+        void add(const sf.Texture*, const sf.BlendMode&, const sf.FloatRect&, const sf.Vector2f&, float, const sf.Vector2f&, const sf.Vector2f&, const sf.Color&) nogil
+        size_t getSpriteCount() const
+        size_t getBatchCount() const
+
+cdef extern from "pysfml/graphics/SpatialIndex.hpp":
+    cdef cppclass NativeSpatialIndex:
+        NativeSpatialIndex(float)
+        void insert(Int64, const sf.FloatRect&) nogil
+        bint remove(Int64) nogil
+        void clear()
+        size_t getSize() const
+        bint contains(Int64) const
+        bint getBounds(Int64, sf.FloatRect&) const
+        float getCellSize() const
+        void queryRect(const sf.FloatRect&, vector[Int64]&) nogil
+        void queryPoint(float, float, vector[Int64]&) nogil
+
+cdef extern from "pysfml/graphics/Uniform.hpp":
+    cdef cppclass NativeUniform:
+        NativeUniform(sf.Shader*, const string&)
+        const string& getName() const
+        void setFloat(float)
+        void setFloat(float, float)
+        void setFloat(float, float, float)
+        void setFloat(float, float, float, float)
+        void setColor(const sf.Color&)
+        void setTransform(const sf.Transform&)
+        void setTexture(const sf.Texture&)
+        void setCurrentTexture()
+        void setFloatArray(const float*, size_t, unsigned int)
+        void setTransformArray(const float*, size_t)
+
+cdef extern from "pysfml/graphics/TextBatch.hpp":
+    cdef cppclass NativeTextBatch:
+        NativeTextBatch()
+        void setFont(const sf.Font*)
+        vector[sf.Vertex]& getVertices(unsigned int)
+        void clear()
+        size_t getVertexCount() const
+        size_t getDrawCount() const
+
+cdef extern from "pysfml/graphics/FrameGrabber.hpp":
+    cdef cppclass NativeFrameGrabber:
+        NativeFrameGrabber(unsigned int)
+        bint isAsynchronous() const
+        int request(unsigned int, unsigned int)
+        void resolve(int, Uint8*, unsigned int, unsigned int)
+        void discard(int)
+        unsigned int getSlotCount() const
+        unsigned int getPendingCount() const
+
+cdef extern from "Python.h":
+    Py_ssize_t Py_REFCNT(object)
+
+from libc.math cimport isfinite
 from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy, memset, strchr
+from cpython cimport array
+from cpython.buffer cimport PyBUF_FORMAT, PyBUF_ND, PyBUF_SIMPLE, PyBUF_STRIDES, PyBUF_WRITABLE
+from cpython.buffer cimport PyObject_CheckBuffer, PyObject_GetBuffer, PyBuffer_Release
 
 __all__ = ['BlendMode', 'PrimitiveType', 'Color', 'Rect', 'Transform',
-            'Image', 'Texture', 'Glyph', 'Font', 'Shader',
+            'Image', 'Texture', 'TextureUpload', 'TextureUploadQueue',
+            'TextureAtlas', 'Glyph', 'Font', 'Shader', 'Uniform', 'UniformBlock',
             'RenderStates', 'Drawable', 'Transformable', 'Sprite',
             'Text', 'Shape', 'CircleShape', 'ConvexShape',
-            'RectangleShape', 'Vertex', 'VertexArray', 'View',
+            'RectangleShape', 'Vertex', 'VertexArray', 'VertexBuffer',
+            'SpriteBatch', 'TextBatch', 'SpatialIndex', 'View',
             'RenderTarget', 'RenderTexture', 'RenderWindow',
-            'HandledWindow', 'TransformableDrawable']
+            'HandledWindow', 'TransformableDrawable', 'RenderStats',
+            'Frame', 'FrameGrabber']
 
 __all__ += ['BLEND_ALPHA', 'BLEND_ADD', 'BLEND_MULTIPLY', 'BLEND_NONE']
 
@@ -40,12 +130,15 @@ string_type = [bytes, unicode, str]
 numeric_type = [int, long, float, long]
 
 import sys
+import array
+from collections import deque
 from copy import copy, deepcopy
 from enum import IntEnum
 
 from pysfml.system cimport NumericObject
-from pysfml.system cimport Vector2, Vector3
+from pysfml.system cimport Vector2, Vector3, Time
 from pysfml.system cimport to_vector2i, to_vector2f
+from pysfml.system cimport wrap_time
 from pysfml.system cimport to_string, wrap_string
 from pysfml.system cimport popLastErrorMessage, import_sfml__system
 from pysfml.window cimport VideoMode, ContextSettings, Window
@@ -62,6 +155,7 @@ class PrimitiveType:
     QUADS = sf.primitivetype.Quads
 
 
+@cython.freelist(32)
 cdef public class Rect[type PyRectType, object PyRectObject]:
     cdef sf.Rect[NumericObject] *p_this
 
@@ -157,23 +251,24 @@ cdef public class Rect[type PyRectType, object PyRectObject]:
 
 cdef api Rect wrap_rect(sf.Rect[NumericObject]* p):
     cdef Rect r = Rect.__new__(Rect)
+    del r.p_this
     r.p_this = p
     return r
 
 cdef api Rect wrap_intrect(sf.IntRect* p):
     cdef Rect r = Rect.__new__(Rect)
-    r.left = p.left
-    r.top = p.top
-    r.width = p.width
-    r.height = p.height
+    r.p_this.left.set(p.left)
+    r.p_this.top.set(p.top)
+    r.p_this.width.set(p.width)
+    r.p_this.height.set(p.height)
     return r
 
 cdef api Rect wrap_floatrect(sf.FloatRect* p):
     cdef Rect r = Rect.__new__(Rect)
-    r.left = p.left
-    r.top = p.top
-    r.width = p.width
-    r.height = p.height
+    r.p_this.left.set(p.left)
+    r.p_this.top.set(p.top)
+    r.p_this.width.set(p.width)
+    r.p_this.height.set(p.height)
     return r
 
 cdef api sf.FloatRect to_floatrect(rectangle):
@@ -184,6 +279,7 @@ cdef api sf.IntRect to_intrect(rectangle):
     l, t, w, h = rectangle
     return sf.IntRect(l, t, w, h)
 
+@cython.freelist(64)
 cdef public class Color [type PyColorType, object PyColorObject]:
     BLACK = Color(0, 0, 0)
     WHITE = Color(255, 255, 255)
@@ -221,12 +317,12 @@ cdef public class Color [type PyColorType, object PyColorObject]:
             return NotImplemented
 
     def __add__(Color x, Color y):
-        r = Color(0, 0, 0)
+        cdef Color r = Color.__new__(Color)
         r.p_this[0] = x.p_this[0] + y.p_this[0]
         return r
 
     def __mul__(Color x, Color y):
-        r = Color(0, 0, 0)
+        cdef Color r = Color.__new__(Color)
         r.p_this[0] = x.p_this[0] * y.p_this[0]
         return r
 
@@ -273,10 +369,149 @@ cdef public class Color [type PyColorType, object PyColorObject]:
 
 cdef api Color wrap_color(sf.Color *p):
     cdef Color r = Color.__new__(Color)
+    del r.p_this
     r.p_this = p
     return r
 
 
+# A 2D strided view over numeric data: rows of N components of a given
+# buffer type ('f', 'd', 'i' or 'B'). A null row stride repeats the same
+# row, which lets a single value stand for a whole column.
+cdef struct StridedView:
+    const char *buf
+    Py_ssize_t  rows
+    Py_ssize_t  row_stride
+    Py_ssize_t  item_stride
+    char        type
+
+# Wraps any buffer-protocol object laid out as rows of N numeric
+# components, e.g. a (count, 2) NumPy array of positions or a flat
+# array.array of colors. Non-contiguous buffers are read through their
+# strides.
+cdef class StridedBuffer:
+    cdef Py_buffer   view
+    cdef bint        acquired
+    cdef StridedView data
+
+    def __dealloc__(self):
+        if self.acquired:
+            PyBuffer_Release(&self.view)
+
+cdef StridedBuffer get_strided_buffer(object obj, Py_ssize_t components, bytes types, bint writable=False):
+    cdef StridedBuffer r = StridedBuffer.__new__(StridedBuffer)
+    cdef int flags = PyBUF_STRIDES | PyBUF_FORMAT
+    cdef char *format
+
+    if writable:
+        flags |= PyBUF_WRITABLE
+
+    PyObject_GetBuffer(obj, &r.view, flags)
+    r.acquired = True
+
+    format = r.view.format
+    if format is NULL:
+        format = b"B"
+    elif format[0] == b'@' or format[0] == b'=':
+        format += 1
+
+    if format[0] == 0 or format[1] != 0 or strchr(types, format[0]) is NULL:
+        raise TypeError("Unsupported buffer format '{0}', expected one of '{1}'".format(
+            (<bytes>format).decode('ASCII'), types.decode('ASCII')))
+
+    r.data.buf = <const char*>r.view.buf
+    r.data.type = format[0]
+
+    if r.view.ndim == 2 and r.view.shape[1] == components:
+        r.data.rows = r.view.shape[0]
+        r.data.row_stride = r.view.strides[0]
+        r.data.item_stride = r.view.strides[1]
+    elif r.view.ndim == 1 and r.view.shape[0] % components == 0:
+        r.data.rows = r.view.shape[0] // components
+        r.data.row_stride = r.view.strides[0] * components
+        r.data.item_stride = r.view.strides[0]
+    else:
+        raise ValueError("Expected a buffer of shape (count, {0}) or (count * {0},)".format(components))
+
+    return r
+
+cdef object get_strided_view(object obj, Py_ssize_t components, bytes types, double *values, StridedView *view):
+    # Buffers are read row by row while anything else (a tuple, a Color,
+    # a number, ...) is stored in values and repeated for every row;
+    # None keeps the defaults already in values. The returned object
+    # must be kept alive as long as the view is used.
+    cdef StridedBuffer buffer
+    cdef Py_ssize_t i
+
+    if PyObject_CheckBuffer(obj):
+        buffer = get_strided_buffer(obj, components, types)
+        view[0] = buffer.data
+        return buffer
+
+    if obj is not None:
+        items = tuple(obj) if components > 1 else (obj,)
+
+        if len(items) != components:
+            raise ValueError("Expected {0} components, got {1}".format(components, len(items)))
+
+        for i in range(components):
+            values[i] = items[i]
+
+    view.buf = <const char*>values
+    view.rows = -1
+    view.row_stride = 0
+    view.item_stride = sizeof(double)
+    view.type = b'd'
+
+    return None
+
+cdef inline double read_component(const char *p, char type) nogil:
+    if type == b'f':
+        return (<const float*>p)[0]
+    elif type == b'd':
+        return (<const double*>p)[0]
+    elif type == b'i':
+        return (<const int*>p)[0]
+    else:
+        return (<const Uint8*>p)[0]
+
+cdef inline Int64 strided_get_integer(const StridedView *view, Py_ssize_t row) nogil:
+    # exact integer read for id buffers ('i', 'l' or 'q'), where going
+    # through a double would lose precision
+    cdef const char *p = view.buf + row * view.row_stride
+
+    if view.type == b'i':
+        return (<const int*>p)[0]
+    elif view.type == b'l':
+        return (<const long*>p)[0]
+    else:
+        return (<const long long*>p)[0]
+
+cdef inline double strided_get(const StridedView *view, Py_ssize_t row, Py_ssize_t column) nogil:
+    return read_component(view.buf + row * view.row_stride + column * view.item_stride, view.type)
+
+cdef inline void strided_set(const StridedView *view, Py_ssize_t row, Py_ssize_t column, double value) nogil:
+    # only valid for views over a writable buffer of floats or doubles
+    cdef char *p = <char*>view.buf + row * view.row_stride + column * view.item_stride
+
+    if view.type == b'f':
+        (<float*>p)[0] = <float>value
+    else:
+        (<double*>p)[0] = value
+
+cdef StridedBuffer get_output_buffer(object out, Py_ssize_t rows, Py_ssize_t components, char type):
+    # out defaults to a new flat array.array of the input type
+    cdef StridedBuffer r
+
+    if out is None:
+        out = array.clone(array.array('f' if type == b'f' else 'd'), rows * components, True)
+
+    r = get_strided_buffer(out, components, b"fd", True)
+
+    if r.data.rows != rows:
+        raise ValueError("The output buffer must have {0} rows, not {1}".format(rows, r.data.rows))
+
+    return r
+
 cdef class Transform:
     cdef sf.Transform *p_this
     cdef bint          delete_this
@@ -336,6 +571,93 @@ cdef class Transform:
         cdef sf.FloatRect p = self.p_this.transformRect(to_floatrect(rectangle))
         return Rect((p.left, p.top), (p.width, p.height))
 
+    def transform_points(self, points, out=None):
+        # points is a (count, 2) float or double buffer; the result is
+        # written to out (which may be points itself) or to a new flat
+        # array.array
+        cdef StridedBuffer source = get_strided_buffer(points, 2, b"fd")
+        cdef StridedBuffer target = get_output_buffer(out, source.data.rows, 2, source.data.type)
+        cdef const float *m = self.p_this.getMatrix()
+        cdef double x, y
+        cdef Py_ssize_t i
+
+        with nogil:
+            for i in range(source.data.rows):
+                x = strided_get(&source.data, i, 0)
+                y = strided_get(&source.data, i, 1)
+                strided_set(&target.data, i, 0, m[0] * x + m[4] * y + m[12])
+                strided_set(&target.data, i, 1, m[1] * x + m[5] * y + m[13])
+
+        return <object>target.view.obj
+
+    def transform_rectangles(self, rectangles, out=None):
+        # rectangles is a (count, 4) buffer of (left, top, width,
+        # height); like transform_rectangle, each result is the bounding
+        # rectangle of the transformed corners
+        cdef StridedBuffer source = get_strided_buffer(rectangles, 4, b"fd")
+        cdef StridedBuffer target = get_output_buffer(out, source.data.rows, 4, source.data.type)
+        cdef sf.FloatRect rectangle
+        cdef Py_ssize_t i
+
+        with nogil:
+            for i in range(source.data.rows):
+                rectangle = self.p_this.transformRect(sf.FloatRect(
+                    strided_get(&source.data, i, 0), strided_get(&source.data, i, 1),
+                    strided_get(&source.data, i, 2), strided_get(&source.data, i, 3)))
+
+                strided_set(&target.data, i, 0, rectangle.left)
+                strided_set(&target.data, i, 1, rectangle.top)
+                strided_set(&target.data, i, 2, rectangle.width)
+                strided_set(&target.data, i, 3, rectangle.height)
+
+        return <object>target.view.obj
+
+    def combine_many(self, transforms, out=None):
+        # computes self * transform for each transform, given either as
+        # Transform objects or as a (count, 9) buffer of row-major 3x3
+        # matrices (the from_values() order); the results are written
+        # as row-major 3x3 matrices too
+        cdef StridedBuffer source
+        cdef StridedBuffer target
+        cdef vector[sf.Transform] transform_list
+        cdef sf.Transform combined
+        cdef const float *m
+        cdef Py_ssize_t count, i
+        cdef bint from_buffer = PyObject_CheckBuffer(transforms)
+
+        if from_buffer:
+            source = get_strided_buffer(transforms, 9, b"fd")
+            count = source.data.rows
+            target = get_output_buffer(out, count, 9, source.data.type)
+        else:
+            for transform in transforms:
+                transform_list.push_back((<Transform?>transform).p_this[0])
+            count = transform_list.size()
+            target = get_output_buffer(out, count, 9, b'f')
+
+        with nogil:
+            for i in range(count):
+                if not from_buffer:
+                    combined = self.p_this[0] * transform_list[i]
+                else:
+                    combined = self.p_this[0] * sf.Transform(
+                        strided_get(&source.data, i, 0), strided_get(&source.data, i, 1), strided_get(&source.data, i, 2),
+                        strided_get(&source.data, i, 3), strided_get(&source.data, i, 4), strided_get(&source.data, i, 5),
+                        strided_get(&source.data, i, 6), strided_get(&source.data, i, 7), strided_get(&source.data, i, 8))
+
+                m = combined.getMatrix()
+                strided_set(&target.data, i, 0, m[0])
+                strided_set(&target.data, i, 1, m[4])
+                strided_set(&target.data, i, 2, m[12])
+                strided_set(&target.data, i, 3, m[1])
+                strided_set(&target.data, i, 4, m[5])
+                strided_set(&target.data, i, 5, m[13])
+                strided_set(&target.data, i, 6, m[3])
+                strided_set(&target.data, i, 7, m[7])
+                strided_set(&target.data, i, 8, m[15])
+
+        return <object>target.view.obj
+
     def combine(self, Transform transform):
         self.p_this.combine(transform.p_this[0])
         return self
@@ -536,8 +858,13 @@ cdef public class Image[type PyImageType, object PyImageObject]:
     @classmethod
     def from_file(cls, basestring filename):
         cdef sf.Image *p = new sf.Image()
+        cdef string encoded_filename = filename.encode('UTF-8')
+        cdef bint loaded
 
-        if p.loadFromFile(filename.encode('UTF-8')):
+        with nogil:
+            loaded = p.loadFromFile(encoded_filename)
+
+        if loaded:
             return wrap_image(p)
 
         del p
@@ -546,15 +873,27 @@ cdef public class Image[type PyImageType, object PyImageObject]:
     @classmethod
     def from_memory(cls, bytes data):
         cdef sf.Image *p = new sf.Image()
+        cdef const char *buffer = data
+        cdef size_t size = len(data)
+        cdef bint loaded
+
+        with nogil:
+            loaded = p.loadFromMemory(buffer, size)
 
-        if p.loadFromMemory(<char*>data, len(data)):
+        if loaded:
             return wrap_image(p)
 
         del p
         raise IOError(popLastErrorMessage())
 
     def to_file(self, basestring filename):
-        if not self.p_this.saveToFile(filename.encode('UTF-8')):
+        cdef string encoded_filename = filename.encode('UTF-8')
+        cdef bint saved
+
+        with nogil:
+            saved = self.p_this.saveToFile(encoded_filename)
+
+        if not saved:
             raise IOError(popLastErrorMessage())
 
     property size:
@@ -805,6 +1144,463 @@ cdef api Texture wrap_texture(sf.Texture *p, bint d):
     return r
 
 
+cdef class TextureUpload:
+    cdef readonly Texture texture
+    cdef object           m_callback
+    cdef Py_buffer        m_view
+    cdef bint             m_acquired
+    cdef bint             m_cancelled
+    cdef unsigned int     m_width, m_height, m_x, m_y
+    cdef unsigned int     m_row
+
+    def __init__(self):
+        raise UserWarning("Use TextureUploadQueue.push()")
+
+    def __dealloc__(self):
+        self.release()
+
+    def __repr__(self):
+        return "TextureUpload(texture={0}, size=({1}, {2}), progress={3:.2f})".format(id(self.texture), self.m_width, self.m_height, self.progress)
+
+    cdef void release(self):
+        if self.m_acquired:
+            PyBuffer_Release(&self.m_view)
+            self.m_acquired = False
+
+    def cancel(self):
+        self.m_cancelled = True
+        self.release()
+
+    property done:
+        def __get__(self):
+            return self.m_row >= self.m_height
+
+    property cancelled:
+        def __get__(self):
+            return self.m_cancelled
+
+    property progress:
+        def __get__(self):
+            if self.m_height == 0:
+                return 1.
+            return <float>self.m_row / self.m_height
+
+    property remaining_bytes:
+        def __get__(self):
+            if self.m_cancelled:
+                return 0
+            return <size_t>(self.m_height - self.m_row) * self.m_width * 4
+
+
+cdef class TextureUploadQueue:
+    cdef object m_uploads
+    cdef size_t m_tile_size
+    cdef size_t m_byte_budget
+    cdef Int64  m_time_budget
+    cdef Uint64 m_uploaded_bytes
+    cdef Uint64 m_uploaded_tiles
+    cdef Uint64 m_completed
+    cdef Int64  m_busy_time
+    cdef size_t m_last_bytes
+    cdef Int64  m_last_time
+
+    def __init__(self, size_t byte_budget=4194304, Time time_budget=None, size_t tile_size=262144):
+        if tile_size == 0:
+            raise ValueError("The tile size must be positive")
+
+        self.m_uploads = deque()
+        self.m_tile_size = tile_size
+        self.byte_budget = byte_budget
+        self.time_budget = time_budget
+
+    def __repr__(self):
+        return "TextureUploadQueue(pending={0}, pending_bytes={1}, uploaded_bytes={2})".format(self.pending, self.pending_bytes, self.m_uploaded_bytes)
+
+    def __len__(self):
+        return len(self.m_uploads)
+
+    def push(self, Texture texture, pixels, position=None, size=None, callback=None):
+        cdef TextureUpload upload = TextureUpload.__new__(TextureUpload)
+        cdef sf.Vector2u texture_size = texture.p_this.getSize()
+        cdef unsigned int x = 0, y = 0
+
+        if isinstance(pixels, Image):
+            upload.m_width = (<Image>pixels).p_this.getSize().x
+            upload.m_height = (<Image>pixels).p_this.getSize().y
+        elif size is None:
+            raise ValueError("The size is required for raw pixel buffers")
+        else:
+            upload.m_width, upload.m_height = size
+
+        if position is not None:
+            x, y = position
+
+        if <Uint64>x + upload.m_width > texture_size.x or <Uint64>y + upload.m_height > texture_size.y:
+            raise ValueError("The region doesn't fit in the texture")
+
+        PyObject_GetBuffer(pixels, &upload.m_view, PyBUF_SIMPLE)
+        upload.m_acquired = True
+
+        if upload.m_view.len < <Py_ssize_t>upload.m_width * upload.m_height * 4:
+            raise ValueError("Expected {0} bytes of RGBA pixels, got {1}".format(upload.m_width * upload.m_height * 4, upload.m_view.len))
+
+        upload.texture = texture
+        upload.m_callback = callback
+        upload.m_x = x
+        upload.m_y = y
+
+        self.m_uploads.append(upload)
+        return upload
+
+    def process(self):
+        """ Upload tiles until the byte or time budget of the frame is
+        spent; at least one tile is uploaded per call so that every upload
+        eventually completes. Return the number of bytes uploaded. """
+        cdef sf.Clock clock
+        cdef TextureUpload upload
+        cdef size_t uploaded = 0
+        cdef size_t row_size, tile_size
+        cdef unsigned int rows
+        cdef list completed = []
+
+        while self.m_uploads:
+            upload = self.m_uploads[0]
+
+            if upload.m_cancelled:
+                self.m_uploads.popleft()
+                continue
+
+            if upload.m_width == 0:
+                upload.m_row = upload.m_height
+
+            if upload.m_row < upload.m_height:
+                row_size = <size_t>upload.m_width * 4
+                rows = min(max(self.m_tile_size // row_size, 1), upload.m_height - upload.m_row)
+                tile_size = rows * row_size
+
+                if uploaded:
+                    if self.m_byte_budget and uploaded + tile_size > self.m_byte_budget:
+                        break
+
+                    if self.m_time_budget and clock.getElapsedTime().asMicroseconds() >= self.m_time_budget:
+                        break
+
+                upload.texture.p_this.update(<const Uint8*>upload.m_view.buf + upload.m_row * row_size,
+                                             upload.m_width, rows,
+                                             upload.m_x, upload.m_y + upload.m_row)
+
+                upload.m_row += rows
+                uploaded += tile_size
+                self.m_uploaded_tiles += 1
+
+            if upload.m_row >= upload.m_height:
+                self.m_uploads.popleft()
+                upload.release()
+                self.m_completed += 1
+                completed.append(upload)
+
+        self.m_last_bytes = uploaded
+        self.m_last_time = clock.getElapsedTime().asMicroseconds()
+        self.m_uploaded_bytes += uploaded
+        self.m_busy_time += self.m_last_time
+
+        for upload in completed:
+            if upload.m_callback is not None:
+                upload.m_callback(upload.texture)
+
+        return uploaded
+
+    def clear(self):
+        cdef TextureUpload upload
+
+        for upload in self.m_uploads:
+            upload.cancel()
+
+        self.m_uploads.clear()
+
+    property tile_size:
+        def __get__(self):
+            return self.m_tile_size
+
+        def __set__(self, size_t tile_size):
+            if tile_size == 0:
+                raise ValueError("The tile size must be positive")
+
+            self.m_tile_size = tile_size
+
+    property byte_budget:
+        def __get__(self):
+            return self.m_byte_budget
+
+        def __set__(self, byte_budget):
+            self.m_byte_budget = byte_budget or 0
+
+    property time_budget:
+        def __get__(self):
+            cdef sf.Time* p
+
+            if not self.m_time_budget:
+                return None
+
+            p = new sf.Time()
+            p[0] = sf.microseconds(self.m_time_budget)
+            return wrap_time(p)
+
+        def __set__(self, Time time_budget):
+            if time_budget is None:
+                self.m_time_budget = 0
+            else:
+                self.m_time_budget = time_budget.p_this.asMicroseconds()
+
+    property pending:
+        def __get__(self):
+            return len(self.m_uploads)
+
+    property pending_bytes:
+        def __get__(self):
+            cdef TextureUpload upload
+            cdef Uint64 total = 0
+
+            for upload in self.m_uploads:
+                total += upload.remaining_bytes
+
+            return total
+
+    property uploaded_bytes:
+        def __get__(self):
+            return self.m_uploaded_bytes
+
+    property uploaded_tiles:
+        def __get__(self):
+            return self.m_uploaded_tiles
+
+    property completed:
+        def __get__(self):
+            return self.m_completed
+
+    property last_bytes:
+        def __get__(self):
+            return self.m_last_bytes
+
+    property last_time:
+        def __get__(self):
+            cdef sf.Time* p = new sf.Time()
+            p[0] = sf.microseconds(self.m_last_time)
+            return wrap_time(p)
+
+    property throughput:
+        def __get__(self):
+            if not self.m_busy_time:
+                return 0.
+            return self.m_uploaded_bytes * 1000000. / self.m_busy_time
+
+
+# A skyline is the top contour of the rectangles packed so far, stored
+# as horizontal segments from left to right.
+cdef struct SkylineNode:
+    int x
+    int y
+    int width
+
+cdef int skyline_fit(vector[SkylineNode]& nodes, size_t index, int width, int height, int size):
+    # returns the lowest y a width x height rectangle can be placed at
+    # when its left edge is on the index-th segment, or -1
+    cdef int x = nodes[index].x
+    cdef int y = nodes[index].y
+    cdef int remaining = width
+
+    if x + width > size:
+        return -1
+
+    while remaining > 0:
+        if nodes[index].y > y:
+            y = nodes[index].y
+
+        if y + height > size:
+            return -1
+
+        remaining -= nodes[index].width
+        index += 1
+
+    return y
+
+cdef bint skyline_insert(vector[SkylineNode]& nodes, int width, int height, int size, int *x, int *y):
+    cdef size_t best_index = 0
+    cdef int best_top = -1
+    cdef int best_width = 0
+    cdef int top, shrink
+    cdef size_t i
+    cdef SkylineNode node
+
+    # bottom-left heuristic: lowest top edge, then narrowest segment
+    for i in range(nodes.size()):
+        top = skyline_fit(nodes, i, width, height, size)
+
+        if top >= 0:
+            if best_top < 0 or top + height < best_top or (top + height == best_top and nodes[i].width < best_width):
+                best_index = i
+                best_top = top + height
+                best_width = nodes[i].width
+                x[0] = nodes[i].x
+                y[0] = top
+
+    if best_top < 0:
+        return False
+
+    node.x = x[0]
+    node.y = best_top
+    node.width = width
+    nodes.insert(nodes.begin() + best_index, node)
+
+    # shrink or remove the segments now covered by the new one
+    i = best_index + 1
+    while i < nodes.size():
+        if nodes[i].x >= nodes[i-1].x + nodes[i-1].width:
+            break
+
+        shrink = nodes[i-1].x + nodes[i-1].width - nodes[i].x
+        nodes[i].x += shrink
+        nodes[i].width -= shrink
+
+        if nodes[i].width > 0:
+            break
+
+        nodes.erase(nodes.begin() + i)
+
+    # merge neighbours at the same height
+    i = 0
+    while i + 1 < nodes.size():
+        if nodes[i].y == nodes[i+1].y:
+            nodes[i].width += nodes[i+1].width
+            nodes.erase(nodes.begin() + i + 1)
+        else:
+            i += 1
+
+    return True
+
+
+cdef class TextureAtlas:
+    cdef unsigned int                 m_size
+    cdef unsigned int                 m_padding
+    cdef bint                         m_smooth
+    cdef list                         m_textures
+    cdef vector[vector[SkylineNode]]  m_skylines
+    cdef dict                         m_regions
+    cdef Uint64                       m_used_area
+
+    def __init__(self, unsigned int size=2048, unsigned int padding=1, bint smooth=False):
+        self.m_size = min(size, sf.texture.getMaximumSize())
+        self.m_padding = padding
+        self.m_smooth = smooth
+        self.m_textures = []
+        self.m_regions = {}
+        self.m_used_area = 0
+
+    def __repr__(self):
+        return "TextureAtlas(size={0}, pages={1}, regions={2}, efficiency={3:.2f})".format(self.m_size, len(self.m_textures), len(self), self.efficiency)
+
+    def __len__(self):
+        return len(self.m_regions)
+
+    def __contains__(self, name):
+        return name in self.m_regions
+
+    def __iter__(self):
+        return iter(self.m_regions)
+
+    def __getitem__(self, name):
+        page, rectangle = self.m_regions[name]
+        return self.m_textures[page], copy(rectangle)
+
+    def add(self, name, image):
+        cdef Image source
+        cdef int page = -1
+        cdef int x, y, width, height
+        cdef size_t i
+
+        if name in self.m_regions:
+            raise KeyError("'{0}' is already in the atlas".format(name))
+
+        if isinstance(image, basestring):
+            source = Image.from_file(image)
+        else:
+            source = <Image?>image
+
+        width = source.p_this.getSize().x
+        height = source.p_this.getSize().y
+
+        if width + self.m_padding > self.m_size or height + self.m_padding > self.m_size:
+            raise ValueError("The image is too large for the atlas pages ({0}x{1} > {2}x{2})".format(width, height, self.m_size))
+
+        # first fit among the existing pages
+        for i in range(self.m_skylines.size()):
+            if skyline_insert(self.m_skylines[i], width + self.m_padding, height + self.m_padding, self.m_size, &x, &y):
+                page = i
+                break
+
+        if page < 0:
+            self._add_page()
+            page = self.m_skylines.size() - 1
+            skyline_insert(self.m_skylines[page], width + self.m_padding, height + self.m_padding, self.m_size, &x, &y)
+
+        (<Texture>self.m_textures[page]).p_this.update(source.p_this[0], x, y)
+
+        self.m_regions[name] = (page, Rect((x, y), (width, height)))
+        self.m_used_area += width * height
+
+        return self[name]
+
+    def add_many(self, images):
+        # inserting the tallest images first packs noticeably tighter
+        # than the order they come in
+        if hasattr(images, 'items'):
+            images = images.items()
+
+        loaded = []
+        for name, image in images:
+            if isinstance(image, basestring):
+                image = Image.from_file(image)
+            loaded.append((name, image))
+
+        loaded.sort(key=lambda item: (item[1].height, item[1].width), reverse=True)
+
+        for name, image in loaded:
+            self.add(name, image)
+
+    cdef _add_page(self):
+        cdef vector[SkylineNode] skyline
+        cdef SkylineNode node
+
+        texture = Texture.create(self.m_size, self.m_size)
+        texture.smooth = self.m_smooth
+
+        # the texture content is undefined after creation
+        texture.update_from_image(Image.create(self.m_size, self.m_size, Color.TRANSPARENT))
+
+        node.x = 0
+        node.y = 0
+        node.width = self.m_size
+        skyline.push_back(node)
+
+        self.m_skylines.push_back(skyline)
+        self.m_textures.append(texture)
+
+    property textures:
+        def __get__(self):
+            return list(self.m_textures)
+
+    property size:
+        def __get__(self):
+            return self.m_size
+
+    property efficiency:
+        def __get__(self):
+            if not self.m_textures:
+                return 0.0
+
+            return self.m_used_area / (len(self.m_textures) * <double>self.m_size * self.m_size)
+
+
 cdef class Glyph:
     cdef sf.Glyph *p_this
 
@@ -843,10 +1639,31 @@ cdef Glyph wrap_glyph(sf.Glyph *p):
     r.p_this = p
     return r
 
+# Strings are laid out from their UTF-32 code points, in native order.
+UTF32 = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
+
+cdef enum:
+    CHAR_TAB = 9
+    CHAR_NEWLINE = 10
+    CHAR_SPACE = 32
+
+cdef bytes encode_utf32(string):
+    if isinstance(string, bytes):
+        string = (<bytes>string).decode('UTF-8')
+
+    return string.encode(UTF32)
+
+cdef struct GlyphMetrics:
+    float advance
+    float left, top, width, height
+    int   texture_left, texture_top, texture_width, texture_height
+
 cdef class Font:
     cdef sf.Font *p_this
     cdef bint     delete_this
     cdef Texture  m_texture
+    cdef bytes    m_data
+    cdef unordered_map[Uint64, GlyphMetrics] m_metrics
 
     def __init__(self):
         raise UserWarning("Use a specific constructor")
@@ -860,8 +1677,13 @@ cdef class Font:
     @classmethod
     def from_file(cls, basestring filename):
         cdef sf.Font *p = new sf.Font()
+        cdef string encoded_filename = filename.encode('UTF-8')
+        cdef bint loaded
 
-        if p.loadFromFile(filename.encode('UTF-8')):
+        with nogil:
+            loaded = p.loadFromFile(encoded_filename)
+
+        if loaded:
             return wrap_font(p)
 
         del p
@@ -870,9 +1692,19 @@ cdef class Font:
     @classmethod
     def from_memory(cls, bytes data):
         cdef sf.Font *p = new sf.Font()
+        cdef const char *buffer = data
+        cdef size_t size = len(data)
+        cdef bint loaded
+        cdef Font font
 
-        if p.loadFromMemory(<char*>data, len(data)):
-            return wrap_font(p)
+        with nogil:
+            loaded = p.loadFromMemory(buffer, size)
+
+        if loaded:
+            # the font reads glyphs from the buffer on demand
+            font = wrap_font(p)
+            font.m_data = data
+            return font
 
         del p
         raise IOError(popLastErrorMessage())
@@ -882,6 +1714,181 @@ cdef class Font:
         p[0] = self.p_this.getGlyph(code_point, character_size, bold)
         return wrap_glyph(p)
 
+    cdef GlyphMetrics* get_metrics(self, Uint32 code_point, unsigned int character_size, bint bold):
+        cdef Uint64 key = (<Uint64>bold << 56) | (<Uint64>character_size << 32) | code_point
+        cdef unordered_map[Uint64, GlyphMetrics].iterator it = self.m_metrics.find(key)
+        cdef const sf.Glyph *glyph
+        cdef GlyphMetrics *metrics
+
+        if it != self.m_metrics.end():
+            return &deref(it).second
+
+        glyph = &self.p_this.getGlyph(code_point, character_size, bold)
+        metrics = &self.m_metrics[key]
+        metrics.advance = glyph.advance
+        metrics.left = glyph.bounds.left
+        metrics.top = glyph.bounds.top
+        metrics.width = glyph.bounds.width
+        metrics.height = glyph.bounds.height
+        metrics.texture_left = glyph.textureRect.left
+        metrics.texture_top = glyph.textureRect.top
+        metrics.texture_width = glyph.textureRect.width
+        metrics.texture_height = glyph.textureRect.height
+        return metrics
+
+    cdef float get_whitespace_advance(self, Uint32 code_point, unsigned int character_size, bint bold):
+        if code_point == CHAR_TAB:
+            return self.get_metrics(CHAR_SPACE, character_size, bold).advance * 4
+        return self.get_metrics(CHAR_SPACE, character_size, bold).advance
+
+    cdef sf.FloatRect get_bounds(self, const Uint32 *text, size_t length, unsigned int character_size, Uint32 style):
+        # mirrors the geometry computed by sf::Text, without the quads
+        cdef bint bold = style & sf.text.Bold
+        cdef float italic = 0.208 if style & sf.text.Italic else 0.
+        cdef float vspace = self.p_this.getLineSpacing(character_size)
+        cdef float x = 0, y = character_size
+        cdef float min_x = character_size, min_y = character_size
+        cdef float max_x = 0, max_y = 0
+        cdef float bottom
+        cdef Uint32 previous = 0, current
+        cdef GlyphMetrics *metrics
+        cdef size_t i
+
+        if length == 0:
+            return sf.FloatRect(0, 0, 0, 0)
+
+        for i in range(length):
+            current = text[i]
+            x += self.p_this.getKerning(previous, current, character_size)
+            previous = current
+
+            if current == CHAR_SPACE or current == CHAR_TAB or current == CHAR_NEWLINE:
+                min_x = min(min_x, x)
+                min_y = min(min_y, y)
+
+                if current == CHAR_NEWLINE:
+                    y += vspace
+                    x = 0
+                else:
+                    x += self.get_whitespace_advance(current, character_size, bold)
+
+                max_x = max(max_x, x)
+                max_y = max(max_y, y)
+                continue
+
+            metrics = self.get_metrics(current, character_size, bold)
+            bottom = metrics.top + metrics.height
+
+            min_x = min(min_x, x + metrics.left - italic * bottom)
+            max_x = max(max_x, x + metrics.left + metrics.width - italic * metrics.top)
+            min_y = min(min_y, y + metrics.top)
+            max_y = max(max_y, y + bottom)
+
+            x += metrics.advance
+
+        return sf.FloatRect(min_x, min_y, max_x - min_x, max_y - min_y)
+
+    def measure(self, string, unsigned int character_size=30, Uint32 style=0):
+        """ Return the local bounds a Text would have with this string,
+        character size and style. """
+        cdef bytes data = encode_utf32(string)
+        cdef sf.FloatRect bounds = self.get_bounds(<const Uint32*><char*>data, len(data) // 4, character_size, style)
+        return wrap_floatrect(&bounds)
+
+    def get_advances(self, string, unsigned int character_size=30, Uint32 style=0):
+        """ Return two arrays of floats holding, for each character, its
+        horizontal advance and the kerning applied before it. """
+        cdef bytes data = encode_utf32(string)
+        cdef const Uint32 *text = <const Uint32*><char*>data
+        cdef size_t length = len(data) // 4
+        cdef bint bold = style & sf.text.Bold
+        cdef array.array advances = array.clone(array.array('f'), length, False)
+        cdef array.array kernings = array.clone(array.array('f'), length, False)
+        cdef Uint32 previous = 0, current
+        cdef size_t i
+
+        for i in range(length):
+            current = text[i]
+            kernings.data.as_floats[i] = self.p_this.getKerning(previous, current, character_size)
+            previous = current
+
+            if current == CHAR_NEWLINE:
+                advances.data.as_floats[i] = 0
+            elif current == CHAR_SPACE or current == CHAR_TAB:
+                advances.data.as_floats[i] = self.get_whitespace_advance(current, character_size, bold)
+            else:
+                advances.data.as_floats[i] = self.get_metrics(current, character_size, bold).advance
+
+        return advances, kernings
+
+    def wrap(self, string, float width, unsigned int character_size=30, Uint32 style=0):
+        """ Break the string into lines whose pen advance fits in the
+        width, at spaces when possible and between characters otherwise.
+        Explicit line breaks are kept. Return the list of lines. """
+        cdef bytes data = encode_utf32(string)
+        cdef const Uint32 *text = <const Uint32*><char*>data
+        cdef size_t length = len(data) // 4
+        cdef bint bold = style & sf.text.Bold
+        cdef vector[size_t] lines
+        cdef size_t start = 0, end, space = 0, i
+        cdef bint has_space = False
+        cdef float x = 0, x_after_space = 0, kerning, advance
+        cdef Uint32 previous = 0, current
+
+        for i in range(length):
+            current = text[i]
+
+            if current == CHAR_NEWLINE:
+                lines.push_back(start)
+                lines.push_back(i)
+                start = i + 1
+                x = 0
+                has_space = False
+                previous = 0
+                continue
+
+            kerning = self.p_this.getKerning(previous, current, character_size) if previous else 0
+            previous = current
+
+            if current == CHAR_SPACE or current == CHAR_TAB:
+                x += kerning + self.get_whitespace_advance(current, character_size, bold)
+                space = i
+                x_after_space = x
+                has_space = True
+                continue
+
+            advance = self.get_metrics(current, character_size, bold).advance
+
+            if x + kerning + advance > width and i > start:
+                if has_space:
+                    end = space
+                    while end > start and (text[end - 1] == CHAR_SPACE or text[end - 1] == CHAR_TAB):
+                        end -= 1
+
+                    lines.push_back(start)
+                    lines.push_back(end)
+                    start = space + 1
+                    x -= x_after_space
+                else:
+                    lines.push_back(start)
+                    lines.push_back(i)
+                    start = i
+                    x = 0
+                    kerning = 0
+
+                has_space = False
+
+            x += kerning + advance
+
+        lines.push_back(start)
+        lines.push_back(length)
+
+        result = []
+        for i in range(0, lines.size(), 2):
+            result.append(data[lines[i] * 4:lines[i + 1] * 4].decode(UTF32))
+
+        return result
+
     def get_kerning(self, Uint32 first, Uint32 second, unsigned int character_size):
         return self.p_this.getKerning(first, second, character_size)
 
@@ -909,6 +1916,7 @@ cdef Font wrap_font(sf.Font *p, bint d=True):
 cdef class Shader:
     cdef sf.Shader *p_this
     cdef bint              delete_this
+    cdef dict              m_uniforms
 
     def __init__(self):
         raise UserWarning("Use a specific constructor")
@@ -1083,6 +2091,24 @@ cdef class Shader:
 
         self.p_this.setParameter(encoded_name, sf.shader.CurrentTexture)
 
+    def get_uniform(self, name):
+        """ Return a handle to set the named uniform without converting
+        the name again; the same handle is returned for the same name. """
+        cdef Uniform uniform
+
+        if self.m_uniforms is None:
+            self.m_uniforms = {}
+
+        if name in self.m_uniforms:
+            return self.m_uniforms[name]
+
+        uniform = Uniform.__new__(Uniform)
+        uniform.p_this = new NativeUniform(self.p_this, name.encode('UTF-8'))
+        uniform.m_shader = self
+
+        self.m_uniforms[name] = uniform
+        return uniform
+
     @staticmethod
     def bind(Shader shader=None):
         if not shader:
@@ -1101,6 +2127,239 @@ cdef Shader wrap_shader(sf.Shader *p, bint d=True):
     r.delete_this = d
     return r
 
+cdef class Uniform:
+    cdef NativeUniform *p_this
+    cdef Shader         m_shader
+    cdef Texture        m_texture
+
+    def __init__(self):
+        raise UserWarning("Use Shader.get_uniform()")
+
+    def __dealloc__(self):
+        if self.p_this is not NULL:
+            del self.p_this
+
+    def __repr__(self):
+        return "Uniform(name={0})".format(self.name)
+
+    property name:
+        def __get__(self):
+            return self.p_this.getName().decode('UTF-8')
+
+    def set_float(self, float x):
+        self.p_this.setFloat(x)
+
+    def set_vec2(self, float x, float y):
+        self.p_this.setFloat(x, y)
+
+    def set_vec3(self, float x, float y, float z):
+        self.p_this.setFloat(x, y, z)
+
+    def set_vec4(self, float x, float y, float z, float w):
+        self.p_this.setFloat(x, y, z, w)
+
+    def set_color(self, Color color):
+        self.p_this.setColor(color.p_this[0])
+
+    def set_transform(self, Transform transform):
+        self.p_this.setTransform(transform.p_this[0])
+
+    def set_texture(self, Texture texture):
+        self.p_this.setTexture(texture.p_this[0])
+        self.m_texture = texture
+
+    def set_current_texture(self):
+        self.p_this.setCurrentTexture()
+
+    def set_floats(self, values, unsigned int components=1):
+        """ Upload an array uniform of float, vec2, vec3 or vec4 from a
+        buffer of shape (count, components) or a flat sequence of
+        numbers. Contiguous float32 buffers are passed as is. """
+        cdef StridedBuffer buffer
+        cdef vector[float] packed
+        cdef Py_ssize_t i, j
+
+        if components < 1 or components > 4:
+            raise ValueError("Uniform arrays have 1 to 4 components per element")
+
+        if not PyObject_CheckBuffer(values):
+            values = array.array('f', values)
+
+        buffer = get_strided_buffer(values, components, b"fd")
+
+        if buffer.data.rows == 0:
+            return
+
+        if buffer.data.type == b'f' and buffer.data.item_stride == sizeof(float) and buffer.data.row_stride == components * sizeof(float):
+            self.p_this.setFloatArray(<const float*>buffer.data.buf, buffer.data.rows, components)
+        else:
+            packed.resize(buffer.data.rows * components)
+
+            for i in range(buffer.data.rows):
+                for j in range(components):
+                    packed[i * components + j] = strided_get(&buffer.data, i, j)
+
+            self.p_this.setFloatArray(packed.data(), buffer.data.rows, components)
+
+    def set_transforms(self, transforms):
+        """ Upload an array of mat4 uniforms from Transform objects or a
+        (count, 9) buffer of row-major 3x3 matrices. """
+        cdef StridedBuffer buffer
+        cdef vector[float] packed
+        cdef const float *m
+        cdef Py_ssize_t i, j
+
+        if PyObject_CheckBuffer(transforms):
+            buffer = get_strided_buffer(transforms, 9, b"fd")
+
+            for i in range(buffer.data.rows):
+                for j in range(9):
+                    packed.push_back(strided_get(&buffer.data, i, j))
+        else:
+            for transform in transforms:
+                m = (<Transform?>transform).p_this.getMatrix()
+
+                for j in (0, 4, 12, 1, 5, 13, 3, 7, 15):
+                    packed.push_back(m[j])
+
+        if not packed.empty():
+            self.p_this.setTransformArray(packed.data(), packed.size() // 9)
+
+
+cdef enum UniformKind:
+    UNIFORM_FLOAT
+    UNIFORM_VEC2
+    UNIFORM_VEC3
+    UNIFORM_VEC4
+    UNIFORM_COLOR
+    UNIFORM_TRANSFORM
+    UNIFORM_TEXTURE
+    UNIFORM_CURRENT_TEXTURE
+
+cdef struct UniformValue:
+    NativeUniform    *uniform
+    UniformKind       kind
+    float             values[9]
+    const sf.Texture *texture
+
+cdef class UniformBlock:
+    cdef Shader               m_shader
+    cdef vector[UniformValue] m_values
+    cdef dict                 m_indices
+    cdef dict                 m_objects
+
+    def __init__(self, Shader shader not None):
+        self.m_shader = shader
+        self.m_indices = {}
+        self.m_objects = {}
+
+    def __repr__(self):
+        return "UniformBlock(shader={0}, uniforms={1})".format(id(self.m_shader), len(self))
+
+    def __len__(self):
+        return self.m_values.size()
+
+    def __contains__(self, name):
+        return name in self.m_indices
+
+    def __setitem__(self, name, value):
+        self.set(name, value)
+
+    def set(self, name, value):
+        """ Record the value of a uniform: a number, a sequence or Vector2
+        of 2 to 4 numbers, a Color, a Transform or a Texture. The value is
+        only sent to the shader by apply(). """
+        cdef UniformValue staged
+        cdef UniformValue *entry
+        cdef const float *m
+        cdef Py_ssize_t i, j
+
+        # converted aside first, so a bad value neither adds the uniform
+        # nor leaves its recorded value half-updated
+        staged.texture = NULL
+
+        if isinstance(value, Color):
+            staged.kind = UNIFORM_COLOR
+            staged.values[0] = (<Color>value).p_this.r
+            staged.values[1] = (<Color>value).p_this.g
+            staged.values[2] = (<Color>value).p_this.b
+            staged.values[3] = (<Color>value).p_this.a
+        elif isinstance(value, Transform):
+            staged.kind = UNIFORM_TRANSFORM
+            m = (<Transform>value).p_this.getMatrix()
+            for i, j in enumerate((0, 4, 12, 1, 5, 13, 3, 7, 15)):
+                staged.values[i] = m[j]
+        elif isinstance(value, Texture):
+            staged.kind = UNIFORM_TEXTURE
+            staged.texture = (<Texture>value).p_this
+        elif type(value) in numeric_type:
+            staged.kind = UNIFORM_FLOAT
+            staged.values[0] = value
+        else:
+            items = tuple(value)
+
+            if len(items) < 2 or len(items) > 4:
+                raise ValueError("Expected 2 to 4 components, got {0}".format(len(items)))
+
+            staged.kind = <UniformKind>(UNIFORM_FLOAT + len(items) - 1)
+            for i in range(len(items)):
+                staged.values[i] = items[i]
+
+        entry = self.get_entry(name)
+        entry.kind = staged.kind
+        entry.values = staged.values
+        entry.texture = staged.texture
+
+        # the block only stores a pointer to textures
+        self.m_objects[name] = value
+
+    def set_current_texture(self, name):
+        self.get_entry(name).kind = UNIFORM_CURRENT_TEXTURE
+        self.m_objects[name] = None
+
+    def apply(self):
+        """ Send every uniform of the block to the shader. """
+        cdef UniformValue *entry
+        cdef float *v
+        cdef size_t i
+
+        for i in range(self.m_values.size()):
+            entry = &self.m_values[i]
+            v = entry.values
+
+            if entry.kind == UNIFORM_FLOAT:
+                entry.uniform.setFloat(v[0])
+            elif entry.kind == UNIFORM_VEC2:
+                entry.uniform.setFloat(v[0], v[1])
+            elif entry.kind == UNIFORM_VEC3:
+                entry.uniform.setFloat(v[0], v[1], v[2])
+            elif entry.kind == UNIFORM_VEC4:
+                entry.uniform.setFloat(v[0], v[1], v[2], v[3])
+            elif entry.kind == UNIFORM_COLOR:
+                entry.uniform.setColor(sf.Color(<Uint8>v[0], <Uint8>v[1], <Uint8>v[2], <Uint8>v[3]))
+            elif entry.kind == UNIFORM_TRANSFORM:
+                entry.uniform.setTransform(sf.Transform(v[0], v[1], v[2], v[3], v[4], v[5], v[6], v[7], v[8]))
+            elif entry.kind == UNIFORM_TEXTURE:
+                entry.uniform.setTexture(entry.texture[0])
+            else:
+                entry.uniform.setCurrentTexture()
+
+    cdef UniformValue* get_entry(self, name) except NULL:
+        cdef Uniform uniform
+        cdef UniformValue value
+
+        if name not in self.m_indices:
+            uniform = self.m_shader.get_uniform(name)
+            value.uniform = uniform.p_this
+            value.kind = UNIFORM_CURRENT_TEXTURE
+            value.texture = NULL
+
+            self.m_indices[name] = self.m_values.size()
+            self.m_values.push_back(value)
+
+        return &self.m_values[self.m_indices[name]]
+
+
 
 cdef public class RenderStates[type PyRenderStatesType, object PyRenderStatesObject]:
     DEFAULT = wrap_renderstates(<sf.RenderStates*>&sf.renderstates.Default, False)
@@ -1182,15 +2441,46 @@ cdef api RenderStates wrap_renderstates(sf.RenderStates *p, bint d):
 
     return r
 
+cdef void rewrap_renderstates(RenderStates r, sf.RenderStates *p):
+    # points an existing wrapper at other states, creating wrappers for
+    # the transform, texture and shader only when they can't be reused
+    r.p_this = p
+
+    if Py_REFCNT(r.m_transform) == 1:
+        r.m_transform.p_this = &p.transform
+    else:
+        r.m_transform = wrap_transform(&p.transform, False)
+
+    if not p.texture:
+        r.m_texture = None
+    elif r.m_texture is None or r.m_texture.p_this != p.texture:
+        r.m_texture = wrap_texture(<sf.Texture*>p.texture, False)
+
+    if not p.shader:
+        r.m_shader = None
+    elif r.m_shader is None or r.m_shader.p_this != p.shader:
+        r.m_shader = wrap_shader(<sf.Shader*>p.shader, False)
+
 cdef public class Drawable[type PyDrawableType, object PyDrawableObject]:
     cdef sf.Drawable *p_drawable
 
+    # called by sf::Drawable::draw(); Cython subclasses may point it to a
+    # function of their own after Drawable.__init__() to skip the Python
+    # call and the wrappers entirely
+    cdef int (*p_render)(object, sf.RenderTarget*, sf.RenderStates*) except -1
+
+    cdef object       m_draw
+    cdef RenderTarget m_target
+    cdef RenderStates m_states
+
     def __init__(self, *args, **kwargs):
         if self.__class__ == Drawable:
             raise NotImplementedError('Drawable is abstact')
 
         if self.p_drawable is NULL:
             self.p_drawable = <sf.Drawable*>new DerivableDrawable(self)
+            self.p_render = render_python_drawable
+            self.m_draw = getattr(type(self), 'draw')
 
     def __dealloc__(self):
         if self.p_drawable is not NULL:
@@ -1199,6 +2489,39 @@ cdef public class Drawable[type PyDrawableType, object PyDrawableObject]:
     def draw(self, RenderTarget target, RenderStates states):
         pass
 
+cdef int render_python_drawable(object drawable, sf.RenderTarget *target, sf.RenderStates *states) except -1:
+    cdef Drawable self = <Drawable>drawable
+
+    # the wrappers of the previous call are reused unless something else
+    # kept a reference to them
+    if self.m_target is None or Py_REFCNT(self.m_target) > 1:
+        self.m_target = wrap_rendertarget(target)
+    else:
+        self.m_target.p_rendertarget = target
+
+    if self.m_states is None or Py_REFCNT(self.m_states) > 1:
+        self.m_states = wrap_renderstates(states, False)
+    else:
+        rewrap_renderstates(self.m_states, states)
+
+    self.m_draw(self, self.m_target, self.m_states)
+    return 0
+
+cdef api int call_drawable(object drawable, sf.RenderTarget *target, sf.RenderStates *states) except -1:
+    cdef Drawable self = <Drawable>drawable
+    cdef RenderStats stats = find_render_stats(target)
+
+    if stats is None:
+        return self.p_render(drawable, target, states)
+
+    # timed by the render statistics of the target
+    stats.begin_callback()
+
+    try:
+        return self.p_render(drawable, target, states)
+    finally:
+        stats.end_callback(drawable)
+
 cdef class Transformable:
     cdef sf.Transformable *p_this
 
@@ -1711,8 +3034,39 @@ cdef Vertex wrap_vertex(sf.Vertex* p, bint d=True):
     return r
 
 
+# Struct layout of sf::Vertex as seen through the buffer protocol; it
+# lets NumPy (or any PEP 3118 consumer) view the vertices as a
+# structured array without copying them.
+cdef char* VERTEX_FORMAT = "T{(2)f:position:(4)B:color:(2)f:tex_coords:}"
+
+cdef void copy_vector2f(sf.Vertex *vertices, Py_ssize_t count, bint tex_coords, StridedView source) nogil:
+    cdef sf.Vector2f *field
+    cdef Py_ssize_t i
+
+    for i in range(count):
+        if tex_coords:
+            field = &vertices[i].texCoords
+        else:
+            field = &vertices[i].position
+
+        field.x = <float>strided_get(&source, i, 0)
+        field.y = <float>strided_get(&source, i, 1)
+
+cdef void copy_color(sf.Vertex *vertices, Py_ssize_t count, StridedView source) nogil:
+    cdef Py_ssize_t i
+
+    for i in range(count):
+        vertices[i].color.r = <Uint8>strided_get(&source, i, 0)
+        vertices[i].color.g = <Uint8>strided_get(&source, i, 1)
+        vertices[i].color.b = <Uint8>strided_get(&source, i, 2)
+        vertices[i].color.a = <Uint8>strided_get(&source, i, 3)
+
+
 cdef class VertexArray(Drawable):
     cdef sf.VertexArray *p_this
+    cdef Py_ssize_t      m_shape
+    cdef Py_ssize_t      m_strides
+    cdef int             m_exports
 
     def __init__(self, sf.primitivetype.PrimitiveType type = sf.primitivetype.Points, unsigned int vertex_count=0):
         if self.p_this is NULL:
@@ -1740,20 +3094,199 @@ cdef class VertexArray(Drawable):
     def __setitem__(self, unsigned int index, Vertex key):
         self.p_this[0][index] = key.p_this[0]
 
-    def clear(self):
-        self.p_this.clear()
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        cdef unsigned int count = self.p_this.getVertexCount()
 
-    def resize(self, unsigned int vertex_count):
-        self.p_this.resize(vertex_count)
+        self.m_shape = count
+        self.m_strides = sizeof(sf.Vertex)
 
-    def append(self, Vertex vertex):
-        self.p_this.append(vertex.p_this[0])
+        if count > 0:
+            buffer.buf = <char*>&self.p_this[0][0]
+        else:
+            buffer.buf = NULL
 
-    property primitive_type:
-        def __get__(self):
-            return self.p_this.getPrimitiveType()
+        if flags & PyBUF_FORMAT:
+            buffer.format = VERTEX_FORMAT
+        else:
+            buffer.format = NULL
 
-        def __set__(self, sf.primitivetype.PrimitiveType primitive_type):
+        buffer.internal = NULL
+        buffer.itemsize = sizeof(sf.Vertex)
+        buffer.len = count * sizeof(sf.Vertex)
+        buffer.ndim = 1
+        buffer.obj = self
+        buffer.readonly = 0
+        buffer.shape = &self.m_shape if flags & PyBUF_ND else NULL
+        buffer.strides = &self.m_strides if flags & PyBUF_STRIDES else NULL
+        buffer.suboffsets = NULL
+
+        self.m_exports += 1
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        self.m_exports -= 1
+
+    cdef int _check_exports(self) except -1:
+        # the vertices can't be reallocated while a view is pointing at
+        # them
+        if self.m_exports > 0:
+            raise BufferError("Existing exports of data: vertex array cannot be re-sized")
+
+        return 0
+
+    def clear(self):
+        self._check_exports()
+        self.p_this.clear()
+
+    def resize(self, unsigned int vertex_count):
+        self._check_exports()
+        self.p_this.resize(vertex_count)
+
+    def append(self, Vertex vertex):
+        self._check_exports()
+        self.p_this.append(vertex.p_this[0])
+
+    def extend(self, vertices=None, positions=None, colors=None, tex_coords=None):
+        self._fill(False, vertices, positions, colors, tex_coords)
+
+    def assign(self, vertices=None, positions=None, colors=None, tex_coords=None):
+        self._fill(True, vertices, positions, colors, tex_coords)
+
+    cdef _fill(self, bint replace, vertices, positions, colors, tex_coords):
+        # Every source is either a buffer-protocol object, copied in a
+        # single native loop, or a plain iterable (of Vertex for
+        # vertices, of pairs or Color for the others) converted upfront.
+        # Sources are all validated before the array is touched so a bad
+        # argument never leaves it half-filled.
+        cdef Py_buffer vertex_view
+        cdef bint vertex_view_acquired = False
+        cdef vector[sf.Vertex] vertex_list
+        cdef vector[sf.Vector2f] position_list
+        cdef vector[sf.Color] color_list
+        cdef vector[sf.Vector2f] tex_coords_list
+        cdef StridedBuffer position_buffer = None
+        cdef StridedBuffer color_buffer = None
+        cdef StridedBuffer tex_coords_buffer = None
+        cdef Color single_color = None
+        cdef unsigned int start
+        cdef Py_ssize_t count = -1
+        cdef Py_ssize_t i
+        cdef bint recolor = False
+        cdef sf.Vertex *p
+
+        counts = []
+
+        try:
+            if vertices is not None:
+                if PyObject_CheckBuffer(vertices):
+                    PyObject_GetBuffer(vertices, &vertex_view, PyBUF_ND)
+                    vertex_view_acquired = True
+
+                    if vertex_view.itemsize != sizeof(sf.Vertex):
+                        raise TypeError("The vertices buffer must be made of {0} bytes items".format(sizeof(sf.Vertex)))
+
+                    counts.append(vertex_view.len // sizeof(sf.Vertex))
+                else:
+                    for vertex in vertices:
+                        vertex_list.push_back((<Vertex?>vertex).p_this[0])
+                    counts.append(vertex_list.size())
+
+            if positions is not None:
+                if PyObject_CheckBuffer(positions):
+                    position_buffer = get_strided_buffer(positions, 2, b"fd")
+                    counts.append(position_buffer.data.rows)
+                else:
+                    for position in positions:
+                        position_list.push_back(to_vector2f(position))
+                    counts.append(position_list.size())
+
+            if isinstance(colors, Color):
+                single_color = <Color>colors
+            elif colors is not None:
+                if PyObject_CheckBuffer(colors):
+                    color_buffer = get_strided_buffer(colors, 4, b"B")
+                    counts.append(color_buffer.data.rows)
+                else:
+                    for color in colors:
+                        color_list.push_back((<Color?>color).p_this[0])
+                    counts.append(color_list.size())
+
+            if tex_coords is not None:
+                if PyObject_CheckBuffer(tex_coords):
+                    tex_coords_buffer = get_strided_buffer(tex_coords, 2, b"fd")
+                    counts.append(tex_coords_buffer.data.rows)
+                else:
+                    for tex_coord in tex_coords:
+                        tex_coords_list.push_back(to_vector2f(tex_coord))
+                    counts.append(tex_coords_list.size())
+
+            if counts:
+                if counts.count(counts[0]) != len(counts):
+                    raise ValueError("All the sources must provide the same number of vertices")
+                count = counts[0]
+            elif single_color is not None:
+                # a lone color recolors the existing vertices in place,
+                # keeping their positions and texture coordinates
+                recolor = replace
+                count = self.p_this.getVertexCount() if replace else 0
+            else:
+                raise TypeError("No vertices, positions, colors or texture coordinates provided")
+
+            if recolor:
+                start = 0
+            else:
+                # checked late on purpose: a source may be a view of this
+                # very array
+                self._check_exports()
+
+                if replace:
+                    self.p_this.clear()
+
+                start = self.p_this.getVertexCount()
+                self.p_this.resize(start + count)
+
+            if count == 0:
+                return
+
+            p = &self.p_this[0][start]
+
+            if vertex_view_acquired:
+                memcpy(p, vertex_view.buf, count * sizeof(sf.Vertex))
+            elif vertices is not None:
+                memcpy(p, &vertex_list[0], count * sizeof(sf.Vertex))
+
+            if position_buffer is not None:
+                with nogil: copy_vector2f(p, count, False, position_buffer.data)
+            elif positions is not None:
+                for i in range(count):
+                    p[i].position = position_list[i]
+
+            if single_color is not None:
+                for i in range(count):
+                    p[i].color = single_color.p_this[0]
+            elif color_buffer is not None:
+                with nogil: copy_color(p, count, color_buffer.data)
+            elif colors is not None:
+                for i in range(count):
+                    p[i].color = color_list[i]
+
+            if tex_coords_buffer is not None:
+                with nogil: copy_vector2f(p, count, True, tex_coords_buffer.data)
+            elif tex_coords is not None:
+                for i in range(count):
+                    p[i].texCoords = tex_coords_list[i]
+        finally:
+            if vertex_view_acquired:
+                PyBuffer_Release(&vertex_view)
+
+    property vertices:
+        def __get__(self):
+            return memoryview(self)
+
+    property primitive_type:
+        def __get__(self):
+            return self.p_this.getPrimitiveType()
+
+        def __set__(self, sf.primitivetype.PrimitiveType primitive_type):
             self.p_this.setPrimitiveType(primitive_type)
 
     property bounds:
@@ -1762,6 +3295,688 @@ cdef class VertexArray(Drawable):
             return wrap_floatrect(&p)
 
 
+cdef class VertexBuffer(Drawable):
+    STREAM = VertexBufferStream
+    DYNAMIC = VertexBufferDynamic
+    STATIC = VertexBufferStatic
+
+    cdef NativeVertexBuffer *p_this
+
+    def __init__(self, sf.primitivetype.PrimitiveType type=sf.primitivetype.Points, VertexBufferUsage usage=VertexBufferStream, size_t vertex_count=0):
+        if self.p_this is NULL:
+            self.p_this = new NativeVertexBuffer(type, usage)
+            self.p_drawable = <sf.Drawable*>self.p_this
+
+            self.create(vertex_count)
+
+    def __dealloc__(self):
+        self.p_drawable = NULL
+
+        if self.p_this is not NULL:
+            del self.p_this
+
+    def __repr__(self):
+        return "VertexBuffer(length={0}, primitive_type={1}, usage={2})".format(len(self), self.primitive_type, self.usage)
+
+    def __len__(self):
+        return self.p_this.getVertexCount()
+
+    def create(self, size_t vertex_count):
+        if not self.p_this.create(vertex_count):
+            raise IOError(popLastErrorMessage())
+
+    def update(self, vertices, unsigned int offset=0):
+        # vertices is either a buffer of sf::Vertex records (a
+        # VertexArray, a structured NumPy array, ...) or an iterable of
+        # Vertex
+        cdef Py_buffer view
+        cdef vector[sf.Vertex] vertex_list
+        cdef bint success
+
+        if isinstance(vertices, VertexBuffer):
+            success = self.p_this.update((<VertexBuffer>vertices).p_this[0])
+        elif PyObject_CheckBuffer(vertices):
+            PyObject_GetBuffer(vertices, &view, PyBUF_ND)
+
+            try:
+                if view.itemsize != sizeof(sf.Vertex):
+                    raise TypeError("The vertices buffer must be made of {0} bytes items".format(sizeof(sf.Vertex)))
+
+                if view.len == 0:
+                    return
+
+                success = self.p_this.update(<const sf.Vertex*>view.buf, view.len // sizeof(sf.Vertex), offset)
+            finally:
+                PyBuffer_Release(&view)
+        else:
+            for vertex in vertices:
+                vertex_list.push_back((<Vertex?>vertex).p_this[0])
+
+            if vertex_list.empty():
+                return
+
+            success = self.p_this.update(&vertex_list[0], vertex_list.size(), offset)
+
+        if not success:
+            raise ValueError("Unable to update the vertex buffer (not created or range out of bounds)")
+
+    property primitive_type:
+        def __get__(self):
+            return self.p_this.getPrimitiveType()
+
+        def __set__(self, sf.primitivetype.PrimitiveType primitive_type):
+            self.p_this.setPrimitiveType(primitive_type)
+
+    property usage:
+        def __get__(self):
+            return self.p_this.getUsage()
+
+        def __set__(self, VertexBufferUsage usage):
+            self.p_this.setUsage(usage)
+
+    property native_handle:
+        def __get__(self):
+            return self.p_this.getNativeHandle()
+
+    @staticmethod
+    def is_available():
+        return isVertexBufferAvailable()
+
+
+cdef class SpriteBatch(Drawable):
+    cdef NativeSpriteBatch *p_this
+    cdef list               m_textures
+
+    def __init__(self):
+        if self.p_this is NULL:
+            self.p_this = new NativeSpriteBatch()
+            self.p_drawable = <sf.Drawable*>self.p_this
+
+            self.m_textures = []
+
+    def __dealloc__(self):
+        self.p_drawable = NULL
+
+        if self.p_this is not NULL:
+            del self.p_this
+
+    def __repr__(self):
+        return "SpriteBatch(sprite_count={0}, draw_calls={1})".format(self.sprite_count, self.draw_calls)
+
+    def __len__(self):
+        return self.p_this.getSpriteCount()
+
+    def clear(self):
+        self.p_this.clear()
+        self.m_textures = []
+
+    def add(self, Texture texture, position, rectangle=None, float rotation=0, scale=(1, 1), origin=(0, 0), Color color=None, BlendMode blend_mode=None):
+        cdef sf.FloatRect texture_rect
+
+        if rectangle is None:
+            texture_rect = sf.FloatRect(0, 0, texture.p_this.getSize().x, texture.p_this.getSize().y)
+        else:
+            texture_rect = to_floatrect(rectangle)
+
+        self._keep(texture)
+
+        self.p_this.add(texture.p_this,
+                        blend_mode.p_this[0] if blend_mode else sf.BlendAlpha,
+                        texture_rect, to_vector2f(position), rotation,
+                        to_vector2f(scale), to_vector2f(origin),
+                        color.p_this[0] if color else sf.Color(255, 255, 255, 255))
+
+    def add_many(self, Texture texture, positions, rectangles=None, rotations=None, scales=None, origins=None, colors=None, BlendMode blend_mode=None):
+        # positions is a (count, 2) buffer or an iterable of pairs; each
+        # other argument is either a buffer with one row per sprite or a
+        # single value shared by all of them
+        cdef double rectangle_values[4]
+        cdef double rotation_values[1]
+        cdef double scale_values[2]
+        cdef double origin_values[2]
+        cdef double color_values[4]
+        cdef vector[double] position_list
+        cdef StridedView position_view, rectangle_view, rotation_view
+        cdef StridedView scale_view, origin_view, color_view
+        cdef sf.BlendMode blend = blend_mode.p_this[0] if blend_mode else sf.BlendAlpha
+        cdef const sf.Texture *texture_ptr = texture.p_this
+        cdef Py_ssize_t count, i
+
+        rectangle_values[0] = rectangle_values[1] = 0
+        rectangle_values[2] = texture.p_this.getSize().x
+        rectangle_values[3] = texture.p_this.getSize().y
+        rotation_values[0] = 0
+        scale_values[0] = scale_values[1] = 1
+        origin_values[0] = origin_values[1] = 0
+        color_values[0] = color_values[1] = color_values[2] = color_values[3] = 255
+
+        if PyObject_CheckBuffer(positions):
+            keep_positions = get_strided_view(positions, 2, b"fdi", NULL, &position_view)
+        else:
+            for x, y in positions:
+                position_list.push_back(x)
+                position_list.push_back(y)
+
+            if position_list.empty():
+                return
+
+            position_view.buf = <const char*>&position_list[0]
+            position_view.rows = position_list.size() // 2
+            position_view.row_stride = 2 * sizeof(double)
+            position_view.item_stride = sizeof(double)
+            position_view.type = b'd'
+
+        keep_rectangles = get_strided_view(rectangles, 4, b"fdi", rectangle_values, &rectangle_view)
+        keep_rotations = get_strided_view(rotations, 1, b"fd", rotation_values, &rotation_view)
+        keep_scales = get_strided_view(scales, 2, b"fd", scale_values, &scale_view)
+        keep_origins = get_strided_view(origins, 2, b"fd", origin_values, &origin_view)
+        keep_colors = get_strided_view(colors, 4, b"B", color_values, &color_view)
+
+        count = position_view.rows
+
+        for rows in (rectangle_view.rows, rotation_view.rows, scale_view.rows, origin_view.rows, color_view.rows):
+            if rows != -1 and rows != count:
+                raise ValueError("All the buffers must provide one row per sprite")
+
+        self._keep(texture)
+
+        with nogil:
+            for i in range(count):
+                self.p_this.add(texture_ptr, blend,
+                    sf.FloatRect(strided_get(&rectangle_view, i, 0), strided_get(&rectangle_view, i, 1),
+                                 strided_get(&rectangle_view, i, 2), strided_get(&rectangle_view, i, 3)),
+                    sf.Vector2f(strided_get(&position_view, i, 0), strided_get(&position_view, i, 1)),
+                    strided_get(&rotation_view, i, 0),
+                    sf.Vector2f(strided_get(&scale_view, i, 0), strided_get(&scale_view, i, 1)),
+                    sf.Vector2f(strided_get(&origin_view, i, 0), strided_get(&origin_view, i, 1)),
+                    sf.Color(<Uint8>strided_get(&color_view, i, 0), <Uint8>strided_get(&color_view, i, 1),
+                             <Uint8>strided_get(&color_view, i, 2), <Uint8>strided_get(&color_view, i, 3)))
+
+    cdef _keep(self, Texture texture):
+        # the batch only stores texture pointers, make sure they outlive
+        # it (a handful of textures are involved at most)
+        for kept in self.m_textures:
+            if kept is texture:
+                return
+
+        self.m_textures.append(texture)
+
+    property sprite_count:
+        def __get__(self):
+            return self.p_this.getSpriteCount()
+
+    property draw_calls:
+        def __get__(self):
+            return self.p_this.getBatchCount()
+
+    property saved_draw_calls:
+        def __get__(self):
+            return self.p_this.getSpriteCount() - self.p_this.getBatchCount()
+
+
+cdef class TextBatchItem:
+    cdef bytes        data
+    cdef sf.Vector2f  position
+    cdef sf.Color     color
+    cdef unsigned int character_size
+    cdef Uint32       style
+    # range of vertices reserved for the text in the array of its size
+    cdef size_t       offset, capacity, count
+
+
+cdef class TextBatch(Drawable):
+    cdef NativeTextBatch  *p_this
+    cdef Font              m_font
+    cdef list              m_items
+    cdef dict              m_used
+    cdef vector[sf.Vertex] m_scratch
+
+    def __init__(self, Font font):
+        if self.p_this is NULL:
+            self.p_this = new NativeTextBatch()
+            self.p_drawable = <sf.Drawable*>self.p_this
+
+        self.m_items = []
+        self.m_used = {}
+        self.font = font
+
+    def __dealloc__(self):
+        self.p_drawable = NULL
+
+        if self.p_this is not NULL:
+            del self.p_this
+
+    def __repr__(self):
+        return "TextBatch(font={0}, text_count={1}, draw_calls={2})".format(id(self.m_font), len(self), self.draw_calls)
+
+    def __len__(self):
+        return len(self.m_items)
+
+    def append(self, string, position, Color color=None, unsigned int character_size=30, Uint32 style=0):
+        cdef TextBatchItem item = TextBatchItem.__new__(TextBatchItem)
+
+        self.set_item(item, string, position, color, character_size, style)
+        self.m_items.append(item)
+
+    def set(self, Py_ssize_t index, string, position, Color color=None, unsigned int character_size=30, Uint32 style=0):
+        """ Replace the text at the index and return whether its vertices
+        had to be updated. """
+        return self.set_item(self.m_items[index], string, position, color, character_size, style)
+
+    def assign(self, texts):
+        """ Make the batch hold the given texts, usually once per frame.
+        Each text is a (string, position[, color[, character_size[, style]]])
+        tuple; only the ones that differ from the text previously at the
+        same index are rebuilt. Return the number of texts rebuilt. """
+        cdef size_t count = 0, rebuilt = 0
+
+        for text in texts:
+            content, position = text[0], text[1]
+            color = text[2] if len(text) > 2 else None
+            character_size = text[3] if len(text) > 3 else 30
+            style = text[4] if len(text) > 4 else 0
+
+            if count < len(self.m_items):
+                rebuilt += self.set_item(self.m_items[count], content, position, color, character_size, style)
+            else:
+                self.append(content, position, color, character_size, style)
+                rebuilt += 1
+
+            count += 1
+
+        self.truncate(count)
+        return rebuilt
+
+    def truncate(self, size_t count):
+        cdef TextBatchItem item
+
+        for item in self.m_items[count:]:
+            self.release(item)
+
+        del self.m_items[count:]
+
+    def clear(self):
+        self.p_this.clear()
+        self.m_items = []
+        self.m_used = {}
+
+    cdef bint set_item(self, TextBatchItem item, string, position, Color color, unsigned int character_size, Uint32 style) except -1:
+        cdef bytes data = encode_utf32(string)
+        cdef sf.Vector2f p = to_vector2f(position)
+        cdef sf.Color c = color.p_this[0] if color else sf.Color(255, 255, 255, 255)
+
+        if item.data is None or data != item.data or character_size != item.character_size or style != item.style:
+            if item.data is not None and character_size != item.character_size:
+                self.release(item)
+
+            item.data = data
+            item.position = p
+            item.color = c
+            item.character_size = character_size
+            item.style = style
+
+            self.build(item)
+            self.place(item)
+
+        elif p.x != item.position.x or p.y != item.position.y or not (c == item.color):
+            self.retouch(item, p, c)
+
+        else:
+            return False
+
+        return True
+
+    cdef int build(self, TextBatchItem item) except -1:
+        # same quads as sf::Text, already moved to the text position
+        cdef const Uint32 *text = <const Uint32*><char*>item.data
+        cdef size_t length = len(item.data) // 4, i
+        cdef unsigned int size = item.character_size
+        cdef bint bold = item.style & sf.text.Bold
+        cdef float italic = 0.208 if item.style & sf.text.Italic else 0.
+        cdef float vspace = self.m_font.p_this.getLineSpacing(size)
+        cdef float x = 0, y = size
+        cdef float left, top, right, bottom, u1, v1, u2, v2
+        cdef Uint32 previous = 0, current
+        cdef GlyphMetrics *metrics
+        cdef sf.Vertex vertex
+
+        self.m_scratch.clear()
+        vertex.color = item.color
+
+        for i in range(length):
+            current = text[i]
+            x += self.m_font.p_this.getKerning(previous, current, size)
+            previous = current
+
+            if current == CHAR_NEWLINE:
+                y += vspace
+                x = 0
+                continue
+
+            if current == CHAR_SPACE or current == CHAR_TAB:
+                x += self.m_font.get_whitespace_advance(current, size, bold)
+                continue
+
+            metrics = self.m_font.get_metrics(current, size, bold)
+
+            left = item.position.x + x + metrics.left
+            top = item.position.y + y + metrics.top
+            right = left + metrics.width
+            bottom = top + metrics.height
+
+            u1 = metrics.texture_left
+            v1 = metrics.texture_top
+            u2 = u1 + metrics.texture_width
+            v2 = v1 + metrics.texture_height
+
+            vertex.position = sf.Vector2f(left - italic * metrics.top, top)
+            vertex.texCoords = sf.Vector2f(u1, v1)
+            self.m_scratch.push_back(vertex)
+
+            vertex.position = sf.Vector2f(right - italic * metrics.top, top)
+            vertex.texCoords = sf.Vector2f(u2, v1)
+            self.m_scratch.push_back(vertex)
+
+            vertex.position = sf.Vector2f(right - italic * (metrics.top + metrics.height), bottom)
+            vertex.texCoords = sf.Vector2f(u2, v2)
+            self.m_scratch.push_back(vertex)
+
+            vertex.position = sf.Vector2f(left - italic * (metrics.top + metrics.height), bottom)
+            vertex.texCoords = sf.Vector2f(u1, v2)
+            self.m_scratch.push_back(vertex)
+
+            x += metrics.advance
+
+        return 0
+
+    cdef int place(self, TextBatchItem item) except -1:
+        # rewrite the text in place when it still fits in its range,
+        # otherwise move it to the end of the array
+        cdef vector[sf.Vertex] *vertices = &self.p_this.getVertices(item.character_size)
+        cdef size_t count = self.m_scratch.size()
+        cdef size_t used = self.m_used.get(item.character_size, 0) + count - item.count
+        cdef size_t i
+
+        if count > item.capacity:
+            self.erase(vertices, item.offset, item.capacity)
+            item.capacity = 0
+
+            if vertices.size() > 1024 and vertices.size() > 2 * used:
+                self.compact(vertices, item)
+
+            item.offset = vertices.size()
+            item.capacity = count
+            vertices.resize(item.offset + count)
+
+        for i in range(count):
+            vertices[0][item.offset + i] = self.m_scratch[i]
+
+        self.erase(vertices, item.offset + count, item.capacity - count)
+
+        item.count = count
+        self.m_used[item.character_size] = used
+        return 0
+
+    cdef void retouch(self, TextBatchItem item, sf.Vector2f position, sf.Color color):
+        cdef vector[sf.Vertex] *vertices = &self.p_this.getVertices(item.character_size)
+        cdef float dx = position.x - item.position.x
+        cdef float dy = position.y - item.position.y
+        cdef size_t i
+
+        for i in range(item.offset, item.offset + item.count):
+            vertices[0][i].position.x += dx
+            vertices[0][i].position.y += dy
+            vertices[0][i].color = color
+
+        item.position = position
+        item.color = color
+
+    cdef int release(self, TextBatchItem item) except -1:
+        cdef vector[sf.Vertex] *vertices = &self.p_this.getVertices(item.character_size)
+
+        self.erase(vertices, item.offset, item.capacity)
+        self.m_used[item.character_size] = self.m_used.get(item.character_size, 0) - item.count
+
+        item.offset = item.capacity = item.count = 0
+        return 0
+
+    cdef void erase(self, vector[sf.Vertex] *vertices, size_t offset, size_t count):
+        # collapsed quads aren't rasterized
+        cdef sf.Vertex empty
+        cdef size_t i
+
+        for i in range(offset, offset + count):
+            vertices[0][i] = empty
+
+    cdef int compact(self, vector[sf.Vertex] *vertices, TextBatchItem moving) except -1:
+        cdef vector[sf.Vertex] packed
+        cdef TextBatchItem item
+        cdef size_t i
+
+        for item in self.m_items:
+            if item is moving or item.character_size != moving.character_size:
+                continue
+
+            if item.count == 0:
+                # its old range is gone with the unpacked array
+                item.offset = item.capacity = 0
+                continue
+
+            for i in range(item.offset, item.offset + item.count):
+                packed.push_back(vertices[0][i])
+
+            item.offset = packed.size() - item.count
+            item.capacity = item.count
+
+        vertices.swap(packed)
+        return 0
+
+    property font:
+        def __get__(self):
+            return self.m_font
+
+        def __set__(self, Font font):
+            cdef TextBatchItem item
+
+            if font is None:
+                raise TypeError("A text batch requires a font")
+
+            self.m_font = font
+            self.p_this.setFont(font.p_this)
+
+            self.p_this.clear()
+            self.m_used = {}
+
+            for item in self.m_items:
+                item.offset = item.capacity = item.count = 0
+                self.build(item)
+                self.place(item)
+
+    property text_count:
+        def __get__(self):
+            return len(self.m_items)
+
+    property vertex_count:
+        def __get__(self):
+            return self.p_this.getVertexCount()
+
+    property draw_calls:
+        def __get__(self):
+            return self.p_this.getDrawCount()
+
+
+cdef object wrap_ids(vector[Int64]& ids):
+    cdef array.array r = array.clone(array.array('q'), ids.size(), False)
+
+    if not ids.empty():
+        memcpy(r.data.as_voidptr, &ids[0], ids.size() * sizeof(Int64))
+
+    return r
+
+cdef int check_finite_rect(const sf.FloatRect& rectangle) except -1:
+    # the index can't place infinite or NaN rectangles on its grid
+    if not (isfinite(rectangle.left) and isfinite(rectangle.top) and
+            isfinite(rectangle.left + rectangle.width) and isfinite(rectangle.top + rectangle.height)):
+        raise ValueError("The rectangle must be finite")
+
+    return 0
+
+cdef class SpatialIndex:
+    cdef NativeSpatialIndex *p_this
+
+    def __init__(self, float cell_size=128):
+        if not (cell_size > 0 and isfinite(cell_size)):
+            raise ValueError("The cell size must be positive")
+
+        if self.p_this is NULL:
+            self.p_this = new NativeSpatialIndex(cell_size)
+
+    def __dealloc__(self):
+        if self.p_this is not NULL:
+            del self.p_this
+
+    def __repr__(self):
+        return "SpatialIndex(length={0}, cell_size={1})".format(len(self), self.cell_size)
+
+    def __len__(self):
+        return self.p_this.getSize()
+
+    def __contains__(self, Int64 id):
+        return self.p_this.contains(id)
+
+    property cell_size:
+        def __get__(self):
+            return self.p_this.getCellSize()
+
+    def insert(self, Int64 id, bounds):
+        # inserting an id already in the index updates its bounds
+        cdef sf.FloatRect rectangle = to_floatrect(bounds)
+
+        check_finite_rect(rectangle)
+        self.p_this.insert(id, rectangle)
+
+    def insert_many(self, ids, bounds):
+        # ids is an int32/int64 buffer or an iterable of integers, bounds
+        # a (count, 4) buffer of (left, top, width, height) or an
+        # iterable of rectangles
+        cdef vector[Int64] id_list
+        cdef vector[sf.FloatRect] bounds_list
+        cdef StridedBuffer id_buffer = None
+        cdef StridedBuffer bounds_buffer = None
+        cdef Py_ssize_t count, i
+
+        if PyObject_CheckBuffer(ids):
+            id_buffer = get_strided_buffer(ids, 1, b"ilq")
+            count = id_buffer.data.rows
+        else:
+            for id in ids:
+                id_list.push_back(id)
+            count = id_list.size()
+
+        if PyObject_CheckBuffer(bounds):
+            bounds_buffer = get_strided_buffer(bounds, 4, b"fdi")
+            if bounds_buffer.data.rows != count:
+                raise ValueError("There must be as many bounds as ids")
+        else:
+            for rectangle in bounds:
+                bounds_list.push_back(to_floatrect(rectangle))
+            if <Py_ssize_t>bounds_list.size() != count:
+                raise ValueError("There must be as many bounds as ids")
+
+        if id_buffer is not None:
+            id_list.resize(count)
+            for i in range(count):
+                id_list[i] = strided_get_integer(&id_buffer.data, i)
+
+        if bounds_buffer is not None:
+            bounds_list.resize(count)
+            for i in range(count):
+                bounds_list[i] = sf.FloatRect(
+                    strided_get(&bounds_buffer.data, i, 0), strided_get(&bounds_buffer.data, i, 1),
+                    strided_get(&bounds_buffer.data, i, 2), strided_get(&bounds_buffer.data, i, 3))
+
+        for i in range(count):
+            check_finite_rect(bounds_list[i])
+
+        with nogil:
+            for i in range(count):
+                self.p_this.insert(id_list[i], bounds_list[i])
+
+    def update(self, Int64 id, bounds):
+        self.insert(id, bounds)
+
+    def update_many(self, ids, bounds):
+        self.insert_many(ids, bounds)
+
+    def remove(self, Int64 id):
+        if not self.p_this.remove(id):
+            raise KeyError(id)
+
+    def remove_many(self, ids):
+        # unknown ids are ignored
+        cdef vector[Int64] id_list
+        cdef StridedBuffer id_buffer
+        cdef Py_ssize_t i
+
+        if PyObject_CheckBuffer(ids):
+            id_buffer = get_strided_buffer(ids, 1, b"ilq")
+            for i in range(id_buffer.data.rows):
+                id_list.push_back(strided_get_integer(&id_buffer.data, i))
+        else:
+            for id in ids:
+                id_list.push_back(id)
+
+        with nogil:
+            for i in range(<Py_ssize_t>id_list.size()):
+                self.p_this.remove(id_list[i])
+
+    def clear(self):
+        self.p_this.clear()
+
+    def get_bounds(self, Int64 id):
+        cdef sf.FloatRect bounds
+
+        if not self.p_this.getBounds(id, bounds):
+            raise KeyError(id)
+
+        return wrap_floatrect(&bounds)
+
+    def query(self, rectangle):
+        # ids whose bounds intersect rectangle, as an array.array('q')
+        cdef vector[Int64] ids
+        cdef sf.FloatRect area = to_floatrect(rectangle)
+
+        check_finite_rect(area)
+
+        with nogil:
+            self.p_this.queryRect(area, ids)
+
+        return wrap_ids(ids)
+
+    def query_point(self, point):
+        # ids whose bounds contain point, as an array.array('q')
+        cdef vector[Int64] ids
+        cdef sf.Vector2f p = to_vector2f(point)
+
+        with nogil:
+            self.p_this.queryPoint(p.x, p.y, ids)
+
+        return wrap_ids(ids)
+
+    def query_view(self, View view):
+        # ids visible through view: its area is the bounding rectangle
+        # of the (possibly rotated) view in world coordinates
+        cdef vector[Int64] ids
+        cdef sf.FloatRect area = view_area(view.p_this[0])
+
+        check_finite_rect(area)
+
+        with nogil:
+            self.p_this.queryRect(area, ids)
+
+        return wrap_ids(ids)
+
+
 cdef class View:
     cdef sf.View      *p_this
     cdef RenderWindow  m_renderwindow
@@ -1846,6 +4061,11 @@ cdef class View:
         if self.m_rendertarget:
             self.m_rendertarget.view = self
 
+cdef sf.FloatRect view_area(const sf.View& view):
+    # the bounding rectangle, in world coordinates, of what the view
+    # shows (rotation included)
+    return view.getInverseTransform().transformRect(sf.FloatRect(-1, -1, 2, 2))
+
 cdef View wrap_view(sf.View *p):
     cdef View r = View.__new__(View)
     r.p_this = p
@@ -1864,6 +4084,326 @@ cdef View wrap_view_for_rendertarget(sf.View *p, RenderTarget rendertarget):
     return r
 
 
+cdef struct FrameStats:
+    Uint64 draw_calls
+    Uint64 vertices
+    Uint64 texture_changes
+    Uint64 shader_changes
+    Uint64 blend_changes
+    Uint64 callbacks
+    Int64  callback_time
+    Int64  frame_time
+
+cdef struct CallbackScope:
+    Int64 start
+    Int64 children
+
+# the statistics of the targets they're enabled for, keyed by the address
+# of the sf::RenderTarget so the wrappers handed to Drawable.draw() find
+# them as well
+cdef dict render_stats = {}
+
+cdef inline RenderStats find_render_stats(sf.RenderTarget *target):
+    if not render_stats:
+        return None
+
+    return render_stats.get(<size_t>target)
+
+cdef RenderStats enable_render_stats(sf.RenderTarget *target, size_t history):
+    cdef RenderStats stats = find_render_stats(target)
+
+    if stats is None:
+        stats = RenderStats(history)
+        render_stats[<size_t>target] = stats
+
+    return stats
+
+cdef void record_draw(sf.RenderTarget *target, Drawable drawable, RenderStates states, Uint64 vertex_count=0):
+    # the vertex counts are those of SFML 2.3, which draws a glyph or a
+    # sprite as a quad and a shape as a triangle fan plus an outline strip
+    cdef RenderStats stats = find_render_stats(target)
+    cdef const sf.RenderStates *p_states = &sf.renderstates.Default
+    cdef const sf.Texture *texture
+    cdef Uint64 draw_calls = 1
+    cdef Uint64 vertices = vertex_count
+    cdef unsigned int points
+
+    if stats is None:
+        return
+
+    if states is not None:
+        p_states = states.p_this
+
+    texture = p_states.texture
+
+    if isinstance(drawable, Sprite):
+        texture = (<Sprite>drawable).p_this.getTexture()
+        vertices = 4
+    elif isinstance(drawable, Text):
+        if (<Text>drawable).p_this.getFont() is not NULL:
+            texture = &(<Text>drawable).p_this.getFont().getTexture((<Text>drawable).p_this.getCharacterSize())
+
+        vertices = 4 * (<Text>drawable).p_this.getString().getSize()
+    elif isinstance(drawable, Shape):
+        texture = (<Shape>drawable).p_shape.getTexture()
+        points = (<Shape>drawable).p_shape.getPointCount()
+        vertices = points + 2
+
+        if (<Shape>drawable).p_shape.getOutlineThickness() != 0:
+            draw_calls += 1
+            vertices += (points + 1) * 2
+    elif isinstance(drawable, VertexArray):
+        vertices = (<VertexArray>drawable).p_this.getVertexCount()
+    elif isinstance(drawable, VertexBuffer):
+        if vertex_count == 0:
+            vertices = (<VertexBuffer>drawable).p_this.getVertexCount()
+    elif isinstance(drawable, SpriteBatch):
+        draw_calls = (<SpriteBatch>drawable).p_this.getBatchCount()
+        vertices = (<SpriteBatch>drawable).p_this.getSpriteCount() * 4
+    elif isinstance(drawable, TextBatch):
+        draw_calls = (<TextBatch>drawable).p_this.getDrawCount()
+        vertices = (<TextBatch>drawable).p_this.getVertexCount()
+    else:
+        # drawables implemented in Python issue their own draws through
+        # the target and are timed by their callback
+        return
+
+    stats.record(draw_calls, vertices, texture, p_states)
+
+cdef void end_render_frame(sf.RenderTarget *target):
+    cdef RenderStats stats = find_render_stats(target)
+
+    if stats is not None:
+        stats.end_frame()
+
+cdef inline Int64 frame_field(const FrameStats *frame, int index):
+    # in the order of RenderStats.FIELDS
+    if index == 0:
+        return frame.draw_calls
+    elif index == 1:
+        return frame.vertices
+    elif index == 2:
+        return frame.texture_changes
+    elif index == 3:
+        return frame.shader_changes
+    elif index == 4:
+        return frame.blend_changes
+    elif index == 5:
+        return frame.callbacks
+    elif index == 6:
+        return frame.callback_time
+
+    return frame.frame_time
+
+cdef class RenderStats:
+    """ Counters of a render target aggregated per frame, between two calls
+    to display(): draw calls, vertices, texture, shader and blend mode
+    changes, and the time spent in Drawable.draw() implemented in Python.
+    The last `history` frames are kept for history() and histogram(). """
+    FIELDS = ('draw_calls', 'vertices', 'texture_changes', 'shader_changes',
+              'blend_changes', 'callbacks', 'callback_time', 'frame_time')
+
+    cdef FrameStats            m_current
+    cdef FrameStats            m_last
+    cdef vector[FrameStats]    m_history
+    cdef size_t                m_head
+    cdef Uint64                m_frames
+    cdef sf.Clock              m_clock
+    cdef Int64                 m_frame_start
+    cdef vector[CallbackScope] m_scopes
+    cdef const sf.Texture     *m_texture
+    cdef const sf.Shader      *m_shader
+    cdef sf.BlendMode          m_blend_mode
+    cdef dict                  m_profile
+    cdef dict                  m_last_profile
+
+    def __init__(self, size_t history=120):
+        self.m_history.resize(history)
+        self.reset()
+
+    def __repr__(self):
+        return "RenderStats(frames={0}, draw_calls={1}, vertices={2}, frame_time={3})".format(self.frames, self.draw_calls, self.vertices, self.frame_time)
+
+    cdef void record(self, Uint64 draw_calls, Uint64 vertices, const sf.Texture *texture, const sf.RenderStates *states):
+        cdef sf.BlendMode blend_mode = states.blendMode
+
+        self.m_current.draw_calls += draw_calls
+        self.m_current.vertices += vertices
+
+        if texture != self.m_texture:
+            self.m_current.texture_changes += 1
+            self.m_texture = texture
+
+        if states.shader != self.m_shader:
+            self.m_current.shader_changes += 1
+            self.m_shader = states.shader
+
+        if blend_mode != self.m_blend_mode:
+            self.m_current.blend_changes += 1
+            self.m_blend_mode = blend_mode
+
+    cdef void begin_callback(self):
+        cdef CallbackScope scope
+
+        scope.start = self.m_clock.getElapsedTime().asMicroseconds()
+        scope.children = 0
+        self.m_scopes.push_back(scope)
+
+    cdef void end_callback(self, object drawable):
+        cdef CallbackScope scope
+        cdef CallbackScope *parent
+        cdef Int64 elapsed
+
+        # enabled from within a callback
+        if self.m_scopes.empty():
+            return
+
+        scope = self.m_scopes.back()
+        self.m_scopes.pop_back()
+        elapsed = self.m_clock.getElapsedTime().asMicroseconds() - scope.start
+
+        # nested callbacks are accounted to the outermost one, and each
+        # class is charged its own time only
+        if self.m_scopes.empty():
+            self.m_current.callback_time += elapsed
+        else:
+            parent = &self.m_scopes.back()
+            parent.children += elapsed
+
+        self.m_current.callbacks += 1
+
+        entry = self.m_profile.get(type(drawable))
+
+        if entry is None:
+            self.m_profile[type(drawable)] = [1, elapsed - scope.children]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed - scope.children
+
+    cdef void end_frame(self):
+        cdef Int64 now = self.m_clock.getElapsedTime().asMicroseconds()
+
+        self.m_current.frame_time = now - self.m_frame_start
+        self.m_frame_start = now
+
+        if self.m_history.size() > 0:
+            self.m_history[self.m_head] = self.m_current
+            self.m_head = (self.m_head + 1) % self.m_history.size()
+
+        self.m_frames += 1
+        self.m_last = self.m_current
+        memset(&self.m_current, 0, sizeof(FrameStats))
+
+        self.m_last_profile = self.m_profile
+        self.m_profile = {}
+
+    def reset(self):
+        memset(&self.m_current, 0, sizeof(FrameStats))
+        memset(&self.m_last, 0, sizeof(FrameStats))
+        self.m_head = 0
+        self.m_frames = 0
+        self.m_frame_start = self.m_clock.getElapsedTime().asMicroseconds()
+        self.m_scopes.clear()
+        self.m_texture = NULL
+        self.m_shader = NULL
+        self.m_blend_mode = sf.BlendMode()
+        self.m_profile = {}
+        self.m_last_profile = {}
+
+    def history(self, field='frame_time'):
+        """ Return the values of a field over the recorded frames, oldest
+        first, as an array of doubles; times are in microseconds. """
+        cdef array.array values
+        cdef size_t count = min(self.m_frames, self.m_history.size())
+        cdef size_t start = (self.m_head + self.m_history.size() - count) % max(self.m_history.size(), 1)
+        cdef size_t i
+        cdef int index
+
+        if field not in RenderStats.FIELDS:
+            raise ValueError("Unknown field: {0}".format(field))
+
+        index = RenderStats.FIELDS.index(field)
+        values = array.clone(array.array('d'), count, False)
+
+        for i in range(count):
+            values.data.as_doubles[i] = frame_field(&self.m_history[(start + i) % self.m_history.size()], index)
+
+        return values
+
+    def histogram(self, field='frame_time', unsigned int bins=16, low=None, high=None):
+        """ Return the (counts, edges) histogram of a field over the
+        recorded frames, with bins of equal width between low and high,
+        which default to the smallest and largest values. """
+        values = self.history(field)
+
+        if bins == 0:
+            raise ValueError("At least one bin is required")
+
+        if not values:
+            return [0] * bins, [0] * (bins + 1)
+
+        low = min(values) if low is None else low
+        high = max(values) if high is None else high
+        width = float(high - low) / bins or 1.0
+
+        counts = [0] * bins
+
+        for value in values:
+            if low <= value <= high:
+                counts[min(int((value - low) / width), bins - 1)] += 1
+
+        return counts, [low + i * width for i in range(bins + 1)]
+
+    property frames:
+        def __get__(self):
+            return self.m_frames
+
+    property draw_calls:
+        def __get__(self):
+            return self.m_last.draw_calls
+
+    property vertices:
+        def __get__(self):
+            return self.m_last.vertices
+
+    property texture_changes:
+        def __get__(self):
+            return self.m_last.texture_changes
+
+    property shader_changes:
+        def __get__(self):
+            return self.m_last.shader_changes
+
+    property blend_changes:
+        def __get__(self):
+            return self.m_last.blend_changes
+
+    property callbacks:
+        def __get__(self):
+            return self.m_last.callbacks
+
+    property callback_time:
+        def __get__(self):
+            cdef sf.Time* p = new sf.Time()
+            p[0] = sf.microseconds(self.m_last.callback_time)
+            return wrap_time(p)
+
+    property frame_time:
+        def __get__(self):
+            cdef sf.Time* p = new sf.Time()
+            p[0] = sf.microseconds(self.m_last.frame_time)
+            return wrap_time(p)
+
+    property drawables:
+        """ The Python drawables of the last frame as (class, calls,
+        microseconds) tuples, the most expensive first; the time of a
+        drawable excludes the time of the drawables it draws. """
+        def __get__(self):
+            profile = [(cls, entry[0], entry[1]) for cls, entry in self.m_last_profile.items()]
+            profile.sort(key=lambda item: item[2], reverse=True)
+            return profile
+
+
 cdef public class RenderTarget[type PyRenderTargetType, object PyRenderTargetObject]:
     cdef sf.RenderTarget *p_rendertarget
 
@@ -1924,6 +4464,24 @@ cdef public class RenderTarget[type PyRenderTargetType, object PyRenderTargetObj
         else:
             self.p_rendertarget.draw(drawable.p_drawable[0], states.p_this[0])
 
+        if render_stats:
+            record_draw(self.p_rendertarget, drawable, states)
+
+    def draw_many(self, drawables, RenderStates states=None, bint cull=True):
+        # draws a sequence of drawables with the same states, skipping
+        # (when cull is set) the sprites, shapes, texts and vertex arrays
+        # lying outside the current view; returns (drawn, culled)
+        return draw_many(self.p_rendertarget, drawables, states, cull)
+
+    def draw_vertex_buffer(self, VertexBuffer vertex_buffer, size_t first_vertex, size_t vertex_count, RenderStates states=None):
+        if not states:
+            drawVertexBuffer(self.p_rendertarget[0], vertex_buffer.p_this[0], first_vertex, vertex_count, sf.renderstates.Default)
+        else:
+            drawVertexBuffer(self.p_rendertarget[0], vertex_buffer.p_this[0], first_vertex, vertex_count, states.p_this[0])
+
+        if render_stats:
+            record_draw(self.p_rendertarget, vertex_buffer, states, vertex_count)
+
     property size:
         def __get__(self):
             return Vector2(self.p_rendertarget.getSize().x, self.p_rendertarget.getSize().y)
@@ -1945,6 +4503,60 @@ cdef public class RenderTarget[type PyRenderTargetType, object PyRenderTargetObj
     def reset_GL_states(self):
         self.p_rendertarget.resetGLStates()
 
+    def enable_stats(self, size_t history=120):
+        """ Start collecting RenderStats for this target and return them;
+        they're aggregated per frame on display(). """
+        return enable_render_stats(self.p_rendertarget, history)
+
+    def disable_stats(self):
+        render_stats.pop(<size_t>self.p_rendertarget, None)
+
+    property stats:
+        def __get__(self):
+            return find_render_stats(self.p_rendertarget)
+
+
+cdef bint get_global_bounds(Drawable drawable, sf.FloatRect *bounds):
+    # only the drawables whose bounds are known natively can be culled
+    if isinstance(drawable, Sprite):
+        bounds[0] = (<Sprite>drawable).p_this.getGlobalBounds()
+    elif isinstance(drawable, Shape):
+        bounds[0] = (<Shape>drawable).p_shape.getGlobalBounds()
+    elif isinstance(drawable, Text):
+        bounds[0] = (<Text>drawable).p_this.getGlobalBounds()
+    elif isinstance(drawable, VertexArray):
+        bounds[0] = (<VertexArray>drawable).p_this.getBounds()
+    else:
+        return False
+
+    return True
+
+cdef tuple draw_many(sf.RenderTarget *target, drawables, RenderStates states, bint cull):
+    cdef const sf.RenderStates *p_states = &sf.renderstates.Default
+    cdef sf.FloatRect area = view_area(target.getView())
+    cdef sf.FloatRect bounds
+    cdef Drawable drawable
+    cdef Py_ssize_t drawn = 0
+    cdef Py_ssize_t culled = 0
+
+    if states:
+        p_states = states.p_this
+
+    for item in drawables:
+        drawable = <Drawable?>item
+
+        if cull and get_global_bounds(drawable, &bounds):
+            if not p_states.transform.transformRect(bounds).intersects(area):
+                culled += 1
+                continue
+
+        target.draw(drawable.p_drawable[0], p_states[0])
+        drawn += 1
+
+        if render_stats:
+            record_draw(target, drawable, states)
+
+    return drawn, culled
 
 cdef api object wrap_rendertarget(sf.RenderTarget* p):
     cdef RenderTarget r = RenderTarget.__new__(RenderTarget)
@@ -1962,6 +4574,9 @@ cdef class RenderWindow(Window):
             self.p_window = <sf.Window*>self.p_this
 
     def __dealloc__(self):
+        if render_stats:
+            render_stats.pop(<size_t><sf.RenderTarget*>self.p_this, None)
+
         self.p_window = NULL
         if self.p_this != NULL:
             del self.p_this
@@ -2022,6 +4637,24 @@ cdef class RenderWindow(Window):
         else:
             self.p_this.draw(drawable.p_drawable[0], states.p_this[0])
 
+        if render_stats:
+            record_draw(<sf.RenderTarget*>self.p_this, drawable, states)
+
+    def draw_many(self, drawables, RenderStates states=None, bint cull=True):
+        # draws a sequence of drawables with the same states, skipping
+        # (when cull is set) the sprites, shapes, texts and vertex arrays
+        # lying outside the current view; returns (drawn, culled)
+        return draw_many(<sf.RenderTarget*>self.p_this, drawables, states, cull)
+
+    def draw_vertex_buffer(self, VertexBuffer vertex_buffer, size_t first_vertex, size_t vertex_count, RenderStates states=None):
+        if not states:
+            drawVertexBuffer((<sf.RenderTarget*>self.p_this)[0], vertex_buffer.p_this[0], first_vertex, vertex_count, sf.renderstates.Default)
+        else:
+            drawVertexBuffer((<sf.RenderTarget*>self.p_this)[0], vertex_buffer.p_this[0], first_vertex, vertex_count, states.p_this[0])
+
+        if render_stats:
+            record_draw(<sf.RenderTarget*>self.p_this, vertex_buffer, states, vertex_count)
+
     def push_GL_states(self):
         self.p_this.pushGLStates()
 
@@ -2031,6 +4664,24 @@ cdef class RenderWindow(Window):
     def reset_GL_states(self):
         self.p_this.resetGLStates()
 
+    def enable_stats(self, size_t history=120):
+        """ Start collecting RenderStats for this target and return them;
+        they're aggregated per frame on display(). """
+        return enable_render_stats(<sf.RenderTarget*>self.p_this, history)
+
+    def disable_stats(self):
+        render_stats.pop(<size_t><sf.RenderTarget*>self.p_this, None)
+
+    property stats:
+        def __get__(self):
+            return find_render_stats(<sf.RenderTarget*>self.p_this)
+
+    def display(self):
+        self.p_window.display()
+
+        if render_stats:
+            end_render_frame(<sf.RenderTarget*>self.p_this)
+
     def capture(self):
         cdef sf.Image *p = new sf.Image()
         p[0] = self.p_this.capture()
@@ -2056,6 +4707,9 @@ cdef class RenderTexture(RenderTarget):
             self.m_texture = wrap_texture(<sf.Texture*>&self.p_this.getTexture(), False)
 
     def __dealloc__(self):
+        if render_stats:
+            render_stats.pop(<size_t>self.p_rendertarget, None)
+
         self.p_rendertarget = NULL
 
         if self.p_this is not NULL:
@@ -2085,6 +4739,9 @@ cdef class RenderTexture(RenderTarget):
     def display(self):
         self.p_this.display()
 
+        if render_stats:
+            end_render_frame(self.p_rendertarget)
+
     property texture:
         def __get__(self):
             return self.m_texture
@@ -2100,6 +4757,9 @@ cdef class HandledWindow(RenderTarget):
             self.p_window = <sf.Window*>self.p_this
 
     def __dealloc__(self):
+        if render_stats:
+            render_stats.pop(<size_t>self.p_rendertarget, None)
+
         self.p_rendertarget = NULL
 
         if self.p_this is not NULL:
@@ -2113,3 +4773,280 @@ cdef class HandledWindow(RenderTarget):
 
     def display(self):
         self.p_window.display()
+
+        if render_stats:
+            end_render_frame(self.p_rendertarget)
+
+
+cdef class Frame:
+    """ The pixels of a frame read back by a FrameGrabber, exposed through
+    the buffer protocol as a (height, width, 4) array of RGBA bytes. """
+    cdef vector[Uint8] m_pixels
+    cdef unsigned int m_width
+    cdef unsigned int m_height
+    cdef Uint64 m_number
+    cdef Int64 m_microseconds
+    cdef Py_ssize_t m_shape[3]
+    cdef Py_ssize_t m_strides[3]
+    cdef int m_exports
+    cdef FrameGrabber m_grabber
+
+    def __init__(self):
+        raise UserWarning("Frames are obtained from FrameGrabber.poll()")
+
+    def __repr__(self):
+        return "Frame(number={0}, size={1}, time={2})".format(self.number, self.size, self.time)
+
+    def __len__(self):
+        return self.m_pixels.size()
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        self.m_shape[0] = self.m_height
+        self.m_shape[1] = self.m_width
+        self.m_shape[2] = 4
+        self.m_strides[0] = self.m_width * 4
+        self.m_strides[1] = 4
+        self.m_strides[2] = 1
+
+        if self.m_pixels.size() > 0:
+            buffer.buf = <char*>&self.m_pixels[0]
+        else:
+            buffer.buf = NULL
+
+        if flags & PyBUF_FORMAT:
+            buffer.format = 'B'
+        else:
+            buffer.format = NULL
+
+        buffer.internal = NULL
+        buffer.itemsize = 1
+        buffer.len = self.m_pixels.size()
+        buffer.ndim = 3
+        buffer.obj = self
+        buffer.readonly = 1
+        buffer.shape = &self.m_shape[0] if flags & PyBUF_ND else NULL
+        buffer.strides = &self.m_strides[0] if flags & PyBUF_STRIDES else NULL
+        buffer.suboffsets = NULL
+
+        self.m_exports += 1
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        self.m_exports -= 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+    property width:
+        def __get__(self):
+            return self.m_width
+
+    property height:
+        def __get__(self):
+            return self.m_height
+
+    property size:
+        def __get__(self):
+            return Vector2(self.m_width, self.m_height)
+
+    property number:
+        def __get__(self):
+            return self.m_number
+
+    property time:
+        def __get__(self):
+            cdef sf.Time* p = new sf.Time()
+            p[0] = sf.microseconds(self.m_microseconds)
+            return wrap_time(p)
+
+    def to_image(self):
+        cdef sf.Image *p = new sf.Image()
+
+        if self.m_pixels.size() > 0:
+            p.create(self.m_width, self.m_height, &self.m_pixels[0])
+
+        return wrap_image(p)
+
+    def release(self):
+        """ Give the memory back to the grabber; the frame must not be used
+        afterwards. Frames with views still exported aren't reused. """
+        if self.m_grabber is not None:
+            self.m_grabber.recycle(self)
+            self.m_grabber = None
+
+
+cdef class FrameGrabber:
+    """ Read back the content of a render window or render texture
+    asynchronously. Call grab() every frame after drawing and before
+    display(), then poll() for the frames read back so far, which arrive
+    `slots` frames later. When the consumer falls behind and `queue_size`
+    frames are waiting, either the oldest waiting frame or the newest one
+    is dropped, according to `drop_policy`. """
+    DROP_OLDEST = 0
+    DROP_NEWEST = 1
+
+    cdef NativeFrameGrabber *p_this
+    cdef RenderTarget m_target
+    cdef unsigned int m_width
+    cdef unsigned int m_height
+    cdef size_t m_queue_size
+    cdef int m_drop_policy
+    cdef object m_requests
+    cdef object m_ready
+    cdef list m_free
+    cdef sf.Clock m_clock
+    cdef Uint64 m_number
+    cdef Uint64 m_delivered
+    cdef Uint64 m_dropped
+
+    def __init__(self, RenderTarget target not None, size=None, unsigned int slots=2, size_t queue_size=2, int drop_policy=0):
+        if not isinstance(target, (RenderWindow, RenderTexture, HandledWindow)):
+            raise TypeError("Expected a RenderWindow, RenderTexture or HandledWindow")
+
+        if drop_policy not in (FrameGrabber.DROP_OLDEST, FrameGrabber.DROP_NEWEST):
+            raise ValueError("Unknown drop policy")
+
+        if self.p_this is NULL:
+            self.p_this = new NativeFrameGrabber(max(slots, 1))
+
+        self.m_target = target
+        self.m_width, self.m_height = size if size is not None else (0, 0)
+        self.m_queue_size = max(queue_size, 1)
+        self.m_drop_policy = drop_policy
+        self.m_requests = deque()
+        self.m_ready = deque()
+        self.m_free = []
+
+    def __dealloc__(self):
+        if self.p_this is not NULL:
+            del self.p_this
+
+    def __repr__(self):
+        return "FrameGrabber(grabbed={0}, delivered={1}, dropped={2})".format(self.grabbed, self.delivered, self.dropped)
+
+    cdef void activate(self):
+        if isinstance(self.m_target, RenderTexture):
+            (<RenderTexture>self.m_target).p_this.setActive(True)
+        elif isinstance(self.m_target, RenderWindow):
+            (<RenderWindow>self.m_target).p_window.setActive(True)
+        else:
+            (<HandledWindow>self.m_target).p_window.setActive(True)
+
+    def grab(self):
+        """ Start reading back the current content of the target and hand
+        over the frames whose read back is complete. Return the number of
+        the frame. """
+        cdef sf.Vector2u size = self.m_target.p_rendertarget.getSize()
+        cdef Uint64 number = self.m_number
+        cdef int slot
+
+        self.activate()
+
+        # with every slot in flight, the oldest one is old enough for its
+        # pixels to be ready
+        while self.p_this.getPendingCount() >= self.p_this.getSlotCount():
+            self.resolve()
+
+        slot = self.p_this.request(size.x, size.y)
+        self.m_requests.append((slot, number, self.m_clock.getElapsedTime().asMicroseconds(), size.x, size.y))
+        self.m_number += 1
+
+        return number
+
+    def flush(self):
+        """ Wait for every read back in flight and hand the frames over. """
+        self.activate()
+
+        while self.m_requests:
+            self.resolve()
+
+    def poll(self):
+        """ Return the oldest frame read back, or None. Release it once
+        consumed so its memory is reused. """
+        cdef Frame frame
+
+        if not self.m_ready:
+            return None
+
+        frame = self.m_ready.popleft()
+        frame.m_grabber = self
+        self.m_delivered += 1
+        return frame
+
+    cdef resolve(self):
+        cdef int slot
+        cdef Frame frame
+        cdef unsigned int width, height
+
+        slot, number, microseconds, width, height = self.m_requests.popleft()
+
+        if len(self.m_ready) >= self.m_queue_size:
+            self.m_dropped += 1
+
+            if self.m_drop_policy == FrameGrabber.DROP_NEWEST:
+                self.p_this.discard(slot)
+                return
+
+            self.recycle(self.m_ready.popleft())
+
+        if self.m_width > 0 and self.m_height > 0:
+            width, height = self.m_width, self.m_height
+
+        frame = self.acquire(width, height)
+        frame.m_number = number
+        frame.m_microseconds = microseconds
+
+        if frame.m_pixels.size() > 0:
+            self.p_this.resolve(slot, &frame.m_pixels[0], width, height)
+        else:
+            self.p_this.discard(slot)
+
+        self.m_ready.append(frame)
+
+    cdef Frame acquire(self, unsigned int width, unsigned int height):
+        cdef Frame frame
+
+        while self.m_free:
+            frame = self.m_free.pop()
+
+            if frame.m_width == width and frame.m_height == height:
+                return frame
+
+        frame = Frame.__new__(Frame)
+        frame.m_pixels.resize(<size_t>width * height * 4)
+        frame.m_width = width
+        frame.m_height = height
+        return frame
+
+    cdef recycle(self, Frame frame):
+        # a frame still viewed through a memoryview is left to the
+        # garbage collector
+        if frame.m_exports == 0 and len(self.m_free) < self.m_queue_size + self.p_this.getSlotCount():
+            self.m_free.append(frame)
+
+    property asynchronous:
+        def __get__(self):
+            self.activate()
+            return self.p_this.isAsynchronous()
+
+    property pending:
+        def __get__(self):
+            return len(self.m_requests)
+
+    property ready:
+        def __get__(self):
+            return len(self.m_ready)
+
+    property grabbed:
+        def __get__(self):
+            return self.m_number
+
+    property delivered:
+        def __get__(self):
+            return self.m_delivered
+
+    property dropped:
+        def __get__(self):
+            return self.m_dropped
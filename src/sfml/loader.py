@@ -0,0 +1,156 @@
+# PySFML - Python bindings for SFML
+# Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+#
+# This file is part of PySFML project and is available under the zlib
+# license.
+
+""" Asynchronous loading of images, textures, fonts and sounds.
+
+    Decoding releases the GIL, so resources are decoded in parallel by a pool
+    of worker threads. Textures need the OpenGL context, therefore their
+    upload is deferred until :meth:`AsyncLoader.process_uploads` is called
+    from the thread owning the context (usually once per frame).
+
+    Example::
+
+        from sfml import sf
+        from sfml.loader import AsyncLoader
+
+        loader = AsyncLoader()
+        background = loader.load_texture("background.png")
+
+        while window.is_open:
+            loader.process_uploads()
+
+            if background.done():
+                window.draw(sf.Sprite(background.result()))
+"""
+
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from sfml.graphics import Image, Texture, Font
+from sfml.audio import SoundBuffer, Music
+
+__all__ = ['AsyncLoader', 'awaitable']
+
+try:
+    _string_types = basestring
+except NameError:
+    _string_types = str
+
+
+def _load(cls, source):
+    # filenames are checked first: on Python 2 they are bytes too
+    if isinstance(source, _string_types):
+        return cls.from_file(source)
+
+    return cls.from_memory(source)
+
+
+def awaitable(future, loop=None):
+    """ Wrap a future returned by the loader so it can be awaited from a
+    coroutine running in an asyncio event loop. """
+    import asyncio
+    return asyncio.wrap_future(future, loop=loop)
+
+
+class AsyncLoader(object):
+    """ Decode resources on worker threads and hand them back as futures.
+
+    A source is either a filename or, on Python 3, a bytes object holding
+    the file content. On Python 2, where a filename is a bytes object,
+    use the ``*_from_memory`` methods to load file content. """
+
+    def __init__(self, max_workers=None):
+        if max_workers is None:
+            max_workers = multiprocessing.cpu_count() or 1
+
+        self._executor = ThreadPoolExecutor(max_workers)
+        self._uploads = deque()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def load_image(self, source):
+        return self._executor.submit(_load, Image, source)
+
+    def load_font(self, source):
+        return self._executor.submit(_load, Font, source)
+
+    def load_sound_buffer(self, source):
+        return self._executor.submit(_load, SoundBuffer, source)
+
+    def open_music(self, source):
+        return self._executor.submit(_load, Music, source)
+
+    def load_image_from_memory(self, data):
+        return self._executor.submit(Image.from_memory, data)
+
+    def load_font_from_memory(self, data):
+        return self._executor.submit(Font.from_memory, data)
+
+    def load_sound_buffer_from_memory(self, data):
+        return self._executor.submit(SoundBuffer.from_memory, data)
+
+    def open_music_from_memory(self, data):
+        return self._executor.submit(Music.from_memory, data)
+
+    def load_texture(self, source, area=None, smooth=False):
+        """ Decode the image on a worker thread and queue its upload. The
+        returned future completes during a later call to
+        :meth:`process_uploads`. """
+        return self._queue_texture(self._executor.submit(_load, Image, source), area, smooth)
+
+    def load_texture_from_memory(self, data, area=None, smooth=False):
+        return self._queue_texture(self._executor.submit(Image.from_memory, data), area, smooth)
+
+    def _queue_texture(self, decoding, area, smooth):
+        future = Future()
+
+        def queue_upload(decoding):
+            error = decoding.exception()
+
+            if error is not None:
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(error)
+            else:
+                self._uploads.append((future, decoding.result(), area, smooth))
+
+        decoding.add_done_callback(queue_upload)
+        return future
+
+    def process_uploads(self, limit=None):
+        """ Upload decoded textures; must be called from the thread owning
+        the OpenGL context. At most `limit` textures are uploaded, all
+        pending ones if None. Return the number of textures uploaded. """
+        count = 0
+
+        while self._uploads and (limit is None or count < limit):
+            future, image, area, smooth = self._uploads.popleft()
+
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                texture = Texture.from_image(image, area)
+                texture.smooth = smooth
+            except Exception as error:
+                future.set_exception(error)
+            else:
+                future.set_result(texture)
+
+            count += 1
+
+        return count
+
+    @property
+    def pending_uploads(self):
+        return len(self._uploads)
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait)
@@ -0,0 +1,31 @@
+/*
+* PySFML - Python bindings for SFML
+* Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+*
+* This file is part of PySFML project and is available under the zlib
+* license.
+*/
+
+#ifndef PYSFML_NETWORK_HACKS_HPP
+#define PYSFML_NETWORK_HACKS_HPP
+
+#include <SFML/Network.hpp>
+
+// sf::Socket::getHandle() is protected; a pointer to it, taken through a
+// derived class, can be applied to any socket though
+class SocketHandleAccess : public sf::Socket
+{
+public:
+    static sf::SocketHandle get(const sf::Socket& socket)
+    {
+        return (socket.*(&SocketHandleAccess::getHandle))();
+    }
+};
+
+// the native handle, or -1 if the socket isn't open yet
+inline long long getSocketHandle(const sf::Socket& socket)
+{
+    return static_cast<long long>(SocketHandleAccess::get(socket));
+}
+
+#endif // PYSFML_NETWORK_HACKS_HPP
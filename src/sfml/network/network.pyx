@@ -13,12 +13,17 @@ from cython.operator cimport preincrement as inc
 from libc.stdlib cimport *
 from libcpp.string cimport string
 from libcpp.vector cimport vector
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release
+from cpython.buffer cimport PyBUF_SIMPLE, PyBUF_WRITABLE
 
 cimport sfml as sf
 from sfml cimport Int8, Int16, Int32, Int64
 from sfml cimport Uint8, Uint16, Uint32, Uint64
 from pysfml.system cimport Time
 
+cdef extern from "pysfml/network/hacks.hpp":
+    long long getSocketHandle(const sf.Socket&)
+
 cdef class IpAddress:
     cdef sf.IpAddress *p_this
 
@@ -122,6 +127,11 @@ cdef class Socket:
         def __set__(self, bint blocking):
             self.p_socket.setBlocking(blocking)
 
+    def fileno(self):
+        """ Return the native socket handle, or -1 if the socket isn't
+        open yet, e.g. to watch it with select or an asyncio loop. """
+        return getSocketHandle(self.p_socket[0])
+
 
 class SocketException(Exception): pass
 class SocketNotReady(SocketException): pass
@@ -226,13 +236,19 @@ cdef class TcpSocket(Socket):
     def disconnect(self):
         self.p_this.disconnect()
 
-    def send(self, bytes data):
+    def send(self, data):
+        """ Send the content of bytes or any other object supporting the
+        buffer protocol, e.g. a bytearray, a memoryview or an array. """
+        cdef Py_buffer view
         cdef sf.socket.Status status
-        cdef char* cdata = <char*>data
-        cdef size_t cdata_len = len(data)
 
-        with nogil:
-            status = self.p_this.send(cdata, cdata_len)
+        PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
+
+        try:
+            with nogil:
+                status = self.p_this.send(view.buf, view.len)
+        finally:
+            PyBuffer_Release(&view)
 
         if status is not sf.socket.Done:
             if status is sf.socket.NotReady:
@@ -242,13 +258,75 @@ cdef class TcpSocket(Socket):
             elif status is sf.socket.Error:
                 raise SocketError()
 
+    def send_partial(self, data):
+        """ Send as much of `data` as the socket accepts and return the
+        number of bytes sent, which is less than its size when a
+        non-blocking socket's buffer fills up; the caller sends the rest
+        later. """
+        cdef Py_buffer view
+        cdef size_t sent = 0
+        cdef sf.socket.Status status
+
+        PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
+
+        try:
+            with nogil:
+                status = self.p_this.send(view.buf, view.len, sent)
+        finally:
+            PyBuffer_Release(&view)
+
+        if status is not sf.socket.Done and status is not sf.socket.Partial:
+            if status is sf.socket.NotReady:
+                raise SocketNotReady()
+            elif status is sf.socket.Disconnected:
+                raise SocketDisconnected()
+            elif status is sf.socket.Error:
+                raise SocketError()
+
+        return sent
+
     def receive(self, size_t size):
         cdef char* data = <char*>malloc(size * sizeof(char))
         cdef size_t received = 0
         cdef sf.socket.Status status
 
-        with nogil:
-            status = self.p_this.receive(data, size, received)
+        if data is NULL and size > 0:
+            raise MemoryError()
+
+        try:
+            with nogil:
+                status = self.p_this.receive(data, size, received)
+
+            if status is not sf.socket.Done:
+                if status is sf.socket.NotReady:
+                    raise SocketNotReady()
+                elif status is sf.socket.Disconnected:
+                    raise SocketDisconnected()
+                elif status is sf.socket.Error:
+                    raise SocketError()
+
+            return data[:received]
+        finally:
+            free(data)
+
+    def receive_into(self, buffer, size_t size=0):
+        """ Receive into a writable buffer (a bytearray, a memoryview, an
+        array...) at most `size` bytes, or as many as it holds, and return
+        the number of bytes received; nothing is allocated or copied. """
+        cdef Py_buffer view
+        cdef size_t received = 0
+        cdef sf.socket.Status status
+
+        PyObject_GetBuffer(buffer, &view, PyBUF_WRITABLE)
+
+        try:
+            if size == 0 or size > <size_t>view.len:
+                size = view.len
+
+            with nogil:
+                status = self.p_this.receive(view.buf, size, received)
+        finally:
+            PyBuffer_Release(&view)
 
         if status is not sf.socket.Done:
             if status is sf.socket.NotReady:
@@ -258,7 +336,7 @@ cdef class TcpSocket(Socket):
             elif status is sf.socket.Error:
                 raise SocketError()
 
-        return <bytes>(data)[:received]
+        return received
 
 
 cdef class UdpSocket(Socket):
@@ -294,8 +372,19 @@ cdef class UdpSocket(Socket):
     def unbind(self):
         self.p_this.unbind()
 
-    def send(self, bytes data, IpAddress remote_address, unsigned short remote_port):
-        cdef sf.socket.Status status = self.p_this.send(<char*>data, len(data), remote_address.p_this[0], remote_port)
+    def send(self, data, IpAddress remote_address, unsigned short remote_port):
+        """ Send the content of bytes or any other object supporting the
+        buffer protocol as a datagram. """
+        cdef Py_buffer view
+        cdef sf.socket.Status status
+
+        PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
+
+        try:
+            with nogil:
+                status = self.p_this.send(view.buf, view.len, remote_address.p_this[0], remote_port)
+        finally:
+            PyBuffer_Release(&view)
 
         if status is not sf.socket.Done:
             if status is sf.socket.NotReady:
@@ -310,7 +399,47 @@ cdef class UdpSocket(Socket):
         cdef size_t received = 0
         cdef IpAddress remote_address = IpAddress()
         cdef unsigned short port = 0
-        cdef sf.socket.Status status = self.p_this.receive(data, size, received, remote_address.p_this[0], port)
+        cdef sf.socket.Status status
+
+        if data is NULL and size > 0:
+            raise MemoryError()
+
+        try:
+            with nogil:
+                status = self.p_this.receive(data, size, received, remote_address.p_this[0], port)
+
+            if status is not sf.socket.Done:
+                if status is sf.socket.NotReady:
+                    raise SocketNotReady()
+                elif status is sf.socket.Disconnected:
+                    raise SocketDisconnected()
+                elif status is sf.socket.Error:
+                    raise SocketError()
+
+            return (data[:received], remote_address, port)
+        finally:
+            free(data)
+
+    def receive_from_into(self, buffer, size_t size=0):
+        """ Receive a datagram into a writable buffer, at most `size`
+        bytes or as many as it holds, and return (received, remote_address,
+        remote_port); nothing is allocated or copied. """
+        cdef Py_buffer view
+        cdef size_t received = 0
+        cdef IpAddress remote_address = IpAddress()
+        cdef unsigned short port = 0
+        cdef sf.socket.Status status
+
+        PyObject_GetBuffer(buffer, &view, PyBUF_WRITABLE)
+
+        try:
+            if size == 0 or size > <size_t>view.len:
+                size = view.len
+
+            with nogil:
+                status = self.p_this.receive(view.buf, size, received, remote_address.p_this[0], port)
+        finally:
+            PyBuffer_Release(&view)
 
         if status is not sf.socket.Done:
             if status is sf.socket.NotReady:
@@ -320,7 +449,7 @@ cdef class UdpSocket(Socket):
             elif status is sf.socket.Error:
                 raise SocketError()
 
-        return (<bytes>(data)[:received], remote_address, port)
+        return (received, remote_address, port)
 
 
 cdef class SocketSelector:
@@ -0,0 +1,206 @@
+# PySFML - Python bindings for SFML
+# Copyright (c) 2012-2017, Jonathan De Wachter <dewachter.jonathan@gmail.com>
+#
+# This file is part of PySFML project and is available under the zlib
+# license.
+
+""" A cache that loads each resource once and keeps memory under a budget.
+
+    Resources are keyed by their path and load parameters; the modification
+    time and size of the files are recorded so a changed file is loaded
+    again instead of being served stale. When the estimated memory of the
+    cached resources exceeds the budget, the least recently used ones are
+    dropped (they stay alive as long as they're referenced elsewhere).
+
+    Example::
+
+        from sfml.resources import ResourceCache
+
+        cache = ResourceCache(byte_budget=256 * 1024 * 1024)
+
+        texture = cache.get_texture("tiles.png", smooth=True)
+        font = cache.get_font("DejaVuSans.ttf")
+
+        print(cache.hits, cache.misses, cache.evictions)
+"""
+
+import os
+import warnings
+from collections import OrderedDict
+
+from sfml.graphics import Texture, Font, Shader
+from sfml.audio import SoundBuffer
+
+__all__ = ['ResourceCache']
+
+
+def _signature(paths):
+    signature = []
+
+    for path in paths:
+        status = os.stat(path)
+        signature.append((status.st_mtime, status.st_size))
+
+    return tuple(signature)
+
+
+class _Entry(object):
+    __slots__ = ['resource', 'paths', 'signature', 'cpu_bytes', 'gpu_bytes', 'load']
+
+    def __init__(self, paths, load):
+        self.paths = paths
+        self.load = load
+        self.reload()
+
+    def reload(self):
+        signature = _signature(self.paths)
+        self.resource, self.cpu_bytes, self.gpu_bytes = self.load()
+        self.signature = signature
+
+    def is_stale(self):
+        try:
+            return _signature(self.paths) != self.signature
+        except OSError:
+            return False
+
+
+class ResourceCache(object):
+    """ Deduplicate and cache textures, fonts, sound buffers and shaders.
+
+    With `auto_reload`, every lookup checks whether the files changed on
+    disk and loads them again if so; otherwise call :meth:`reload_changed`
+    whenever convenient, for example when the window regains focus. """
+
+    def __init__(self, byte_budget=256 * 1024 * 1024, auto_reload=False):
+        self.byte_budget = byte_budget
+        self.auto_reload = auto_reload
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.reloads = 0
+
+        self._entries = OrderedDict()
+        self._cpu_bytes = 0
+        self._gpu_bytes = 0
+
+    def __repr__(self):
+        return "ResourceCache(entries={0}, bytes={1}, byte_budget={2})".format(len(self), self.bytes, self.byte_budget)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_texture(self, filename, area=None, smooth=False, repeated=False):
+        def load():
+            texture = Texture.from_file(filename, area)
+            texture.smooth = smooth
+            texture.repeated = repeated
+            return texture, 0, texture.width * texture.height * 4
+
+        if area is not None:
+            area = tuple(area)
+
+        return self._get(('texture', filename, area, smooth, repeated), (filename,), load)
+
+    def get_font(self, filename):
+        def load():
+            # the file size stands for the face; glyph pages are created on
+            # demand and aren't accounted for
+            return Font.from_file(filename), os.path.getsize(filename), 0
+
+        return self._get(('font', filename), (filename,), load)
+
+    def get_sound_buffer(self, filename):
+        def load():
+            buffer = SoundBuffer.from_file(filename)
+            return buffer, len(buffer.samples) * 2, 0
+
+        return self._get(('sound_buffer', filename), (filename,), load)
+
+    def get_shader(self, vertex=None, fragment=None):
+        paths = tuple(path for path in (vertex, fragment) if path)
+
+        def load():
+            # the size of the sources is used as an estimate of the program
+            return Shader.from_file(vertex, fragment), 0, sum(map(os.path.getsize, paths))
+
+        return self._get(('shader', vertex, fragment), paths, load)
+
+    def reload_changed(self):
+        """ Load again the resources whose files changed on disk and return
+        their keys. A resource that fails to load keeps its previous
+        version, with a RuntimeWarning. """
+        reloaded = []
+
+        for key, entry in list(self._entries.items()):
+            if entry.is_stale() and self._reload(entry):
+                reloaded.append(key)
+
+        self._shrink()
+        return reloaded
+
+    def evict(self, key):
+        entry = self._entries.pop(key)
+        self._cpu_bytes -= entry.cpu_bytes
+        self._gpu_bytes -= entry.gpu_bytes
+
+    def clear(self):
+        self._entries.clear()
+        self._cpu_bytes = 0
+        self._gpu_bytes = 0
+
+    @property
+    def cpu_bytes(self):
+        return self._cpu_bytes
+
+    @property
+    def gpu_bytes(self):
+        return self._gpu_bytes
+
+    @property
+    def bytes(self):
+        return self._cpu_bytes + self._gpu_bytes
+
+    def _get(self, key, paths, load):
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+
+            entry = _Entry(paths, load)
+            self._entries[key] = entry
+            self._cpu_bytes += entry.cpu_bytes
+            self._gpu_bytes += entry.gpu_bytes
+        else:
+            self.hits += 1
+            self._entries[key] = self._entries.pop(key)
+
+            if self.auto_reload and entry.is_stale():
+                self._reload(entry)
+
+        self._shrink()
+        return entry.resource
+
+    def _reload(self, entry):
+        # a file caught mid-write, or gone, keeps the previous resource
+        # (and signature, so it's tried again) instead of failing the caller
+        cpu_bytes, gpu_bytes = entry.cpu_bytes, entry.gpu_bytes
+
+        try:
+            entry.reload()
+        except (IOError, OSError) as error:
+            warnings.warn("Keeping the previous version of {0}: {1}".format(
+                ", ".join(entry.paths), error), RuntimeWarning)
+            return False
+
+        self._cpu_bytes += entry.cpu_bytes - cpu_bytes
+        self._gpu_bytes += entry.gpu_bytes - gpu_bytes
+        self.reloads += 1
+        return True
+
+    def _shrink(self):
+        # the most recently used entry is kept even if it alone exceeds
+        # the budget
+        while self.bytes > self.byte_budget and len(self._entries) > 1:
+            self.evict(next(iter(self._entries)))
+            self.evictions += 1
@@ -10,6 +10,13 @@ cimport cython
 
 from libcpp.string cimport string
 from libcpp.vector cimport vector
+from cpython cimport array
+
+import array
+import functools
+import json
+import math
+import numbers
 
 cimport sfml as sf
 from sfml cimport Int8, Int16, Int32, Int64
@@ -32,8 +39,9 @@ cdef extern from "pysfml/system/hacks.hpp":
     void Time_idiv_int(sf.Time&, Int64)
     void Time_idiv_float(sf.Time&, float)
 
-__all__ = ['Time', 'sleep', 'Clock', 'seconds', 'milliseconds', 'microseconds',
-            'Vector2', 'Vector3']
+__all__ = ['Time', 'sleep', 'Clock', 'FrameScheduler', 'Profiler',
+            'ProfileScope', 'seconds', 'milliseconds', 'microseconds',
+            'Vector2', 'Vector3', 'Vector2f', 'Vector2i', 'Vector3f']
 
 # expose a function to restore the error handler
 cdef api void restoreErrorHandler():
@@ -88,6 +96,7 @@ cdef api object wrap_string(const sf.String* p):
 
     return bytes_string.decode('UTF-32')
 
+@cython.freelist(64)
 cdef public class Vector2[type PyVector2Type, object PyVector2Object]:
     cdef sf.Vector2[NumericObject] *p_this
 
@@ -215,39 +224,68 @@ cdef public class Vector2[type PyVector2Type, object PyVector2Object]:
 
 cdef api Vector2 wrap_vector2(sf.Vector2[NumericObject]* p):
     cdef Vector2 r = Vector2.__new__(Vector2)
+    del r.p_this
     r.p_this = p
     return r
 
 cdef api object wrap_vector2i(sf.Vector2i p):
     cdef Vector2 r = Vector2.__new__(Vector2)
-    r.x = p.x
-    r.y = p.y
+    r.p_this.x.set(p.x)
+    r.p_this.y.set(p.y)
     return r
 
 cdef api object wrap_vector2u(sf.Vector2u p):
     cdef Vector2 r = Vector2.__new__(Vector2)
-    r.x = p.x
-    r.y = p.y
+    r.p_this.x.set(p.x)
+    r.p_this.y.set(p.y)
     return r
 
 cdef api object wrap_vector2f(sf.Vector2f p):
     cdef Vector2 r = Vector2.__new__(Vector2)
-    r.x = p.x
-    r.y = p.y
+    r.p_this.x.set(p.x)
+    r.p_this.y.set(p.y)
     return r
 
+# The integer conversions go through Python objects rather than
+# unpack_vector2() so out of range components raise OverflowError
+# instead of wrapping around.
 cdef api sf.Vector2i to_vector2i(vector):
-    x, y = vector
+    cdef int x, y
+
+    if type(vector) is Vector2i:
+        return sf.Vector2i((<Vector2i>vector).x, (<Vector2i>vector).y)
+
+    if type(vector) is tuple and len(<tuple>vector) == 2:
+        x = (<tuple>vector)[0]
+        y = (<tuple>vector)[1]
+    else:
+        vx, vy = vector
+        x, y = vx, vy
+
     return sf.Vector2i(x, y)
 
 cdef api sf.Vector2u to_vector2u(vector):
-    x, y = vector
+    cdef unsigned int x, y
+
+    if type(vector) is Vector2i and (<Vector2i>vector).x >= 0 and (<Vector2i>vector).y >= 0:
+        return sf.Vector2u((<Vector2i>vector).x, (<Vector2i>vector).y)
+
+    if type(vector) is tuple and len(<tuple>vector) == 2:
+        x = (<tuple>vector)[0]
+        y = (<tuple>vector)[1]
+    else:
+        vx, vy = vector
+        x, y = vx, vy
+
     return sf.Vector2u(x, y)
 
 cdef api sf.Vector2f to_vector2f(vector):
-    x, y = vector
+    cdef double x, y
+
+    unpack_vector2(vector, &x, &y)
     return sf.Vector2f(x, y)
 
+@cython.freelist(16)
 cdef public class Vector3[type PyVector3Type, object PyVector3Object]:
     cdef sf.Vector3[NumericObject] *p_this
 
@@ -384,31 +422,491 @@ cdef public class Vector3[type PyVector3Type, object PyVector3Object]:
 
 cdef api object wrap_vector3(sf.Vector3[NumericObject]* p):
     cdef Vector3 r = Vector3.__new__(Vector3)
+    del r.p_this
     r.p_this = p
     return r
 
 cdef api object wrap_vector3i(sf.Vector3i p):
     cdef Vector3 r = Vector3.__new__(Vector3)
-    r.x = p.x
-    r.y = p.y
-    r.z = p.z
+    r.p_this.x.set(p.x)
+    r.p_this.y.set(p.y)
+    r.p_this.z.set(p.z)
     return r
 
 cdef api object wrap_vector3f(sf.Vector3f p):
     cdef Vector3 r = Vector3.__new__(Vector3)
-    r.x = p.x
-    r.y = p.y
-    r.z = p.z
+    r.p_this.x.set(p.x)
+    r.p_this.y.set(p.y)
+    r.p_this.z.set(p.z)
     return r
 
 cdef api sf.Vector3i to_vector3i(vector):
-    x, y, z = vector
+    cdef int x, y, z
+
+    vx, vy, vz = vector
+    x, y, z = vx, vy, vz
     return sf.Vector3i(x, y, z)
 
 cdef api sf.Vector3f to_vector3f(vector):
-    x, y, z = vector
+    cdef double x, y, z
+
+    unpack_vector3(vector, &x, &y, &z)
     return sf.Vector3f(x, y, z)
 
+# Component extraction shared by the to_vector*() conversions; the exact
+# type checks come first as they cover nearly every call.
+cdef int unpack_vector2(object vector, double *x, double *y) except -1:
+    if type(vector) is Vector2f:
+        x[0] = (<Vector2f>vector).x
+        y[0] = (<Vector2f>vector).y
+    elif type(vector) is Vector2i:
+        x[0] = (<Vector2i>vector).x
+        y[0] = (<Vector2i>vector).y
+    elif type(vector) is tuple and len(<tuple>vector) == 2:
+        x[0] = (<tuple>vector)[0]
+        y[0] = (<tuple>vector)[1]
+    elif type(vector) is Vector2:
+        x[0] = (<Vector2>vector).p_this.x.get()
+        y[0] = (<Vector2>vector).p_this.y.get()
+    else:
+        vx, vy = vector
+        x[0] = vx
+        y[0] = vy
+
+    return 0
+
+cdef bint unpack_vector2i(object vector, int *x, int *y) except -1:
+    # only succeeds when both components are integers
+    if type(vector) is Vector2i:
+        x[0] = (<Vector2i>vector).x
+        y[0] = (<Vector2i>vector).y
+        return True
+
+    if type(vector) is tuple and len(<tuple>vector) == 2:
+        vx, vy = <tuple>vector
+
+        if isinstance(vx, (int, long)) and isinstance(vy, (int, long)):
+            x[0] = vx
+            y[0] = vy
+            return True
+
+    return False
+
+cdef int unpack_vector3(object vector, double *x, double *y, double *z) except -1:
+    if type(vector) is Vector3f:
+        x[0] = (<Vector3f>vector).x
+        y[0] = (<Vector3f>vector).y
+        z[0] = (<Vector3f>vector).z
+    elif type(vector) is tuple and len(<tuple>vector) == 3:
+        x[0] = (<tuple>vector)[0]
+        y[0] = (<tuple>vector)[1]
+        z[0] = (<tuple>vector)[2]
+    elif type(vector) is Vector3:
+        x[0] = (<Vector3>vector).p_this.x.get()
+        y[0] = (<Vector3>vector).p_this.y.get()
+        z[0] = (<Vector3>vector).p_this.z.get()
+    else:
+        vx, vy, vz = vector
+        x[0] = vx
+        y[0] = vy
+        z[0] = vz
+
+    return 0
+
+cdef bint is_real(object value):
+    # the exact types first, as they cover nearly every call
+    return type(value) is float or type(value) is int or isinstance(value, numbers.Real)
+
+# Vector2f, Vector2i and Vector3f hold plain C numbers instead of Python
+# objects, so their arithmetic doesn't go through the number protocol;
+# a freelist recycles the instances.
+@cython.freelist(64)
+cdef public class Vector2f[type PyVector2fType, object PyVector2fObject]:
+    cdef public double x
+    cdef public double y
+
+    def __init__(self, double x=0, double y=0):
+        self.x = x
+        self.y = y
+
+    def __repr__(self):
+        return "Vector2f(x={0}, y={1})".format(self.x, self.y)
+
+    def __str__(self):
+        return "({0}, {1})".format(self.x, self.y)
+
+    def __richcmp__(Vector2f self, other, int op):
+        cdef double x, y
+
+        if op != 2 and op != 3:
+            return NotImplemented
+
+        try:
+            unpack_vector2(other, &x, &y)
+        except (TypeError, ValueError):
+            return NotImplemented
+        return (self.x == x and self.y == y) == (op == 2)
+
+    def __len__(self):
+        return 2
+
+    def __getitem__(self, Py_ssize_t index):
+        if index == 0 or index == -2:
+            return self.x
+        elif index == 1 or index == -1:
+            return self.y
+
+        raise IndexError("Vector2f index out of range")
+
+    def __iter__(self):
+        return iter((self.x, self.y))
+
+    def __add__(left, right):
+        cdef double lx, ly, rx, ry
+
+        try:
+            unpack_vector2(left, &lx, &ly)
+            unpack_vector2(right, &rx, &ry)
+        except (TypeError, ValueError):
+            return NotImplemented
+
+        return make_vector2f(lx + rx, ly + ry)
+
+    def __sub__(left, right):
+        cdef double lx, ly, rx, ry
+
+        try:
+            unpack_vector2(left, &lx, &ly)
+            unpack_vector2(right, &rx, &ry)
+        except (TypeError, ValueError):
+            return NotImplemented
+
+        return make_vector2f(lx - rx, ly - ry)
+
+    def __mul__(left, right):
+        cdef Vector2f vector
+        cdef double factor
+
+        if isinstance(left, Vector2f):
+            vector, scalar = left, right
+        else:
+            vector, scalar = right, left
+
+        if not is_real(scalar):
+            return NotImplemented
+
+        factor = scalar
+        return make_vector2f(vector.x * factor, vector.y * factor)
+
+    def __truediv__(Vector2f self, double divisor):
+        return make_vector2f(self.x / divisor, self.y / divisor)
+
+    def __iadd__(Vector2f self, other):
+        cdef double x, y
+
+        unpack_vector2(other, &x, &y)
+        self.x += x
+        self.y += y
+        return self
+
+    def __isub__(Vector2f self, other):
+        cdef double x, y
+
+        unpack_vector2(other, &x, &y)
+        self.x -= x
+        self.y -= y
+        return self
+
+    def __imul__(Vector2f self, double factor):
+        self.x *= factor
+        self.y *= factor
+        return self
+
+    def __itruediv__(Vector2f self, double divisor):
+        self.x /= divisor
+        self.y /= divisor
+        return self
+
+    def __neg__(self):
+        return make_vector2f(-self.x, -self.y)
+
+    def __copy__(self):
+        return make_vector2f(self.x, self.y)
+
+cdef inline Vector2f make_vector2f(double x, double y):
+    cdef Vector2f r = Vector2f.__new__(Vector2f)
+    r.x = x
+    r.y = y
+    return r
+
+@cython.freelist(64)
+cdef public class Vector2i[type PyVector2iType, object PyVector2iObject]:
+    cdef public int x
+    cdef public int y
+
+    def __init__(self, int x=0, int y=0):
+        self.x = x
+        self.y = y
+
+    def __repr__(self):
+        return "Vector2i(x={0}, y={1})".format(self.x, self.y)
+
+    def __str__(self):
+        return "({0}, {1})".format(self.x, self.y)
+
+    def __richcmp__(Vector2i self, other, int op):
+        cdef double x, y
+
+        if op != 2 and op != 3:
+            return NotImplemented
+
+        try:
+            unpack_vector2(other, &x, &y)
+        except (TypeError, ValueError):
+            return NotImplemented
+        return (self.x == x and self.y == y) == (op == 2)
+
+    def __len__(self):
+        return 2
+
+    def __getitem__(self, Py_ssize_t index):
+        if index == 0 or index == -2:
+            return self.x
+        elif index == 1 or index == -1:
+            return self.y
+
+        raise IndexError("Vector2i index out of range")
+
+    def __iter__(self):
+        return iter((self.x, self.y))
+
+    # the result stays a Vector2i when both operands are made of
+    # integers and becomes a Vector2f otherwise
+    def __add__(left, right):
+        cdef int lx, ly, rx, ry
+        cdef double flx, fly, frx, fry
+
+        if unpack_vector2i(left, &lx, &ly) and unpack_vector2i(right, &rx, &ry):
+            return make_vector2i(lx + rx, ly + ry)
+
+        try:
+            unpack_vector2(left, &flx, &fly)
+            unpack_vector2(right, &frx, &fry)
+        except (TypeError, ValueError):
+            return NotImplemented
+
+        return make_vector2f(flx + frx, fly + fry)
+
+    def __sub__(left, right):
+        cdef int lx, ly, rx, ry
+        cdef double flx, fly, frx, fry
+
+        if unpack_vector2i(left, &lx, &ly) and unpack_vector2i(right, &rx, &ry):
+            return make_vector2i(lx - rx, ly - ry)
+
+        try:
+            unpack_vector2(left, &flx, &fly)
+            unpack_vector2(right, &frx, &fry)
+        except (TypeError, ValueError):
+            return NotImplemented
+
+        return make_vector2f(flx - frx, fly - fry)
+
+    def __mul__(left, right):
+        cdef Vector2i vector
+        cdef double factor
+
+        if isinstance(left, Vector2i):
+            vector, scalar = left, right
+        else:
+            vector, scalar = right, left
+
+        if isinstance(scalar, (int, long)):
+            return make_vector2i(vector.x * <int>scalar, vector.y * <int>scalar)
+
+        if not is_real(scalar):
+            return NotImplemented
+
+        factor = scalar
+        return make_vector2f(vector.x * factor, vector.y * factor)
+
+    def __truediv__(Vector2i self, double divisor):
+        return make_vector2f(self.x / divisor, self.y / divisor)
+
+    def __floordiv__(Vector2i self, int divisor):
+        return make_vector2i(self.x // divisor, self.y // divisor)
+
+    def __iadd__(Vector2i self, other):
+        cdef int x, y
+
+        if not unpack_vector2i(other, &x, &y):
+            raise TypeError("Expected a pair of integers")
+
+        self.x += x
+        self.y += y
+        return self
+
+    def __isub__(Vector2i self, other):
+        cdef int x, y
+
+        if not unpack_vector2i(other, &x, &y):
+            raise TypeError("Expected a pair of integers")
+
+        self.x -= x
+        self.y -= y
+        return self
+
+    def __imul__(Vector2i self, int factor):
+        self.x *= factor
+        self.y *= factor
+        return self
+
+    def __ifloordiv__(Vector2i self, int divisor):
+        self.x //= divisor
+        self.y //= divisor
+        return self
+
+    def __neg__(self):
+        return make_vector2i(-self.x, -self.y)
+
+    def __copy__(self):
+        return make_vector2i(self.x, self.y)
+
+cdef inline Vector2i make_vector2i(int x, int y):
+    cdef Vector2i r = Vector2i.__new__(Vector2i)
+    r.x = x
+    r.y = y
+    return r
+
+@cython.freelist(16)
+cdef public class Vector3f[type PyVector3fType, object PyVector3fObject]:
+    cdef public double x
+    cdef public double y
+    cdef public double z
+
+    def __init__(self, double x=0, double y=0, double z=0):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    def __repr__(self):
+        return "Vector3f(x={0}, y={1}, z={2})".format(self.x, self.y, self.z)
+
+    def __str__(self):
+        return "({0}, {1}, {2})".format(self.x, self.y, self.z)
+
+    def __richcmp__(Vector3f self, other, int op):
+        cdef double x, y, z
+
+        if op != 2 and op != 3:
+            return NotImplemented
+
+        try:
+            unpack_vector3(other, &x, &y, &z)
+        except (TypeError, ValueError):
+            return NotImplemented
+        return (self.x == x and self.y == y and self.z == z) == (op == 2)
+
+    def __len__(self):
+        return 3
+
+    def __getitem__(self, Py_ssize_t index):
+        if index == 0 or index == -3:
+            return self.x
+        elif index == 1 or index == -2:
+            return self.y
+        elif index == 2 or index == -1:
+            return self.z
+
+        raise IndexError("Vector3f index out of range")
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.z))
+
+    def __add__(left, right):
+        cdef double lx, ly, lz, rx, ry, rz
+
+        try:
+            unpack_vector3(left, &lx, &ly, &lz)
+            unpack_vector3(right, &rx, &ry, &rz)
+        except (TypeError, ValueError):
+            return NotImplemented
+
+        return make_vector3f(lx + rx, ly + ry, lz + rz)
+
+    def __sub__(left, right):
+        cdef double lx, ly, lz, rx, ry, rz
+
+        try:
+            unpack_vector3(left, &lx, &ly, &lz)
+            unpack_vector3(right, &rx, &ry, &rz)
+        except (TypeError, ValueError):
+            return NotImplemented
+
+        return make_vector3f(lx - rx, ly - ry, lz - rz)
+
+    def __mul__(left, right):
+        cdef Vector3f vector
+        cdef double factor
+
+        if isinstance(left, Vector3f):
+            vector, scalar = left, right
+        else:
+            vector, scalar = right, left
+
+        if not is_real(scalar):
+            return NotImplemented
+
+        factor = scalar
+        return make_vector3f(vector.x * factor, vector.y * factor, vector.z * factor)
+
+    def __truediv__(Vector3f self, double divisor):
+        return make_vector3f(self.x / divisor, self.y / divisor, self.z / divisor)
+
+    def __iadd__(Vector3f self, other):
+        cdef double x, y, z
+
+        unpack_vector3(other, &x, &y, &z)
+        self.x += x
+        self.y += y
+        self.z += z
+        return self
+
+    def __isub__(Vector3f self, other):
+        cdef double x, y, z
+
+        unpack_vector3(other, &x, &y, &z)
+        self.x -= x
+        self.y -= y
+        self.z -= z
+        return self
+
+    def __imul__(Vector3f self, double factor):
+        self.x *= factor
+        self.y *= factor
+        self.z *= factor
+        return self
+
+    def __itruediv__(Vector3f self, double divisor):
+        self.x /= divisor
+        self.y /= divisor
+        self.z /= divisor
+        return self
+
+    def __neg__(self):
+        return make_vector3f(-self.x, -self.y, -self.z)
+
+    def __copy__(self):
+        return make_vector3f(self.x, self.y, self.z)
+
+cdef inline Vector3f make_vector3f(double x, double y, double z):
+    cdef Vector3f r = Vector3f.__new__(Vector3f)
+    r.x = x
+    r.y = y
+    r.z = z
+    return r
+
+@cython.freelist(32)
 cdef public class Time[type PyTimeType, object PyTimeObject]:
     ZERO = wrap_time(<sf.Time*>&sf.time.Zero)
 
@@ -441,51 +939,34 @@ cdef public class Time[type PyTimeType, object PyTimeObject]:
             return x.p_this[0] >= y.p_this[0]
 
     def __add__(Time x, Time y):
-        cdef sf.Time* p = new sf.Time()
-        p[0] = x.p_this[0] + y.p_this[0]
-        return wrap_time(p)
+        return make_time(x.p_this[0] + y.p_this[0])
 
     def __sub__(Time x, Time y):
-        cdef sf.Time* p = new sf.Time()
-        p[0] = x.p_this[0] - y.p_this[0]
-        return wrap_time(p)
+        return make_time(x.p_this[0] - y.p_this[0])
 
     def __mul__(Time self, other):
-        cdef sf.Time* p = new sf.Time()
-
         if isinstance(other, (int, long)):
-            p[0] = self.p_this[0] * <Int64>other
+            return make_time(self.p_this[0] * <Int64>other)
         elif isinstance(other, float):
-            p[0] = self.p_this[0] * <float>other
-        else:
-            return NotImplemented
+            return make_time(self.p_this[0] * <float>other)
 
-        return wrap_time(p)
+        return NotImplemented
 
     def __truediv__(Time self, other):
-        cdef sf.Time* p
-
         if isinstance(other, Time):
 #            return self.p_this[0] / (<Time>other).p_this[0]
             return Time_div_Time(self.p_this[0], (<Time>other).p_this[0])
-        else:
-            p = new sf.Time()
-            if isinstance(other, (int, long)):
-#                p[0] = self.p_this[0] / <Int64>other
-                p[0] = Time_div_int(self.p_this[0], <Int64>other)
-            elif isinstance(other, float):
-#                p[0] = self.p_this[0] / <float>other
-                p[0] = Time_div_float(self.p_this[0], <float>other)
-            else:
-                del p
-                return NotImplemented
-
-            return wrap_time(p)
+        elif isinstance(other, (int, long)):
+#            return self.p_this[0] / <Int64>other
+            return make_time(Time_div_int(self.p_this[0], <Int64>other))
+        elif isinstance(other, float):
+#            return self.p_this[0] / <float>other
+            return make_time(Time_div_float(self.p_this[0], <float>other))
+
+        return NotImplemented
 
     def __mod__(Time x, Time y):
-        cdef sf.Time* p = new sf.Time()
-        p[0] = x.p_this[0] % y.p_this[0]
-        return wrap_time(p)
+        return make_time(x.p_this[0] % y.p_this[0])
 
     def __iadd__(self, Time x):
         self.p_this[0] += x.p_this[0]
@@ -522,9 +1003,7 @@ cdef public class Time[type PyTimeType, object PyTimeObject]:
         return self
 
     def __neg__(self):
-        cdef sf.Time* p = new sf.Time()
-        p[0] = -self.p_this[0]
-        return wrap_time(p)
+        return make_time(-self.p_this[0])
 
     property seconds:
         def __get__(self):
@@ -548,16 +1027,21 @@ cdef public class Time[type PyTimeType, object PyTimeObject]:
             self.p_this[0] = sf.microseconds(microseconds)
 
     def __copy__(self):
-        cdef sf.Time* p = new sf.Time()
-        p[0] = self.p_this[0]
-        return wrap_time(p)
+        return make_time(self.p_this[0])
 
 
 cdef api object wrap_time(sf.Time* p):
     cdef Time r = Time.__new__(Time)
+    del r.p_this
     r.p_this = p
     return r
 
+cdef inline Time make_time(sf.Time time):
+    # copies into the instance's own allocation instead of replacing it
+    cdef Time r = Time.__new__(Time)
+    r.p_this[0] = time
+    return r
+
 def sleep(Time duration):
     with nogil: sf.sleep(duration.p_this[0])
 
@@ -578,26 +1062,670 @@ cdef class Clock:
 
     property elapsed_time:
         def __get__(self):
-            cdef sf.Time* p = new sf.Time()
-            p[0] = self.p_this.getElapsedTime()
-            return wrap_time(p)
+            return make_time(self.p_this.getElapsedTime())
 
     def restart(self):
-        cdef sf.Time* p = new sf.Time()
-        p[0] = self.p_this.restart()
-        return wrap_time(p)
+        return make_time(self.p_this.restart())
+
+    property elapsed_microseconds:
+        """ The elapsed time as an integer number of microseconds, read
+        without creating a Time. """
+        def __get__(self):
+            return self.p_this.getElapsedTime().asMicroseconds()
+
+    def restart_microseconds(self):
+        """ Restart the clock and return the elapsed time in
+        microseconds. """
+        return self.p_this.restart().asMicroseconds()
+
+cdef class FrameScheduler:
+    """ Run a game loop with updates at a fixed rate, independent of the
+    frame rate, and frames paced to precise deadlines.
+
+    Example::
+
+        scheduler = sf.FrameScheduler(update_rate=120, frame_rate=60)
+
+        def update(dt):
+            for event in window.events:
+                ...
+            world.step(dt)
+
+        def draw(alpha):
+            window.clear()
+            world.draw(window, alpha)
+
+        while window.is_open:
+            scheduler.frame(update, draw, window.display)
+
+        print(scheduler.report())
+
+    Each frame runs as many updates of 1 / update_rate seconds as the
+    elapsed time calls for, but at most `max_updates`; when the game
+    can't keep up, the time left over is dropped rather than piling up.
+    draw() gets the fraction of a step elapsed since the last update, to
+    interpolate with.
+
+    Frames are paced by sleeping until shortly before the deadline and
+    busy waiting the rest, since sleep() is only as precise as the
+    system scheduler. The busy wait is `spin` long, or longer if sleeps
+    are seen to overshoot by more. A frame_rate of 0 disables pacing,
+    e.g. when vertical synchronization already does it.
+
+    The time spent updating, drawing, displaying and idling is kept for
+    the last `history` frames, for history(), percentile() and report(). """
+    FIELDS = ('update', 'draw', 'display', 'idle', 'frame')
+
+    cdef sf.Clock      m_clock
+    cdef Int64         m_step
+    cdef Int64         m_period
+    cdef Int64         m_spin
+    cdef Int64         m_oversleep
+    cdef unsigned int  m_max_updates
+    cdef Int64         m_accumulator
+    cdef Int64         m_last_start
+    cdef Int64         m_deadline
+    cdef Uint64        m_frames
+    cdef Uint64        m_updates
+    cdef Uint64        m_skipped
+    cdef vector[Int64] m_history
+    cdef size_t        m_length
+
+    def __init__(self, double update_rate=60, double frame_rate=60, unsigned int max_updates=5, Time spin=None, size_t history=240):
+        self.update_rate = update_rate
+        self.frame_rate = frame_rate
+        self.m_max_updates = max(max_updates, 1)
+        self.m_spin = spin.p_this.asMicroseconds() if spin is not None else 1500
+        self.m_length = history
+        self.m_history.resize(history * 5)
+        self.reset()
+
+    def __repr__(self):
+        return "FrameScheduler(update_rate={0}, frame_rate={1}, frames={2}, updates={3})".format(self.update_rate, self.frame_rate, self.frames, self.updates)
+
+    def reset(self):
+        """ Forget the statistics and start over as if no frame ran yet. """
+        self.m_accumulator = 0
+        self.m_oversleep = 0
+        self.m_frames = 0
+        self.m_updates = 0
+        self.m_skipped = 0
+        self.m_clock.restart()
+
+    cdef inline Int64 now(self):
+        return self.m_clock.getElapsedTime().asMicroseconds()
+
+    cdef Int64 wait(self):
+        # sleep, then spin, until the deadline and return the time waited
+        cdef Int64 begin = self.now()
+        cdef Int64 now = begin
+        cdef Int64 margin
+        cdef Int64 request
+        cdef sf.Time duration
+
+        if self.m_period <= 0:
+            return 0
+
+        # forget past oversleeps slowly, whether this frame sleeps or not
+        # (and re-bound them in case the frame rate changed)
+        self.m_oversleep = min(self.m_oversleep - self.m_oversleep // 64, self.m_period // 4)
+        margin = max(self.m_spin, self.m_oversleep)
+
+        if self.m_deadline - now > margin:
+            request = self.m_deadline - now - margin
+            duration = sf.microseconds(request)
+
+            with nogil:
+                sf.sleep(duration)
+
+            now = self.now()
+
+            # remember by how much sleeps overshoot; a single huge one (a
+            # suspend, a breakpoint) must not turn every later frame into
+            # a busy wait, so at most a quarter of the frame is spun
+            self.m_oversleep = min(max(now - begin - request, self.m_oversleep), self.m_period // 4)
+
+        while now < self.m_deadline:
+            now = self.now()
+
+        self.m_deadline += self.m_period
+
+        # more than a frame late: start pacing again from now rather than
+        # rushing the frames missed
+        if self.m_deadline < now:
+            self.m_deadline = now + self.m_period
+
+        return now - begin
+
+    def frame(self, update, draw=None, display=None):
+        """ Run the updates due, then draw(alpha) and display(), and wait
+        for the frame deadline; return the number of updates made. """
+        cdef Int64 start = self.now()
+        cdef Int64 updated, drawn, displayed, idle
+        cdef Int64 *times
+        cdef unsigned int count = 0
+        cdef double step = self.m_step / 1e6
+
+        if self.m_frames == 0:
+            # the first frame always steps once, with nothing to catch up
+            self.m_accumulator = self.m_step
+            self.m_deadline = start + self.m_period
+        else:
+            self.m_accumulator += start - self.m_last_start
+
+        self.m_last_start = start
+
+        while self.m_accumulator >= self.m_step:
+            if count == self.m_max_updates:
+                self.m_skipped += self.m_accumulator // self.m_step
+                self.m_accumulator %= self.m_step
+                break
+
+            update(step)
+            self.m_accumulator -= self.m_step
+            count += 1
+
+        self.m_updates += count
+        updated = self.now()
+
+        if draw is not None:
+            draw(self.alpha)
+
+        drawn = self.now()
+
+        if display is not None:
+            display()
+
+        displayed = self.now()
+        idle = self.wait()
+
+        if self.m_length > 0:
+            times = &self.m_history[(self.m_frames % self.m_length) * 5]
+            times[0] = updated - start
+            times[1] = drawn - updated
+            times[2] = displayed - drawn
+            times[3] = idle
+            times[4] = self.now() - start
+
+        self.m_frames += 1
+        return count
+
+    def history(self, field='frame'):
+        """ Return the time spent in a phase over the recorded frames,
+        oldest first, as an array of doubles in microseconds. """
+        cdef array.array values
+        cdef size_t count = min(self.m_frames, self.m_length)
+        cdef size_t i
+        cdef int index
+
+        if field not in FrameScheduler.FIELDS:
+            raise ValueError("Unknown field: {0}".format(field))
+
+        index = FrameScheduler.FIELDS.index(field)
+        values = array.clone(array.array('d'), count, False)
+
+        for i in range(count):
+            values.data.as_doubles[i] = self.m_history[((self.m_frames - count + i) % self.m_length) * 5 + index]
+
+        return values
+
+    def percentile(self, field='frame', double q=99):
+        """ Return the q-th percentile of the time spent in a phase over
+        the recorded frames, in microseconds (nearest rank). """
+        values = sorted(self.history(field))
+
+        if not 0 <= q <= 100:
+            raise ValueError("The percentile must be between 0 and 100")
+
+        if not values:
+            return 0.0
+
+        return values[min(max(int(math.ceil(q / 100 * len(values))) - 1, 0), len(values) - 1)]
+
+    def report(self, percentiles=(50, 90, 99)):
+        """ Return a table of the mean, percentiles and maximum of each
+        phase over the recorded frames, in milliseconds. """
+        header = "{0:<10}{1:>10}".format("phase", "mean")
+        header += "".join("{0:>10}".format("p{0}".format(q)) for q in percentiles)
+        lines = [header + "{0:>10}".format("max")]
+
+        for field in FrameScheduler.FIELDS:
+            values = self.history(field)
+            mean = sum(values) / len(values) if values else 0.0
+            line = "{0:<10}{1:>10.3f}".format(field, mean / 1000)
+            line += "".join("{0:>10.3f}".format(self.percentile(field, q) / 1000) for q in percentiles)
+            lines.append(line + "{0:>10.3f}".format(max(values) / 1000 if values else 0.0))
+
+        lines.append("{0} frames, {1} updates, {2} skipped".format(self.m_frames, self.m_updates, self.m_skipped))
+        return "\n".join(lines)
+
+    property update_rate:
+        def __get__(self):
+            return 1e6 / self.m_step
+
+        def __set__(self, double update_rate):
+            if update_rate <= 0:
+                raise ValueError("The update rate must be positive")
+
+            self.m_step = max(<Int64>(1e6 / update_rate + 0.5), 1)
+
+    property frame_rate:
+        def __get__(self):
+            return 1e6 / self.m_period if self.m_period > 0 else 0.0
+
+        def __set__(self, double frame_rate):
+            if frame_rate < 0:
+                raise ValueError("The frame rate can't be negative")
+
+            self.m_period = <Int64>(1e6 / frame_rate + 0.5) if frame_rate > 0 else 0
+
+    property max_updates:
+        def __get__(self):
+            return self.m_max_updates
+
+        def __set__(self, unsigned int max_updates):
+            self.m_max_updates = max(max_updates, 1)
+
+    property spin:
+        def __get__(self):
+            return make_time(sf.microseconds(self.m_spin))
+
+        def __set__(self, Time spin):
+            self.m_spin = spin.p_this.asMicroseconds()
+
+    property time_step:
+        def __get__(self):
+            return make_time(sf.microseconds(self.m_step))
+
+    property alpha:
+        def __get__(self):
+            return self.m_accumulator / <double>self.m_step
+
+    property frames:
+        def __get__(self):
+            return self.m_frames
+
+    property updates:
+        def __get__(self):
+            return self.m_updates
+
+    property skipped_updates:
+        def __get__(self):
+            return self.m_skipped
+
+cdef struct OpenScope:
+    void  *scope
+    Int64 begin
+
+cdef struct TraceEvent:
+    Int64 begin
+    Int64 duration
+    Int32 scope
+
+# log-linear histogram buckets: exact below 32 us, then 16 buckets per
+# power of two (6% precision) up to 2^41 us
+cdef enum:
+    HISTOGRAM_EXACT = 32
+    HISTOGRAM_STEPS = 16
+    HISTOGRAM_BUCKETS = 32 + 36 * 16
+
+cdef inline size_t histogram_index(Int64 value) nogil:
+    cdef int msb = 4
+    cdef Int64 rest
+
+    if value < HISTOGRAM_EXACT:
+        return value if value > 0 else 0
+
+    rest = value >> 5
+
+    while rest:
+        msb += 1
+        rest >>= 1
+
+    if msb > 40:
+        return HISTOGRAM_BUCKETS - 1
+
+    return HISTOGRAM_EXACT + (msb - 5) * HISTOGRAM_STEPS + (value >> (msb - 4)) - HISTOGRAM_STEPS
+
+cdef inline Int64 histogram_value(size_t index) nogil:
+    # the highest value counted in a bucket
+    cdef size_t shift, mantissa
+
+    if index < HISTOGRAM_EXACT:
+        return index
+
+    shift = (index - HISTOGRAM_EXACT) // HISTOGRAM_STEPS + 1
+    mantissa = (index - HISTOGRAM_EXACT) % HISTOGRAM_STEPS + HISTOGRAM_STEPS
+    return ((<Int64>mantissa + 1) << shift) - 1
+
+cdef class Profiler
+
+cdef class ProfileScope:
+    """ A named scope of a Profiler, timed with `with`, as a decorator or
+    with begin() and end(). Timing a scope only stores integers; each
+    frame, the time it spent is added to a histogram. Get one with
+    Profiler.scope(). """
+    cdef Profiler        m_profiler
+    cdef Int32           m_id
+    cdef object          m_name
+    cdef Int64           m_frame_time
+    cdef Uint64          m_frame_calls
+    cdef Int64           m_last
+    cdef Int64           m_total
+    cdef Int64           m_max
+    cdef Uint64          m_calls
+    cdef Uint64          m_frames
+    cdef vector[Uint32]  m_histogram
+
+    def __init__(self):
+        raise UserWarning("Use Profiler.scope() instead")
+
+    def __repr__(self):
+        return "ProfileScope(name={0!r}, calls={1}, frames={2}, mean={3})".format(self.m_name, self.m_calls, self.m_frames, self.mean)
+
+    def __enter__(self):
+        self.m_profiler.open(self)
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.m_profiler.close(self)
+
+    def __call__(self, function):
+        """ Decorate a function so each call is timed in this scope. """
+        cdef ProfileScope scope = self
+
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            scope.m_profiler.open(scope)
+
+            try:
+                return function(*args, **kwargs)
+            finally:
+                scope.m_profiler.close(scope)
+
+        return timed
+
+    def begin(self):
+        self.m_profiler.open(self)
+
+    def end(self):
+        self.m_profiler.close(self)
+
+    cdef void add(self, Int64 duration):
+        self.m_frame_time += duration
+        self.m_frame_calls += 1
+
+    cdef void end_frame(self):
+        if self.m_frame_calls == 0:
+            return
+
+        self.m_histogram[histogram_index(self.m_frame_time)] += 1
+        self.m_last = self.m_frame_time
+        self.m_total += self.m_frame_time
+        self.m_max = max(self.m_max, self.m_frame_time)
+        self.m_calls += self.m_frame_calls
+        self.m_frames += 1
+        self.m_frame_time = 0
+        self.m_frame_calls = 0
+
+    cdef void reset(self):
+        self.m_frame_time = self.m_frame_calls = 0
+        self.m_last = self.m_total = self.m_max = 0
+        self.m_calls = self.m_frames = 0
+        self.m_histogram.assign(HISTOGRAM_BUCKETS, 0)
+
+    def percentile(self, double q=99):
+        """ Return the q-th percentile of the time spent per frame in the
+        scope, in microseconds, within the histogram precision. """
+        cdef Uint64 rank, count = 0
+        cdef size_t i
+
+        if not 0 <= q <= 100:
+            raise ValueError("The percentile must be between 0 and 100")
+
+        if self.m_frames == 0:
+            return 0
+
+        rank = max(<Uint64>(q / 100 * self.m_frames + 0.5), 1)
+
+        for i in range(HISTOGRAM_BUCKETS):
+            count += self.m_histogram[i]
+
+            if count >= rank:
+                return min(histogram_value(i), self.m_max)
+
+        return self.m_max
+
+    def histogram(self):
+        """ Return the non-empty buckets of the histogram of the time spent
+        per frame as (highest value in microseconds, count) pairs. """
+        cdef size_t i
+
+        return [(histogram_value(i), self.m_histogram[i]) for i in range(HISTOGRAM_BUCKETS) if self.m_histogram[i]]
+
+    property name:
+        def __get__(self):
+            return self.m_name
+
+    property calls:
+        def __get__(self):
+            return self.m_calls
+
+    property frames:
+        def __get__(self):
+            return self.m_frames
+
+    property total_time:
+        def __get__(self):
+            return self.m_total
+
+    property last:
+        def __get__(self):
+            return self.m_last
+
+    property mean:
+        def __get__(self):
+            return self.m_total / self.m_frames if self.m_frames else 0.0
+
+    property max:
+        def __get__(self):
+            return self.m_max
+
+
+cdef class Profiler:
+    """ Lightweight profiling with named, nestable scopes.
+
+    Example::
+
+        profiler = sf.Profiler()
+        update = profiler.scope("update")
+
+        @profiler.scope("draw")
+        def draw():
+            ...
+
+        while window.is_open:
+            with update:
+                ...
+            draw()
+            window.display()
+            profiler.end_frame()
+
+        print(profiler.report())
+        profiler.export_chrome_trace("capture.json")
+
+    Times are integer microseconds of the profiler's clock. The time of
+    each scope is summed over a frame and added to its histogram by
+    end_frame(), which also times the frame itself as the "frame" scope.
+    The last `trace_capacity` timed spans are kept for
+    export_chrome_trace(), whose output can be opened in
+    chrome://tracing or Perfetto; a capacity of 0 disables tracing. """
+    cdef sf.Clock          m_clock
+    cdef dict              m_scopes
+    cdef list              m_order
+    cdef vector[OpenScope] m_stack
+    cdef vector[TraceEvent] m_trace
+    cdef size_t            m_trace_head
+    cdef Uint64            m_trace_count
+    cdef ProfileScope      m_frame
+    cdef Int64             m_frame_start
+    cdef Uint64            m_frames
+
+    def __init__(self, size_t trace_capacity=100000):
+        self.m_scopes = {}
+        self.m_order = []
+        self.m_trace.resize(trace_capacity)
+        self.m_frame = self.scope("frame")
+
+    def __repr__(self):
+        return "Profiler(scopes={0}, frames={1})".format(len(self.m_order), self.m_frames)
+
+    cdef inline Int64 now(self):
+        return self.m_clock.getElapsedTime().asMicroseconds()
+
+    def scope(self, name):
+        """ Return the scope of that name, created on first use. """
+        cdef ProfileScope scope = self.m_scopes.get(name)
+
+        if scope is None:
+            scope = ProfileScope.__new__(ProfileScope)
+            scope.m_profiler = self
+            scope.m_id = len(self.m_order)
+            scope.m_name = name
+            scope.m_histogram.assign(HISTOGRAM_BUCKETS, 0)
+            self.m_scopes[name] = scope
+            self.m_order.append(scope)
+
+        return scope
+
+    cdef void trace(self, Int32 scope, Int64 begin, Int64 duration):
+        cdef TraceEvent *event
+
+        if self.m_trace.empty():
+            return
+
+        event = &self.m_trace[self.m_trace_head]
+        event.begin = begin
+        event.duration = duration
+        event.scope = scope
+        self.m_trace_head = (self.m_trace_head + 1) % self.m_trace.size()
+        self.m_trace_count += 1
+
+    cdef int open(self, ProfileScope scope) except -1:
+        cdef OpenScope entry
+
+        entry.scope = <void*>scope
+        entry.begin = self.now()
+        self.m_stack.push_back(entry)
+        return 0
+
+    cdef int close(self, ProfileScope scope) except -1:
+        cdef Int64 end = self.now()
+        cdef OpenScope entry
+
+        if self.m_stack.empty() or self.m_stack.back().scope != <void*>scope:
+            raise ValueError("Scopes must be closed in the reverse order they were opened")
+
+        entry = self.m_stack.back()
+        self.m_stack.pop_back()
+        scope.add(end - entry.begin)
+        self.trace(scope.m_id, entry.begin, end - entry.begin)
+        return 0
+
+    def end_frame(self):
+        """ Close the current frame: add the time of each scope during the
+        frame to its histogram and start the next one. """
+        cdef Int64 end = self.now()
+        cdef ProfileScope scope
+
+        self.m_frame.add(end - self.m_frame_start)
+        self.trace(self.m_frame.m_id, self.m_frame_start, end - self.m_frame_start)
+
+        for scope in self.m_order:
+            scope.end_frame()
+
+        self.m_frame_start = end
+        self.m_frames += 1
+
+    def reset(self):
+        """ Clear the statistics and the trace; scopes are kept. """
+        cdef ProfileScope scope
+
+        for scope in self.m_order:
+            scope.reset()
+
+        self.m_stack.clear()
+        self.m_trace_head = 0
+        self.m_trace_count = 0
+        self.m_frames = 0
+        self.m_clock.restart()
+        self.m_frame_start = 0
+
+    def report(self, percentiles=(50, 90, 99)):
+        """ Return a table of the time spent per frame in each scope, in
+        milliseconds, busiest scopes first. """
+        header = "{0:<20}{1:>10}{2:>10}".format("scope", "calls", "mean")
+        header += "".join("{0:>10}".format("p{0}".format(q)) for q in percentiles)
+        lines = [header + "{0:>10}".format("max")]
+        scopes = sorted(self.m_order, key=lambda scope: scope.total_time, reverse=True)
+
+        for scope in scopes:
+            line = "{0:<20}{1:>10.1f}{2:>10.3f}".format(scope.name[:19], scope.calls / max(scope.frames, 1), scope.mean / 1000)
+            line += "".join("{0:>10.3f}".format(scope.percentile(q) / 1000) for q in percentiles)
+            lines.append(line + "{0:>10.3f}".format(scope.max / 1000))
+
+        return "\n".join(lines)
+
+    def export_chrome_trace(self, file):
+        """ Write the traced spans as Chrome trace event JSON to a file
+        object opened for writing text, or to the file at the path given. """
+        cdef size_t count = min(self.m_trace_count, self.m_trace.size())
+        cdef size_t start = 0, i
+        cdef TraceEvent *event
+        cdef ProfileScope scope
+        cdef list events = []
+
+        if count > 0:
+            start = (self.m_trace_head + self.m_trace.size() - count) % self.m_trace.size()
+
+        for i in range(count):
+            event = &self.m_trace[(start + i) % self.m_trace.size()]
+            scope = self.m_order[event.scope]
+            events.append({"name": scope.m_name, "ph": "X", "ts": event.begin,
+                           "dur": event.duration, "pid": 1, "tid": 1})
+
+        trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+
+        if isinstance(file, (bytes, unicode, str)):
+            with open(file, "w") as f:
+                json.dump(trace, f)
+        else:
+            json.dump(trace, file)
+
+    property microseconds:
+        """ The time of the profiler's clock, in microseconds. """
+        def __get__(self):
+            return self.now()
+
+    property scopes:
+        def __get__(self):
+            return list(self.m_order)
+
+    property frames:
+        def __get__(self):
+            return self.m_frames
+
+    property depth:
+        def __get__(self):
+            return self.m_stack.size()
+
+
 
 def seconds(float amount):
-    cdef sf.Time* p = new sf.Time()
-    p[0] = sf.seconds(amount)
-    return wrap_time(p)
+    return make_time(sf.seconds(amount))
 
 def milliseconds(Int32 amount):
-    cdef sf.Time* p = new sf.Time()
-    p[0] = sf.milliseconds(amount)
-    return wrap_time(p)
+    return make_time(sf.milliseconds(amount))
 
 def microseconds(Int64 amount):
-    cdef sf.Time* p = new sf.Time()
-    p[0] = sf.microseconds(amount)
-    return wrap_time(p)
+    return make_time(sf.microseconds(amount))
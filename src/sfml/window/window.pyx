@@ -10,7 +10,9 @@ from cpython.version cimport PY_VERSION_HEX
 
 from libcpp.vector cimport vector
 
+import array
 import collections
+from struct import Struct
 from enum import IntEnum
 
 cimport sfml as sf
@@ -19,7 +21,7 @@ from sfml cimport Uint8, Uint16, Uint32, Uint64
 
 from pysfml.system cimport Vector2, Vector3
 from pysfml.system cimport to_vector2i, to_vector2u
-from pysfml.system cimport wrap_vector2i
+from pysfml.system cimport wrap_vector2i, wrap_time
 from pysfml.system cimport to_string, wrap_string
 from pysfml.system cimport popLastErrorMessage, import_sfml__system
 
@@ -30,13 +32,17 @@ cdef extern from "pysfml/window/DerivableWindow.hpp":
         DerivableWindow(object)
 
 from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy, memset
+from cpython.buffer cimport PyBUF_FORMAT, PyBUF_ND, PyBUF_STRIDES, PyBUF_WRITABLE
+from cpython cimport array
 
 __all__ = ['Style', 'VideoMode', 'ContextSettings', 'SizeEvent',
             'KeyEvent', 'TextEvent', 'MouseMoveEvent', 'MouseButtonEvent',
             'MouseWheelEvent', 'MouseWheelScrollEvent', 'JoystickMoveEvent',
             'JoystickButtonEvent', 'JoystickConnectEvent', 'TouchEvent',
-            'SensorEvent', 'Event', 'Window', 'Keyboard', 'Joystick',
-            'Mouse', 'Touch', 'Sensor', 'Context']
+            'SensorEvent', 'Event', 'EventBatch', 'EventRecorder',
+            'EventReplay', 'Window', 'Keyboard', 'Joystick',
+            'Mouse', 'Touch', 'Sensor', 'InputState', 'Context']
 
 if PY_VERSION_HEX >= 0x03000000:
     unichr = chr
@@ -686,6 +692,649 @@ cdef api Event wrap_event(sf.Event *p):
 
     return event
 
+# An event in a fixed layout, whatever its type, so a batch of them can be
+# viewed as a structured array (see EventBatch for the meaning of the
+# fields).
+cdef struct EventRecord:
+    Int32 type
+    Int32 code
+    Int32 x
+    Int32 y
+    float values[3]
+
+cdef char* EVENT_RECORD_FORMAT = "T{i:type:i:code:i:x:i:y:(3)f:values:}"
+
+cdef enum:
+    MODIFIER_ALT = 1
+    MODIFIER_CONTROL = 2
+    MODIFIER_SHIFT = 4
+    MODIFIER_SYSTEM = 8
+
+cdef void event_to_record(const sf.Event *event, EventRecord *record) nogil:
+    memset(record, 0, sizeof(EventRecord))
+    record.type = event.type
+
+    if event.type == sf.event.Resized:
+        record.x = event.size.width
+        record.y = event.size.height
+    elif event.type == sf.event.KeyPressed or event.type == sf.event.KeyReleased:
+        record.code = <Int32>event.key.code
+        record.x = ((MODIFIER_ALT if event.key.alt else 0) |
+                    (MODIFIER_CONTROL if event.key.control else 0) |
+                    (MODIFIER_SHIFT if event.key.shift else 0) |
+                    (MODIFIER_SYSTEM if event.key.system else 0))
+    elif event.type == sf.event.TextEntered:
+        record.code = event.text.unicode
+    elif event.type == sf.event.MouseMoved:
+        record.x = event.mouseMove.x
+        record.y = event.mouseMove.y
+    elif event.type == sf.event.MouseButtonPressed or event.type == sf.event.MouseButtonReleased:
+        record.code = <Int32>event.mouseButton.button
+        record.x = event.mouseButton.x
+        record.y = event.mouseButton.y
+    elif event.type == sf.event.MouseWheelMoved:
+        record.x = event.mouseWheel.x
+        record.y = event.mouseWheel.y
+        record.values[0] = event.mouseWheel.delta
+    elif event.type == sf.event.MouseWheelScrolled:
+        record.code = <Int32>event.mouseWheelScroll.wheel
+        record.x = event.mouseWheelScroll.x
+        record.y = event.mouseWheelScroll.y
+        record.values[0] = event.mouseWheelScroll.delta
+    elif event.type == sf.event.JoystickMoved:
+        record.code = event.joystickMove.joystickId
+        record.x = <Int32>event.joystickMove.axis
+        record.values[0] = event.joystickMove.position
+    elif event.type == sf.event.JoystickButtonPressed or event.type == sf.event.JoystickButtonReleased:
+        record.code = event.joystickButton.joystickId
+        record.x = event.joystickButton.button
+    elif event.type == sf.event.JoystickConnected or event.type == sf.event.JoystickDisconnected:
+        record.code = event.joystickConnect.joystickId
+    elif event.type == sf.event.TouchBegan or event.type == sf.event.TouchMoved or event.type == sf.event.TouchEnded:
+        record.code = event.touch.finger
+        record.x = event.touch.x
+        record.y = event.touch.y
+    elif event.type == sf.event.SensorChanged:
+        record.code = <Int32>event.sensor.type
+        record.values[0] = event.sensor.x
+        record.values[1] = event.sensor.y
+        record.values[2] = event.sensor.z
+
+cdef void record_to_event(const EventRecord *record, sf.Event *event) nogil:
+    memset(event, 0, sizeof(sf.Event))
+    event.type = <sf.event.EventType>record.type
+
+    if event.type == sf.event.Resized:
+        event.size.width = record.x
+        event.size.height = record.y
+    elif event.type == sf.event.KeyPressed or event.type == sf.event.KeyReleased:
+        event.key.code = <sf.keyboard.Key>record.code
+        event.key.alt = record.x & MODIFIER_ALT
+        event.key.control = record.x & MODIFIER_CONTROL
+        event.key.shift = record.x & MODIFIER_SHIFT
+        event.key.system = record.x & MODIFIER_SYSTEM
+    elif event.type == sf.event.TextEntered:
+        event.text.unicode = record.code
+    elif event.type == sf.event.MouseMoved:
+        event.mouseMove.x = record.x
+        event.mouseMove.y = record.y
+    elif event.type == sf.event.MouseButtonPressed or event.type == sf.event.MouseButtonReleased:
+        event.mouseButton.button = <sf.mouse.Button>record.code
+        event.mouseButton.x = record.x
+        event.mouseButton.y = record.y
+    elif event.type == sf.event.MouseWheelMoved:
+        event.mouseWheel.delta = <int>record.values[0]
+        event.mouseWheel.x = record.x
+        event.mouseWheel.y = record.y
+    elif event.type == sf.event.MouseWheelScrolled:
+        event.mouseWheelScroll.wheel = <sf.mouse.Wheel>record.code
+        event.mouseWheelScroll.delta = record.values[0]
+        event.mouseWheelScroll.x = record.x
+        event.mouseWheelScroll.y = record.y
+    elif event.type == sf.event.JoystickMoved:
+        event.joystickMove.joystickId = record.code
+        event.joystickMove.axis = <sf.joystick.Axis>record.x
+        event.joystickMove.position = record.values[0]
+    elif event.type == sf.event.JoystickButtonPressed or event.type == sf.event.JoystickButtonReleased:
+        event.joystickButton.joystickId = record.code
+        event.joystickButton.button = record.x
+    elif event.type == sf.event.JoystickConnected or event.type == sf.event.JoystickDisconnected:
+        event.joystickConnect.joystickId = record.code
+    elif event.type == sf.event.TouchBegan or event.type == sf.event.TouchMoved or event.type == sf.event.TouchEnded:
+        event.touch.finger = record.code
+        event.touch.x = record.x
+        event.touch.y = record.y
+    elif event.type == sf.event.SensorChanged:
+        event.sensor.type = <sf.sensor.Type>record.code
+        event.sensor.x = record.values[0]
+        event.sensor.y = record.values[1]
+        event.sensor.z = record.values[2]
+
+cdef class EventBatch:
+    """ Events drained at once by Window.poll_events(), stored natively.
+
+    Each event is also kept as a record of a type, a code, x, y and three
+    float values, readable with the accessors below or through the buffer
+    protocol as a structured array:
+
+    - RESIZED: x, y are the width and height
+    - KEY_PRESSED, KEY_RELEASED: code is the key, x the ALT, CONTROL,
+      SHIFT and SYSTEM flags
+    - TEXT_ENTERED: code is the unicode code point
+    - MOUSE_MOVED: x, y
+    - MOUSE_BUTTON_PRESSED, MOUSE_BUTTON_RELEASED: code is the button
+    - MOUSE_WHEEL_MOVED, MOUSE_WHEEL_SCROLLED: code is the wheel, values[0]
+      the delta
+    - JOYSTICK_MOVED: code is the joystick, x the axis, values[0] the
+      position
+    - JOYSTICK_BUTTON_PRESSED, JOYSTICK_BUTTON_RELEASED: code is the
+      joystick, x the button
+    - JOYSTICK_CONNECTED, JOYSTICK_DISCONNECTED: code is the joystick
+    - TOUCH_BEGAN, TOUCH_MOVED, TOUCH_ENDED: code is the finger
+    - SENSOR_CHANGED: code is the sensor, values the x, y, z readings
+
+    Indexing or iterating gives regular Event objects, built on demand. """
+    ALT = MODIFIER_ALT
+    CONTROL = MODIFIER_CONTROL
+    SHIFT = MODIFIER_SHIFT
+    SYSTEM = MODIFIER_SYSTEM
+
+    cdef vector[sf.Event]    m_events
+    cdef vector[EventRecord] m_records
+    cdef Py_ssize_t          m_shape
+    cdef Py_ssize_t          m_strides
+    cdef int                 m_exports
+
+    def __init__(self, size_t capacity=64):
+        self.m_events.reserve(capacity)
+        self.m_records.reserve(capacity)
+
+    def __repr__(self):
+        return "EventBatch(length={0})".format(len(self))
+
+    def __len__(self):
+        return self.m_events.size()
+
+    def __getitem__(self, Py_ssize_t index):
+        cdef sf.Event *p
+
+        index = self.check_index(index)
+        p = new sf.Event()
+        p[0] = self.m_events[index]
+        return wrap_event(p)
+
+    def __iter__(self):
+        cdef size_t i
+
+        for i in range(self.m_events.size()):
+            yield self[i]
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        cdef size_t count = self.m_records.size()
+
+        self.m_shape = count
+        self.m_strides = sizeof(EventRecord)
+
+        if count > 0:
+            buffer.buf = <char*>&self.m_records[0]
+        else:
+            buffer.buf = NULL
+
+        if flags & PyBUF_FORMAT:
+            buffer.format = EVENT_RECORD_FORMAT
+        else:
+            buffer.format = NULL
+
+        buffer.internal = NULL
+        buffer.itemsize = sizeof(EventRecord)
+        buffer.len = count * sizeof(EventRecord)
+        buffer.ndim = 1
+        buffer.obj = self
+        buffer.readonly = 1
+        buffer.shape = &self.m_shape if flags & PyBUF_ND else NULL
+        buffer.strides = &self.m_strides if flags & PyBUF_STRIDES else NULL
+        buffer.suboffsets = NULL
+
+        self.m_exports += 1
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        self.m_exports -= 1
+
+    cdef int check_exports(self) except -1:
+        if self.m_exports > 0:
+            raise BufferError("Existing exports of data: event batch cannot be modified")
+
+        return 0
+
+    cdef Py_ssize_t check_index(self, Py_ssize_t index) except -1:
+        if index < 0:
+            index += self.m_events.size()
+
+        if index < 0 or index >= <Py_ssize_t>self.m_events.size():
+            raise IndexError("EventBatch index out of range")
+
+        return index
+
+    cdef void push(self, const sf.Event *event):
+        cdef EventRecord record
+
+        event_to_record(event, &record)
+        self.m_events.push_back(event[0])
+        self.m_records.push_back(record)
+
+    def append(self, sf.event.EventType type, Int32 code=0, Int32 x=0, Int32 y=0, values=(0, 0, 0)):
+        """ Add an event given as a record. """
+        cdef EventRecord record
+        cdef sf.Event event
+
+        self.check_exports()
+
+        record.type = type
+        record.code = code
+        record.x = x
+        record.y = y
+        first, second, third = values
+        record.values[0] = first
+        record.values[1] = second
+        record.values[2] = third
+
+        record_to_event(&record, &event)
+        self.push(&event)
+
+    def clear(self):
+        self.check_exports()
+        self.m_events.clear()
+        self.m_records.clear()
+
+    def type(self, Py_ssize_t index):
+        return self.m_records[self.check_index(index)].type
+
+    def code(self, Py_ssize_t index):
+        return self.m_records[self.check_index(index)].code
+
+    def x(self, Py_ssize_t index):
+        return self.m_records[self.check_index(index)].x
+
+    def y(self, Py_ssize_t index):
+        return self.m_records[self.check_index(index)].y
+
+    def value(self, Py_ssize_t index, unsigned int component=0):
+        if component > 2:
+            raise IndexError("An event has 3 values")
+
+        return self.m_records[self.check_index(index)].values[component]
+
+    def count(self, sf.event.EventType type):
+        """ Return the number of events of a type. """
+        cdef Py_ssize_t count = 0
+        cdef size_t i
+
+        for i in range(self.m_records.size()):
+            if self.m_records[i].type == type:
+                count += 1
+
+        return count
+
+    def find_last(self, sf.event.EventType type):
+        """ Return the index of the last event of a type, or -1; handy to
+        keep only the final position of a burst of moves. """
+        cdef Py_ssize_t i
+
+        for i in range(<Py_ssize_t>self.m_records.size() - 1, -1, -1):
+            if self.m_records[i].type == type:
+                return i
+
+        return -1
+
+cdef struct LoggedEvent:
+    Int64       time
+    Uint32      poll
+    EventRecord record
+
+# magic, version, size of an entry, then a marker to detect logs written
+# with another byte order (entries are stored as they are in memory)
+EVENT_LOG_MAGIC = b"SFEV"
+EVENT_LOG_VERSION = 1
+EVENT_LOG_HEADER = Struct("=4sHHI")
+cdef Uint32 EVENT_LOG_BYTE_ORDER = 0x01020304
+
+# the file must still be there when a dropped recorder is deallocated
+@cython.no_gc_clear
+cdef class EventRecorder:
+    """ Write the events returned by the polling methods of a window to a
+    compact binary log, with the time they were polled at, for
+    EventReplay to play them back.
+
+    Example::
+
+        window.recorder = sf.EventRecorder("session.events")
+        ...
+        window.recorder.close()
+
+    Entries are 40 bytes each and are written out in chunks of
+    `flush_size`, so recording costs a copy per event. The log also keeps
+    where each poll ended, which lets a replay deliver exactly the events
+    of each poll regardless of timing. A recorder dropped without
+    close() is closed when it's deallocated; once closed, it ignores the
+    events of the windows it's still attached to. """
+    cdef object              m_file
+    cdef bint                m_owned
+    cdef vector[LoggedEvent] m_pending
+    cdef size_t              m_flush_size
+    cdef sf.Clock            m_clock
+    cdef Uint32              m_poll
+    cdef Uint64              m_count
+
+    def __init__(self, file, size_t flush_size=256):
+        """ Record to a file object opened for binary writing, or to a
+        file at the path given. """
+        if isinstance(file, (bytes, unicode, str)):
+            file = open(file, "wb")
+            self.m_owned = True
+
+        self.m_file = file
+        self.m_flush_size = max(flush_size, 1)
+        self.m_file.write(EVENT_LOG_HEADER.pack(EVENT_LOG_MAGIC, EVENT_LOG_VERSION, sizeof(LoggedEvent), EVENT_LOG_BYTE_ORDER))
+        self.m_clock.restart()
+
+    def __dealloc__(self):
+        # errors can't be raised from here, the pending entries are lost
+        # if the file can't take them
+        if self.m_file is not None:
+            try:
+                self.close()
+            except Exception:
+                pass
+
+    def __repr__(self):
+        return "EventRecorder(count={0}, polls={1})".format(self.count, self.polls)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    cdef int record(self, const sf.Event *event) except -1:
+        cdef LoggedEvent entry
+
+        # a closed recorder still attached to a window ignores its events
+        if self.m_file is None:
+            return 0
+
+        entry.time = self.m_clock.getElapsedTime().asMicroseconds()
+        entry.poll = self.m_poll
+        event_to_record(event, &entry.record)
+        self.m_pending.push_back(entry)
+        self.m_count += 1
+
+        if self.m_pending.size() >= self.m_flush_size:
+            self.flush()
+
+        return 0
+
+    cdef void end_poll(self):
+        if self.m_file is not None:
+            self.m_poll += 1
+
+    def flush(self):
+        """ Write the buffered entries to the file. """
+        if self.m_file is None:
+            raise ValueError("The recorder is closed")
+
+        if not self.m_pending.empty():
+            self.m_file.write((<char*>&self.m_pending[0])[:self.m_pending.size() * sizeof(LoggedEvent)])
+            self.m_pending.clear()
+
+    def close(self):
+        """ Flush the log, and close the file if the recorder opened it. """
+        if self.m_file is None:
+            return
+
+        self.flush()
+
+        if self.m_owned:
+            self.m_file.close()
+
+        self.m_file = None
+
+    property closed:
+        def __get__(self):
+            return self.m_file is None
+
+    property count:
+        def __get__(self):
+            return self.m_count
+
+    property polls:
+        def __get__(self):
+            return self.m_poll
+
+    property elapsed_time:
+        def __get__(self):
+            cdef sf.Time* p = new sf.Time()
+            p[0] = self.m_clock.getElapsedTime()
+            return wrap_time(p)
+
+
+cdef class EventReplay:
+    """ Play an event log back through the polling methods of a window,
+    in place of the events of the system.
+
+    Example::
+
+        window.event_source = sf.EventReplay("session.events", speed=4.0)
+
+        while not window.event_source.finished:
+            for event in window.events:
+                ...
+
+    With a positive `speed`, an event is delivered once the time elapsed
+    since the first poll, multiplied by `speed`, reaches the time it was
+    recorded at. With a speed of 0, time is ignored and every poll
+    returns the events of the recorded poll of the same rank, which makes
+    the run deterministic and as fast as the program can go.
+
+    A replay can also be polled directly, without a window, through
+    poll_event(), events and poll_events(). """
+    cdef vector[LoggedEvent] m_events
+    cdef size_t              m_next
+    cdef double              m_speed
+    cdef sf.Clock            m_clock
+    cdef bint                m_started
+    cdef double              m_base
+    cdef Uint32              m_poll
+
+    def __init__(self, file, double speed=1.0):
+        """ Read the log from a file object opened for binary reading, or
+        from the file at the path given. """
+        cdef bytes data
+        cdef size_t size
+        cdef Py_ssize_t header_size = EVENT_LOG_HEADER.size
+
+        if speed < 0:
+            raise ValueError("The speed can't be negative")
+
+        if isinstance(file, (bytes, unicode, str)):
+            with open(file, "rb") as f:
+                data = f.read()
+        else:
+            data = file.read()
+
+        if len(data) < header_size:
+            raise IOError("Not an event log")
+
+        magic, version, entry_size, byte_order = EVENT_LOG_HEADER.unpack_from(data)
+
+        if magic != EVENT_LOG_MAGIC:
+            raise IOError("Not an event log")
+        if version != EVENT_LOG_VERSION or entry_size != sizeof(LoggedEvent):
+            raise IOError("Unsupported event log version")
+        if byte_order != EVENT_LOG_BYTE_ORDER:
+            raise IOError("The event log was recorded with another byte order")
+
+        size = (len(data) - header_size) // sizeof(LoggedEvent)
+        self.m_events.resize(size)
+
+        if size > 0:
+            memcpy(&self.m_events[0], <char*>data + header_size, size * sizeof(LoggedEvent))
+
+        self.m_speed = speed
+
+    def __repr__(self):
+        return "EventReplay(position={0}, count={1}, speed={2})".format(self.position, self.count, self.speed)
+
+    def __len__(self):
+        return self.m_events.size()
+
+    cdef double log_time(self):
+        # the position in the log, in microseconds
+        if self.m_speed > 0 and self.m_started:
+            return self.m_base + self.m_clock.getElapsedTime().asMicroseconds() * self.m_speed
+        elif self.m_next > 0:
+            return self.m_events[self.m_next - 1].time
+        else:
+            return 0
+
+    cdef bint next_event(self, sf.Event *event):
+        cdef LoggedEvent *entry
+
+        if self.m_next >= self.m_events.size():
+            return False
+
+        entry = &self.m_events[self.m_next]
+
+        if self.m_speed > 0:
+            if not self.m_started:
+                self.m_base = self.log_time()
+                self.m_clock.restart()
+                self.m_started = True
+
+            if entry.time > self.log_time():
+                return False
+        elif entry.poll > self.m_poll:
+            return False
+
+        record_to_event(&entry.record, event)
+        self.m_next += 1
+        return True
+
+    cdef void end_poll(self):
+        if self.m_file is not None:
+            self.m_poll += 1
+
+    cdef bint wait_next_event(self, sf.Event *event):
+        cdef sf.Time interval = sf.milliseconds(1)
+
+        while not self.next_event(event):
+            if self.m_next >= self.m_events.size():
+                return False
+
+            if self.m_speed > 0:
+                with nogil:
+                    sf.sleep(interval)
+            else:
+                self.end_poll()
+
+        return True
+
+    def restart(self):
+        """ Rewind to the first event. """
+        self.m_next = 0
+        self.m_poll = 0
+        self.m_base = 0
+        self.m_started = False
+
+    property events:
+        def __get__(self):
+            return EventReplay.events_generator(self)
+
+    def events_generator(replay):
+        cdef sf.Event  event
+        cdef sf.Event* p
+
+        while replay.next_event(&event):
+            p = new sf.Event()
+            p[0] = event
+            yield wrap_event(p)
+
+        replay.end_poll()
+
+    def poll_events(self, EventBatch batch=None):
+        cdef sf.Event event
+
+        if batch is None:
+            batch = EventBatch()
+        else:
+            batch.clear()
+
+        while self.next_event(&event):
+            batch.push(&event)
+
+        self.end_poll()
+        return batch
+
+    def poll_event(self):
+        cdef sf.Event *p = new sf.Event()
+
+        if self.next_event(p):
+            return wrap_event(p)
+
+        del p
+        self.end_poll()
+
+    def wait_event(self):
+        """ Return the next event, waiting for it to be due, or None once
+        the replay is finished. """
+        cdef sf.Event *p = new sf.Event()
+
+        if self.wait_next_event(p):
+            return wrap_event(p)
+
+        del p
+
+    property speed:
+        def __get__(self):
+            return self.m_speed
+
+        def __set__(self, double speed):
+            if speed < 0:
+                raise ValueError("The speed can't be negative")
+
+            # carry on from the current position in the log
+            if self.m_started:
+                self.m_base = self.log_time()
+                self.m_clock.restart()
+
+            if speed == 0:
+                self.m_started = False
+
+                if self.m_next < self.m_events.size():
+                    self.m_poll = self.m_events[self.m_next].poll
+
+            self.m_speed = speed
+
+    property position:
+        def __get__(self):
+            return self.m_next
+
+    property count:
+        def __get__(self):
+            return self.m_events.size()
+
+    property finished:
+        def __get__(self):
+            return self.m_next >= self.m_events.size()
+
+    property duration:
+        def __get__(self):
+            cdef sf.Time* p = new sf.Time()
+
+            if not self.m_events.empty():
+                p[0] = sf.microseconds(self.m_events.back().time)
+
+            return wrap_time(p)
+
 cdef public class VideoMode[type PyVideoModeType, object PyVideoModeObject]:
     cdef sf.VideoMode *p_this
     cdef bint delete_this
@@ -844,7 +1493,9 @@ cdef ContextSettings wrap_contextsettings(sf.ContextSettings *v):
 
 
 cdef public class Window[type PyWindowType, object PyWindowObject]:
-    cdef sf.Window *p_window
+    cdef sf.Window     *p_window
+    cdef EventRecorder m_recorder
+    cdef EventReplay   m_replay
 
     def __init__(self, VideoMode mode, unicode title, Uint32 style=sf.style.Default, ContextSettings settings=ContextSettings()):
         if self.p_window == NULL:
@@ -877,6 +1528,32 @@ cdef public class Window[type PyWindowType, object PyWindowObject]:
         def __set__(self, settings):
             raise NotImplemented
 
+    cdef bint next_event(self, sf.Event *event) except -1:
+        # all the polling methods go through here, so recording and
+        # replaying covers them all; a poll ends when no event is left
+        cdef bint available
+
+        if self.m_replay is not None:
+            # the system events are still drained but dropped, to keep
+            # the replay deterministic
+            while self.p_window.pollEvent(event[0]):
+                pass
+
+            available = self.m_replay.next_event(event)
+
+            if not available:
+                self.m_replay.end_poll()
+        else:
+            available = self.p_window.pollEvent(event[0])
+
+        if self.m_recorder is not None:
+            if available:
+                self.m_recorder.record(event)
+            else:
+                self.m_recorder.end_poll()
+
+        return available
+
     property events:
         def __get__(self):
             return Window.events_generator(self)
@@ -885,24 +1562,71 @@ cdef public class Window[type PyWindowType, object PyWindowObject]:
         cdef sf.Event  event
         cdef sf.Event* p
 
-        while window.p_window.pollEvent(event):
+        while window.next_event(&event):
             p = new sf.Event()
             p[0] = event
             yield wrap_event(p)
 
 
+    def poll_events(self, EventBatch batch=None):
+        """ Drain the pending events into a batch and return it; a batch
+        given is cleared and reused, so polling doesn't allocate once it
+        has grown large enough. """
+        cdef sf.Event event
+
+        if batch is None:
+            batch = EventBatch()
+        else:
+            batch.clear()
+
+        while self.next_event(&event):
+            batch.push(&event)
+
+        return batch
+
     def poll_event(self):
         cdef sf.Event *p = new sf.Event()
 
-        if self.p_window.pollEvent(p[0]):
+        if self.next_event(p):
             return wrap_event(p)
 
+        del p
+
     def wait_event(self):
         cdef sf.Event *p = new sf.Event()
+        cdef bint available
+
+        if self.m_replay is not None:
+            available = self.m_replay.wait_next_event(p)
+        else:
+            available = self.p_window.waitEvent(p[0])
+
+        if available and self.m_recorder is not None:
+            self.m_recorder.record(p)
+            self.m_recorder.end_poll()
 
-        if self.p_window.waitEvent(p[0]):
+        if available:
             return wrap_event(p)
 
+        del p
+
+    property recorder:
+        """ An EventRecorder the polled events are written to, or None. """
+        def __get__(self):
+            return self.m_recorder
+
+        def __set__(self, EventRecorder recorder):
+            self.m_recorder = recorder
+
+    property event_source:
+        """ An EventReplay the polled events are taken from instead of
+        the system, or None. """
+        def __get__(self):
+            return self.m_replay
+
+        def __set__(self, EventReplay replay):
+            self.m_replay = replay
+
     property position:
         def __get__(self):
             return wrap_vector2i(self.p_window.getPosition())
@@ -1337,6 +2061,244 @@ cdef class Sensor:
         return Vector3(value.x, value.y, value.z)
 
 
+cdef class InputStateView:
+    # read-only export of one of the arrays of an InputState, refilled
+    # in place by each update
+    cdef array.array m_array
+    cdef char        m_format[2]
+    cdef Py_ssize_t  m_shape
+    cdef Py_ssize_t  m_strides
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        if flags & PyBUF_WRITABLE:
+            raise BufferError("The input states are read-only")
+
+        self.m_shape = len(self.m_array)
+        self.m_strides = self.m_array.ob_descr.itemsize
+
+        buffer.buf = self.m_array.data.as_chars
+        buffer.format = self.m_format if flags & PyBUF_FORMAT else NULL
+        buffer.internal = NULL
+        buffer.itemsize = self.m_strides
+        buffer.len = self.m_shape * self.m_strides
+        buffer.ndim = 1
+        buffer.obj = self
+        buffer.readonly = 1
+        buffer.shape = &self.m_shape if flags & PyBUF_ND else NULL
+        buffer.strides = &self.m_strides if flags & PyBUF_STRIDES else NULL
+        buffer.suboffsets = NULL
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        pass
+
+cdef object view_states(array.array states):
+    cdef InputStateView view = InputStateView.__new__(InputStateView)
+    view.m_array = states
+    view.m_format[0] = states.ob_descr.typecode
+    view.m_format[1] = 0
+    return memoryview(view)
+
+cdef class InputState:
+    """ A snapshot of the keyboard, the mouse and the joysticks, taken in
+    a single call instead of a query per key, button and axis.
+
+    Example::
+
+        state = sf.InputState()
+
+        while window.is_open:
+            ...
+            state.update(window)
+
+            if state.is_key_pressed(sf.Keyboard.SPACE):
+                ...
+            for key in state.pressed_keys():
+                ...
+
+    The states are kept in arrays allocated once and refilled in place,
+    with one byte per key or button and one float per axis; joystick
+    buttons and axes are indexed by
+    joystick * JOYSTICK_BUTTON_COUNT + button and
+    joystick * JOYSTICK_AXIS_COUNT + axis. The array properties are
+    read-only memoryviews of these arrays, so they follow the updates
+    without being copied. The keyboard and mouse states of the previous
+    update are kept too, for the pressed/released helpers. """
+    KEY_COUNT = sf.keyboard.KeyCount
+    BUTTON_COUNT = sf.mouse.ButtonCount
+    JOYSTICK_COUNT = sf.joystick.Count
+    JOYSTICK_BUTTON_COUNT = sf.joystick.ButtonCount
+    JOYSTICK_AXIS_COUNT = sf.joystick.AxisCount
+
+    cdef array.array m_keys
+    cdef array.array m_previous_keys
+    cdef array.array m_buttons
+    cdef array.array m_previous_buttons
+    cdef sf.Vector2i m_mouse_position
+    cdef array.array m_connected
+    cdef array.array m_joystick_buttons
+    cdef array.array m_joystick_axes
+    cdef Uint64      m_updates
+
+    def __init__(self):
+        self.m_keys = array.clone(array.array('B'), sf.keyboard.KeyCount, True)
+        self.m_previous_keys = array.clone(self.m_keys, sf.keyboard.KeyCount, True)
+        self.m_buttons = array.clone(self.m_keys, sf.mouse.ButtonCount, True)
+        self.m_previous_buttons = array.clone(self.m_keys, sf.mouse.ButtonCount, True)
+        self.m_connected = array.clone(self.m_keys, sf.joystick.Count, True)
+        self.m_joystick_buttons = array.clone(self.m_keys, sf.joystick.Count * sf.joystick.ButtonCount, True)
+        self.m_joystick_axes = array.clone(array.array('f'), sf.joystick.Count * sf.joystick.AxisCount, True)
+
+    def __repr__(self):
+        return "InputState(keys={0}, buttons={1}, mouse_position={2})".format(
+            [key for key, pressed in enumerate(self.m_keys) if pressed],
+            [button for button, pressed in enumerate(self.m_buttons) if pressed],
+            self.mouse_position)
+
+    def update(self, Window window=None, bint joysticks=True):
+        """ Take a new snapshot. The mouse position is relative to the
+        window given, or to the desktop. Joysticks are refreshed with
+        Joystick.update() first and can be left out with
+        `joysticks=False`. """
+        cdef unsigned char *keys = self.m_keys.data.as_uchars
+        cdef unsigned char *buttons = self.m_buttons.data.as_uchars
+        cdef unsigned char *connected = self.m_connected.data.as_uchars
+        cdef unsigned char *joystick_buttons = self.m_joystick_buttons.data.as_uchars
+        cdef float *axes = self.m_joystick_axes.data.as_floats
+        cdef unsigned int i, j, count
+
+        memcpy(self.m_previous_keys.data.as_uchars, keys, sf.keyboard.KeyCount)
+        memcpy(self.m_previous_buttons.data.as_uchars, buttons, sf.mouse.ButtonCount)
+
+        for i in range(sf.keyboard.KeyCount):
+            keys[i] = sf.keyboard.isKeyPressed(<sf.keyboard.Key>i)
+
+        for i in range(sf.mouse.ButtonCount):
+            buttons[i] = sf.mouse.isButtonPressed(<sf.mouse.Button>i)
+
+        if window is None:
+            self.m_mouse_position = sf.mouse.getPosition()
+        else:
+            self.m_mouse_position = sf.mouse.getPosition(window.p_window[0])
+
+        if joysticks:
+            sf.joystick.update()
+
+            for i in range(sf.joystick.Count):
+                connected[i] = sf.joystick.isConnected(i)
+                count = sf.joystick.getButtonCount(i) if connected[i] else 0
+
+                for j in range(sf.joystick.ButtonCount):
+                    joystick_buttons[i * sf.joystick.ButtonCount + j] = j < count and sf.joystick.isButtonPressed(i, j)
+
+                for j in range(sf.joystick.AxisCount):
+                    axes[i * sf.joystick.AxisCount + j] = sf.joystick.getAxisPosition(i, <sf.joystick.Axis>j) if connected[i] else 0
+
+        self.m_updates += 1
+
+    cdef list diff_keys(self, bint down, bint up):
+        cdef unsigned char *keys = self.m_keys.data.as_uchars
+        cdef unsigned char *previous = self.m_previous_keys.data.as_uchars
+        cdef list changed = []
+        cdef unsigned int i
+
+        for i in range(sf.keyboard.KeyCount):
+            if keys[i] != previous[i] and ((down and keys[i]) or (up and not keys[i])):
+                changed.append(i)
+
+        return changed
+
+    def changed_keys(self):
+        """ Return the keys pressed or released since the previous update. """
+        return self.diff_keys(True, True)
+
+    def pressed_keys(self):
+        """ Return the keys pressed since the previous update. """
+        return self.diff_keys(True, False)
+
+    def released_keys(self):
+        """ Return the keys released since the previous update. """
+        return self.diff_keys(False, True)
+
+    def is_key_pressed(self, unsigned int key):
+        if key >= sf.keyboard.KeyCount:
+            raise IndexError("Invalid key")
+
+        return <bint>self.m_keys.data.as_uchars[key]
+
+    def was_key_pressed(self, unsigned int key):
+        """ Return whether the key was down at the previous update. """
+        if key >= sf.keyboard.KeyCount:
+            raise IndexError("Invalid key")
+
+        return <bint>self.m_previous_keys.data.as_uchars[key]
+
+    def is_button_pressed(self, unsigned int button):
+        if button >= sf.mouse.ButtonCount:
+            raise IndexError("Invalid mouse button")
+
+        return <bint>self.m_buttons.data.as_uchars[button]
+
+    def was_button_pressed(self, unsigned int button):
+        if button >= sf.mouse.ButtonCount:
+            raise IndexError("Invalid mouse button")
+
+        return <bint>self.m_previous_buttons.data.as_uchars[button]
+
+    def is_joystick_connected(self, unsigned int joystick):
+        if joystick >= sf.joystick.Count:
+            raise IndexError("Invalid joystick")
+
+        return <bint>self.m_connected.data.as_uchars[joystick]
+
+    def is_joystick_button_pressed(self, unsigned int joystick, unsigned int button):
+        if joystick >= sf.joystick.Count or button >= sf.joystick.ButtonCount:
+            raise IndexError("Invalid joystick or button")
+
+        return <bint>self.m_joystick_buttons.data.as_uchars[joystick * sf.joystick.ButtonCount + button]
+
+    def get_axis_position(self, unsigned int joystick, unsigned int axis):
+        if joystick >= sf.joystick.Count or axis >= sf.joystick.AxisCount:
+            raise IndexError("Invalid joystick or axis")
+
+        return self.m_joystick_axes.data.as_floats[joystick * sf.joystick.AxisCount + axis]
+
+    property keys:
+        def __get__(self):
+            return view_states(self.m_keys)
+
+    property previous_keys:
+        def __get__(self):
+            return view_states(self.m_previous_keys)
+
+    property buttons:
+        def __get__(self):
+            return view_states(self.m_buttons)
+
+    property previous_buttons:
+        def __get__(self):
+            return view_states(self.m_previous_buttons)
+
+    property mouse_position:
+        def __get__(self):
+            return wrap_vector2i(self.m_mouse_position)
+
+    property joysticks_connected:
+        def __get__(self):
+            return view_states(self.m_connected)
+
+    property joystick_buttons:
+        def __get__(self):
+            return view_states(self.m_joystick_buttons)
+
+    property joystick_axes:
+        def __get__(self):
+            return view_states(self.m_joystick_axes)
+
+    property updates:
+        def __get__(self):
+            return self.m_updates
+
+
 cdef class Context:
     cdef sf.Context *p_this
 